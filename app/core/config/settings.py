@@ -14,22 +14,146 @@ class Settings(BaseSettings):
     app_version: str = "0.1.0"
     debug: bool = False
 
+    # Logging
+    log_format: str = "json"  # json | text
+    log_queue_size: int = 10000  # records beyond this are dropped, not blocked on
+    # Per-logger sampling (fraction kept) and rate limits (records/second);
+    # WARNING and above always pass
+    log_sample_rates: dict[str, float] = {}
+    log_rate_limits: dict[str, float] = {
+        "lendcommunity.landing.cache": 20.0,
+        "lendcommunity.rate_limit": 1.0,
+    }
+
     # Database
     database_url: str = "sqlite:///./lendcommunity.db"
     db_echo: bool = False
 
+    # Locales: request locales resolve to one of these (cache keys stay bounded)
+    supported_locales: list[str] = ["en-US"]
+    default_locale: str = "en-US"
+    locale_memo_size: int = 1024  # requested spellings remembered per worker
+
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:8000"]
 
     # Cache
     cache_ttl_seconds: int = 60
+    cache_payload_serializer: str = "msgpack"  # json | msgpack
+    cache_payload_compression: str = "zlib"  # none | zlib | zstd
+    cache_payload_compression_level: int = 6
+    response_variant_cache_size: int = 256
+    fragment_cache_size: int = 512  # page sections (hero, teaser, ...) per worker
+    assembly_batch_workers: int = 4  # locales assembled concurrently by batch requests
+    cache_backend: str = "sqlite"  # sqlite | redis | shm
+    cache_redis_url: str = "redis://localhost:6379/0"
+    cache_redis_prefix: str = "lendcommunity:landing:page"
+    cache_shm_path: Optional[str] = None  # defaults to /dev/shm/lendcommunity-landing-cache
+    cache_shm_slots: int = 1024
+    cache_shm_slot_size: int = 65536
+    # Take revision tokens from cms.published / discovery.ranking_changed
+    # events instead of probing CMS and Discovery on every request
+    cache_event_driven: bool = False
+    # Pushed tokens are re-probed after this, bounding staleness in workers
+    # that missed an event; keep it near the page's max-age
+    cache_event_reprobe_seconds: int = 60
+    cache_event_driven_ttl_seconds: int = 3600  # cache entry TTL, a safety net only
+    cache_rebuild_on_event: bool = True
+    # Background janitor for landing_assembly_cache
+    cache_janitor_enabled: bool = True
+    cache_janitor_interval_seconds: int = 300
+    cache_janitor_batch_size: int = 500
+    cache_janitor_max_batches: int = 50
+    cache_max_rows: int = 10000
+    cache_max_bytes: int = 256 * 1024 * 1024
+
+    # CDN mode: page bodies are session-independent (gating comes from
+    # /landing/v1/exit-intent or /landing/v1/session) and sent with
+    # shared-cache directives and surrogate keys
+    cdn_mode: bool = False
+    cdn_s_maxage_seconds: int = 300
+    cdn_stale_while_revalidate_seconds: int = 60
+    cdn_stale_if_error_seconds: int = 86400
+
+    # Static snapshots: session-independent page files per locale, published
+    # ahead of time (python -m app.modules.landing.cli publish-snapshots) and
+    # served from disk by /landing/v1/page when one matches the current etag
+    snapshot_enabled: bool = False
+    snapshot_dir: Optional[str] = None  # defaults to <base_dir>/var/landing-snapshots
+    snapshot_locales: list[str] = []  # published when no --locale is given; [] = all supported
+    snapshot_workers: int = 4
+    snapshot_keep: int = 3  # etags kept per locale; older files are pruned
+
+    # Discovery
+    discovery_top_k: int = 50  # ranking head kept sorted; larger limits fall back to a scan
+    # Teaser score weights: funded, raised, recency, locale (affinity with the request locale)
+    discovery_score_weights: dict[str, float] = {
+        "funded": 0.5,
+        "raised": 0.2,
+        "recency": 0.2,
+        "locale": 0.1,
+    }
+    discovery_recency_half_life_days: float = 14.0
+    discovery_rescore_interval_seconds: int = 300  # recency is bucketed so scores stay stable
+
+    # Gating
+    gating_decision_ttl_seconds: int = 30  # remote decisions only; local rules are not cached
+    gating_decision_cache_size: int = 10000  # sessions
 
     # Rate limiting
     rate_limit_enabled: bool = True
-    rate_limit_per_minute: int = 60
+    # Per session, for paths not in rate_limit_routes (it used to be the general
+    # limit for every path); 0 leaves them unlimited, as page reads are cacheable
+    # and served to whole proxies from one IP
+    rate_limit_per_minute: int = 0
+    rate_limit_burst: int = 10
+    # Limited paths (requests/minute per session); 0 disables limiting for the path
+    rate_limit_routes: dict[str, int] = {
+        "/landing/v1/join": 10,
+        "/landing/v1/cta-click": 120,
+        "/landing/v1/events": 60,
+        "/health": 0,
+        "/landing/v1/health": 0,
+        "/metrics": 0,
+    }
+    # Per-IP limit is this multiple of the per-session one (shared NATs)
+    rate_limit_ip_multiplier: int = 5
+    # Behind a load balancer or CDN every request comes from the proxy's IP,
+    # so all clients would share one IP bucket. Enable only when the proxy
+    # sets X-Forwarded-For (client first) and the app is not reachable
+    # directly, otherwise clients can spoof the header.
+    rate_limit_trust_forwarded_for: bool = False
+    rate_limit_backend: str = "memory"  # memory | redis
+    rate_limit_redis_url: str = "redis://localhost:6379/0"
+    rate_limit_max_keys: int = 100_000
 
     # Analytics
     analytics_enabled: bool = True
+    analytics_batch_max_events: int = 200  # per POST /landing/v1/events; extra events are rejected
+    analytics_batch_max_bytes: int = 65536  # sendBeacon payloads are capped at 64 KiB by browsers
+    # landing.* events are counted in-process and upserted as rollup rows
+    analytics_rollup_enabled: bool = True
+    analytics_rollup_bucket_seconds: int = 60
+    analytics_rollup_flush_interval_seconds: int = 10
+    # Client-reported placements kept as rollup dimensions; others count as "other"
+    analytics_rollup_placements: list[str] = [
+        "hero.primary",
+        "hero.secondary",
+        "exit_intent",
+        "teaser_mask",
+        "founder_cta",
+    ]
+    # Served page etags accepted from clients; older or unknown ones count as "other"
+    analytics_rollup_known_etags: int = 1024
+    # Unique-session reach: one HyperLogLog (2**precision bytes) per bucket/event/locale/etag
+    analytics_reach_bucket_seconds: int = 3600
+    analytics_reach_precision: int = 12  # ~1.6% standard error
+
+    # Admin / diagnostics
+    admin_token: Optional[str] = None  # /admin endpoints are disabled when unset
+    profiler_interval_ms: int = 5
+    profiler_max_duration_seconds: int = 300
+    email_export_batch_size: int = 1000  # rows per keyset page of email exports
 
     # Paths
     @property
@@ -1,5 +1,15 @@
 """Database connection and session management."""
-from .connection import get_db, init_db, close_db
+from .connection import get_db, init_db, close_db, register_pool_metrics
 from .session import SessionLocal, engine
+from .statement_timer import SQLStatementTimer, get_statement_timer
 
-__all__ = ["get_db", "init_db", "close_db", "SessionLocal", "engine"]
+__all__ = [
+    "get_db",
+    "init_db",
+    "close_db",
+    "register_pool_metrics",
+    "SessionLocal",
+    "engine",
+    "SQLStatementTimer",
+    "get_statement_timer",
+]
@@ -1,8 +1,10 @@
 """Database connection utilities."""
-from typing import Generator
+from typing import Dict, Generator, Tuple
 
 from sqlalchemy.orm import Session
 
+from app.core.telemetry import get_metrics_registry
+
 from .session import SessionLocal, engine, Base
 
 
@@ -23,3 +25,29 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def _pool_stats() -> Dict[Tuple[str, ...], float]:
+    """Connection counts from the engine pool (QueuePool-style pools only)."""
+    pool = engine.pool
+    stats = {}
+    for state, method in (
+        ("size", "size"),
+        ("checked_out", "checkedout"),
+        ("checked_in", "checkedin"),
+        ("overflow", "overflow"),
+    ):
+        getter = getattr(pool, method, None)
+        if getter is not None:
+            stats[(state,)] = getter()
+    return stats
+
+
+def register_pool_metrics() -> None:
+    """Expose engine pool stats as a scrape-time gauge."""
+    get_metrics_registry().register_callback(
+        "db_pool_connections",
+        "Database pool connections by state",
+        _pool_stats,
+        labelnames=("state",),
+    )
@@ -0,0 +1,112 @@
+"""Per-statement SQL timing, toggled at runtime.
+
+A structured alternative to ``db_echo``: aggregates count, total and max
+duration per statement text instead of logging every execution. Engine
+event listeners are attached only while timing is enabled, so there is no
+cost when it is off.
+"""
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .session import engine as default_engine
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class _StatementStats:
+    """Aggregated timings for one statement."""
+
+    __slots__ = ("count", "total_seconds", "max_seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+
+class SQLStatementTimer:
+    """Collects per-statement counts and durations for an engine."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.enabled = False
+        self._stats: Dict[str, _StatementStats] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def enable(self, duration_seconds: Optional[float] = None) -> None:
+        """Start timing, optionally switching off again after a duration."""
+        with self._lock:
+            if not self.enabled:
+                event.listen(self.engine, "before_cursor_execute", self._before)
+                event.listen(self.engine, "after_cursor_execute", self._after)
+                self.enabled = True
+            self._cancel_timer()
+            if duration_seconds:
+                self._timer = threading.Timer(duration_seconds, self.disable)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def disable(self) -> None:
+        """Stop timing; collected stats are kept until reset."""
+        with self._lock:
+            self._cancel_timer()
+            if self.enabled:
+                event.remove(self.engine, "before_cursor_execute", self._before)
+                event.remove(self.engine, "after_cursor_execute", self._after)
+                self.enabled = False
+
+    def reset(self) -> None:
+        """Drop collected stats."""
+        self._stats = {}
+
+    def _cancel_timer(self) -> None:
+        if self._timer and self._timer is not threading.current_thread():
+            self._timer.cancel()
+        self._timer = None
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("statement_timer_start", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        starts = conn.info.get("statement_timer_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+
+        stats = self._stats.get(statement)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(statement, _StatementStats())
+        stats.count += 1
+        stats.total_seconds += elapsed
+        if elapsed > stats.max_seconds:
+            stats.max_seconds = elapsed
+
+    def report(self, limit: int = 50) -> List[dict]:
+        """Statements ordered by total time spent."""
+        rows = [
+            {
+                "statement": _WHITESPACE.sub(" ", statement).strip(),
+                "count": stats.count,
+                "total_ms": round(stats.total_seconds * 1000, 3),
+                "mean_ms": round(stats.total_seconds * 1000 / stats.count, 3),
+                "max_ms": round(stats.max_seconds * 1000, 3),
+            }
+            for statement, stats in list(self._stats.items())
+            if stats.count
+        ]
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows[:limit]
+
+
+@lru_cache
+def get_statement_timer() -> SQLStatementTimer:
+    """Get singleton statement timer for the application engine."""
+    return SQLStatementTimer(default_engine)
@@ -1,5 +1,5 @@
 """Event dispatcher implementation."""
-from typing import Callable, Dict, List
+from typing import Callable, Dict, Iterable, List
 from functools import lru_cache
 
 from .contracts import Event
@@ -7,31 +7,61 @@ from app.core.telemetry import logger
 
 
 class EventDispatcher:
-    """Simple in-memory event dispatcher."""
+    """Simple in-memory event dispatcher.
+
+    Handlers subscribe to an exact event type or to a prefix pattern ending
+    in ``*`` (``landing.*``). Matches are resolved once per event type.
+    """
 
     def __init__(self):
         self._handlers: Dict[str, List[Callable]] = {}
+        self._resolved: Dict[str, List[Callable]] = {}
 
     def register(self, event_type: str, handler: Callable) -> None:
-        """Register an event handler."""
+        """Register an event handler (registering the same handler twice is a no-op)."""
         if event_type not in self._handlers:
             self._handlers[event_type] = []
+        if handler in self._handlers[event_type]:
+            return
         self._handlers[event_type].append(handler)
-        logger.debug(f"Registered handler for event type: {event_type}")
+        self._resolved.clear()
+        logger.debug("Registered handler for event type: %s", event_type)
+
+    def _handlers_for(self, event_type: str) -> List[Callable]:
+        """Exact handlers, then pattern handlers, for an event type."""
+        handlers = self._resolved.get(event_type)
+        if handlers is None:
+            handlers = list(self._handlers.get(event_type, []))
+            for pattern, pattern_handlers in self._handlers.items():
+                if pattern.endswith("*") and event_type.startswith(pattern[:-1]):
+                    handlers.extend(h for h in pattern_handlers if h not in handlers)
+            self._resolved[event_type] = handlers
+        return handlers
 
     def emit(self, event: Event) -> None:
         """Emit an event to all registered handlers."""
-        handlers = self._handlers.get(event.event_type, [])
+        handlers = self._handlers_for(event.event_type)
 
         if not handlers:
-            logger.debug(f"No handlers registered for event type: {event.event_type}")
+            logger.debug("No handlers registered for event type: %s", event.event_type)
             return
 
         for handler in handlers:
             try:
                 handler(event)
             except Exception as e:
-                logger.error(f"Error in event handler for {event.event_type}: {e}", exc_info=e)
+                logger.error("Error in event handler for %s: %s", event.event_type, e, exc_info=e)
+
+    def emit_many(self, events: Iterable[Event]) -> None:
+        """Emit a batch of events in order (no per-event debug logging)."""
+        for event in events:
+            for handler in self._handlers_for(event.event_type):
+                try:
+                    handler(event)
+                except Exception as e:
+                    logger.error(
+                        "Error in event handler for %s: %s", event.event_type, e, exc_info=e
+                    )
 
     def clear_handlers(self, event_type: str = None) -> None:
         """Clear handlers for a specific event type or all handlers."""
@@ -39,6 +69,7 @@ class EventDispatcher:
             self._handlers.pop(event_type, None)
         else:
             self._handlers.clear()
+        self._resolved.clear()
 
 
 @lru_cache
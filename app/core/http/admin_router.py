@@ -0,0 +1,97 @@
+"""Admin diagnostics HTTP router (profiler and SQL timing)."""
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+from app.core.config import get_settings
+from app.core.db import get_statement_timer
+from app.core.security import require_admin
+from app.core.telemetry import get_profiler
+
+router = APIRouter(prefix="/admin/v1", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+class ProfilerStartRequest(BaseModel):
+    """Profiling window parameters."""
+
+    duration_seconds: float = Field(30, gt=0)
+    route_prefix: Optional[str] = None  # e.g. /landing/v1/page; None samples every thread
+    sample_rate: float = Field(1.0, gt=0, le=1)
+    interval_ms: Optional[float] = Field(None, ge=1, le=1000)
+
+
+class SQLTimingStartRequest(BaseModel):
+    """SQL timing window parameters."""
+
+    duration_seconds: Optional[float] = Field(None, gt=0)
+    reset: bool = True
+
+
+class SQLStatementStats(BaseModel):
+    """Aggregated timings for one SQL statement."""
+
+    statement: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+
+
+@router.post("/profiler/start")
+async def start_profiler(request: ProfilerStartRequest):
+    """Start sampling for a bounded window."""
+    duration = min(request.duration_seconds, get_settings().profiler_max_duration_seconds)
+    profiler = get_profiler()
+    profiler.start(
+        duration_seconds=duration,
+        route_prefix=request.route_prefix,
+        sample_rate=request.sample_rate,
+        interval_seconds=request.interval_ms / 1000 if request.interval_ms else None,
+    )
+    return profiler.status()
+
+
+@router.post("/profiler/stop")
+async def stop_profiler():
+    """Stop sampling early; stacks stay available."""
+    profiler = get_profiler()
+    profiler.stop()
+    return profiler.status()
+
+
+@router.get("/profiler")
+async def profiler_status():
+    """Profiler window and collection summary."""
+    return get_profiler().status()
+
+
+@router.get("/profiler/stacks", response_class=PlainTextResponse)
+async def profiler_stacks():
+    """Collected stacks in collapsed format (pipe into flamegraph.pl or speedscope)."""
+    return PlainTextResponse(get_profiler().collapsed())
+
+
+@router.post("/sql-timing/start")
+async def start_sql_timing(request: SQLTimingStartRequest):
+    """Attach per-statement timing listeners."""
+    timer = get_statement_timer()
+    if request.reset:
+        timer.reset()
+    timer.enable(request.duration_seconds)
+    return {"enabled": timer.enabled}
+
+
+@router.post("/sql-timing/stop")
+async def stop_sql_timing():
+    """Detach per-statement timing listeners."""
+    timer = get_statement_timer()
+    timer.disable()
+    return {"enabled": timer.enabled}
+
+
+@router.get("/sql-timing", response_model=List[SQLStatementStats])
+async def sql_timing_report(limit: int = 50):
+    """Statements ordered by total time spent."""
+    return get_statement_timer().report(limit)
@@ -6,6 +6,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 from app.core.config import get_settings
 from app.core.http.error_handlers import register_error_handlers
 from app.core.http.middleware import add_middleware
+from app.core.http.rate_limit import RateLimitMiddleware
 
 
 def create_app() -> FastAPI:
@@ -18,6 +19,11 @@ def create_app() -> FastAPI:
         debug=settings.debug,
     )
 
+    # Rate limiting; added first so it sits inside CORS (429s carry CORS
+    # headers) but still runs before routing and DB sessions
+    if settings.rate_limit_enabled:
+        app.add_middleware(RateLimitMiddleware)
+
     # Add CORS
     app.add_middleware(
         CORSMiddleware,
@@ -0,0 +1,71 @@
+"""Precompressed response helpers.
+
+Used for payloads that are identical across many requests, so compression
+happens once instead of per request in ``GZipMiddleware``. Responses that
+already carry ``Content-Encoding`` are passed through by the middleware.
+"""
+import gzip
+from typing import Dict, Iterable, Optional
+
+try:  # Optional: brotli is only used when installed
+    import brotli
+except ImportError:  # pragma: no cover - depends on installed extras
+    brotli = None
+
+IDENTITY = "identity"
+
+# Server-side preference when the client weights encodings equally
+ENCODING_PREFERENCE = ("br", "gzip", IDENTITY)
+
+
+def compress_variants(
+    body: bytes, minimum_size: int = 1000, gzip_level: int = 9, brotli_quality: int = 11
+) -> Dict[str, bytes]:
+    """Build identity, gzip and (if available) brotli variants of a body."""
+    variants = {IDENTITY: body}
+    if len(body) < minimum_size:
+        return variants
+
+    # mtime=0 keeps the gzip bytes stable for a given body
+    variants["gzip"] = gzip.compress(body, compresslevel=gzip_level, mtime=0)
+    if brotli is not None:
+        variants["br"] = brotli.compress(body, quality=brotli_quality)
+    return variants
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: qvalue}."""
+    weights: Dict[str, float] = {}
+    if not header:
+        return weights
+
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+    return weights
+
+
+def select_encoding(header: Optional[str], available: Iterable[str]) -> str:
+    """Pick the best available content coding for an Accept-Encoding header."""
+    weights = parse_accept_encoding(header)
+    wildcard = weights.get("*")
+
+    best = IDENTITY
+    best_q = 0.0
+    for coding in ENCODING_PREFERENCE:
+        if coding not in available or coding == IDENTITY:
+            continue
+        q = weights.get(coding, wildcard if wildcard is not None else 0.0)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
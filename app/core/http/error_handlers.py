@@ -29,13 +29,27 @@ class BadRequestException(AppException):
         super().__init__(message, status.HTTP_400_BAD_REQUEST)
 
 
+class ForbiddenException(AppException):
+    """Forbidden exception."""
+
+    def __init__(self, message: str = "Forbidden"):
+        super().__init__(message, status.HTTP_403_FORBIDDEN)
+
+
+class PayloadTooLargeException(AppException):
+    """Request body too large exception."""
+
+    def __init__(self, message: str = "Payload too large"):
+        super().__init__(message, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+
 def register_error_handlers(app: FastAPI) -> None:
     """Register global error handlers."""
 
     @app.exception_handler(AppException)
     async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
         """Handle application exceptions."""
-        logger.error(f"Application error: {exc.message}", exc_info=exc)
+        logger.error("Application error: %s", exc.message, exc_info=exc)
         return JSONResponse(
             status_code=exc.status_code,
             content={
@@ -48,7 +62,7 @@ def register_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(ValidationError)
     async def validation_exception_handler(request: Request, exc: ValidationError) -> JSONResponse:
         """Handle Pydantic validation errors."""
-        logger.warning(f"Validation error: {exc}")
+        logger.warning("Validation error: %s", exc)
         return JSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
@@ -61,7 +75,7 @@ def register_error_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
         """Handle all other exceptions."""
-        logger.error(f"Unhandled error: {exc}", exc_info=exc)
+        logger.error("Unhandled error: %s", exc, exc_info=exc)
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
@@ -0,0 +1,36 @@
+"""ETag formatting and conditional request helpers."""
+from typing import Optional
+
+
+def quote_etag(etag: str, weak: bool = False) -> str:
+    """Format an opaque tag as an ETag header value."""
+    value = f'"{etag}"'
+    return f"W/{value}" if weak else value
+
+
+def _opaque_tag(value: str) -> str:
+    """Strip weak prefix and quotes from an entity tag."""
+    value = value.strip()
+    if value[:2] in ("W/", "w/"):
+        value = value[2:]
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        value = value[1:-1]
+    return value
+
+
+def if_none_match_matches(header: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against a current etag.
+
+    Uses weak comparison (RFC 9110 13.1.2): ``W/"x"`` matches ``"x"``.
+    Accepts ``*``, comma-separated lists and unquoted legacy values.
+    """
+    if not header:
+        return False
+
+    current = _opaque_tag(etag)
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or (candidate and _opaque_tag(candidate) == current):
+            return True
+    return False
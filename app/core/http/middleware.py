@@ -1,53 +1,142 @@
-"""Custom middleware."""
+"""Custom middleware.
+
+Implemented as plain ASGI callables rather than ``BaseHTTPMiddleware``: no
+extra task per request, no response re-wrapping, and streaming responses
+pass through untouched. Headers are injected on ``http.response.start``.
+"""
 import time
 import uuid
-from typing import Callable
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.core.telemetry import logger
+from app.core.telemetry import get_logger, get_metrics_registry, get_profiler, profiled_request
 
+_REQUEST_ID_HEADER = b"x-request-id"
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Add request ID to all requests."""
+access_logger = get_logger("access")
+
+_request_duration = get_metrics_registry().histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, method and status",
+    labelnames=("route", "method", "status"),
+)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        request.state.request_id = request_id
 
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
+_HTTP_METHODS = frozenset(
+    ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "CONNECT", "TRACE")
+)
 
-        return response
 
+def _method_label(scope: Scope) -> str:
+    """Request method, or "other" for non-standard verbs (clients choose them freely)."""
+    method = scope["method"]
+    return method if method in _HTTP_METHODS else "other"
 
-class TimingMiddleware(BaseHTTPMiddleware):
-    """Log request timing."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+def _route_template(scope: Scope) -> str:
+    """Matched route template (e.g. /landing/v1/page), never the raw path."""
+    route = scope.get("route")
+    # Unmatched paths share one label so scanners cannot explode cardinality
+    return getattr(route, "path", None) or "unmatched"
 
-        response = await call_next(request)
 
-        process_time = time.time() - start_time
-        response.headers["X-Process-Time"] = str(process_time)
+def _get_header(scope: Scope, name: bytes) -> bytes:
+    """Get a raw request header value (names are lowercase in ASGI)."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return b""
 
-        logger.info(
-            f"{request.method} {request.url.path}",
-            extra={
-                "request_id": getattr(request.state, "request_id", None),
-                "method": request.method,
-                "path": request.url.path,
-                "status_code": response.status_code,
-                "duration_ms": round(process_time * 1000, 2),
-            },
-        )
 
-        return response
+class RequestIDMiddleware:
+    """Add request ID to all requests."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        raw_id = _get_header(scope, _REQUEST_ID_HEADER) or str(uuid.uuid4()).encode("latin-1")
+        # Exposed as request.state.request_id
+        scope.setdefault("state", {})["request_id"] = raw_id.decode("latin-1")
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), (_REQUEST_ID_HEADER, raw_id)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+class TimingMiddleware:
+    """Log request timing and record the latency histogram."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Time to response start, in seconds (as before)
+                process_time = (time.perf_counter_ns() - start_ns) / 1e9
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-process-time", str(process_time).encode("latin-1")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            _request_duration.labels(
+                _route_template(scope), _method_label(scope), str(status_code)
+            ).observe(elapsed_ns / 1e9)
+            duration_ms = round(elapsed_ns / 1e6, 2)
+            access_logger.info(
+                "%s %s",
+                scope["method"],
+                scope["path"],
+                extra={
+                    "request_id": scope.get("state", {}).get("request_id"),
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status_code": status_code,
+                    "duration_ms": duration_ms,
+                },
+            )
+
+
+class ProfilerMiddleware:
+    """Route selected requests through the sampling profiler's marker frame."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.profiler = get_profiler()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Single attribute check while profiling is off
+        if self.profiler.active and scope["type"] == "http" and self.profiler.select(scope["path"]):
+            await profiled_request(self.app, scope, receive, send)
+            return
+        await self.app(scope, receive, send)
 
 
 def add_middleware(app: FastAPI) -> None:
     """Add custom middleware to the app."""
+    app.add_middleware(ProfilerMiddleware)
     app.add_middleware(RequestIDMiddleware)
     app.add_middleware(TimingMiddleware)
@@ -0,0 +1,304 @@
+"""Rate limiting middleware (GCRA).
+
+Each bucket is a single float, its theoretical arrival time (TAT), so a
+check is O(1) with no timers or token refills. Requests are limited per
+session (``X-Session-ID``) and, with a multiplier for shared NATs, per client
+IP so rotating session IDs does not bypass the limit. Both buckets are
+checked before either is charged: a request rejected by one bucket does not
+consume the other.
+
+Only paths in ``rate_limit_routes`` are limited by default (the write
+endpoints); ``rate_limit_per_minute`` applies to every other path when set.
+
+Backends:
+
+- ``memory``: per-process ``OrderedDict`` used as an LRU, bounded by
+  ``rate_limit_max_keys``. Accessed only from the event loop thread.
+- ``redis``: one Lua script round trip per bucket, shared by all workers.
+
+The middleware runs before routing, so rejected requests never open a DB
+session.
+"""
+import json
+import math
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.core.telemetry import get_logger, get_metrics_registry, logger
+
+try:  # Optional: shared buckets across workers
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - depends on installed extras
+    redis_asyncio = None
+
+# (session interval seconds, session burst, ip interval seconds, ip burst)
+Limit = Tuple[float, int, float, int]
+# (key, interval seconds, burst)
+Bucket = Tuple[str, float, int]
+
+_rate_limited = get_metrics_registry().counter(
+    "http_rate_limited_total",
+    "Requests rejected by the rate limiter",
+    labelnames=("scope",),
+)
+_limited_session = _rate_limited.labels("session")
+_limited_ip = _rate_limited.labels("ip")
+_backend_errors = get_metrics_registry().counter(
+    "http_rate_limit_backend_errors_total",
+    "Rate limit checks that failed and let the request through",
+)
+
+# One line per failed check during an outage; rate limited via the log_rate_limits
+# setting, which only throttles below WARNING (alert on the counter instead)
+backend_logger = get_logger("rate_limit")
+
+_SESSION_HEADER = b"x-session-id"
+_FORWARDED_HEADER = b"x-forwarded-for"
+
+
+class RateLimitBackend:
+    """Bucket storage interface."""
+
+    name = "base"
+
+    async def hit(self, key: str, interval: float, burst: int) -> float:
+        """Count one request. Returns 0 if allowed, else seconds until allowed."""
+        return (await self.hit_all([(key, interval, burst)]))[0]
+
+    async def hit_all(self, buckets: Sequence[Bucket]) -> List[float]:
+        """Count one request in every bucket, or in none if any would reject.
+
+        Returns seconds until allowed per bucket (all 0 when charged).
+        """
+        raise NotImplementedError
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """In-process GCRA buckets with LRU eviction."""
+
+    name = "memory"
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+
+    def hit_now(self, key: str, interval: float, burst: int, now: float) -> float:
+        """Synchronous GCRA check at a given monotonic time."""
+        wait, new_tat = self._check(key, interval, burst, now)
+        if not wait:
+            self._charge(key, new_tat)
+        return wait
+
+    def hit_all_now(self, buckets: Sequence[Bucket], now: float) -> List[float]:
+        """Synchronous all-or-nothing check of several buckets."""
+        checks = [self._check(key, interval, burst, now) for key, interval, burst in buckets]
+        if not any(wait for wait, _ in checks):
+            for (key, _, _), (_, new_tat) in zip(buckets, checks):
+                self._charge(key, new_tat)
+        return [wait for wait, _ in checks]
+
+    def _check(self, key: str, interval: float, burst: int, now: float) -> Tuple[float, float]:
+        """(seconds until allowed, TAT after charging)."""
+        tat = self._tats.get(key)
+        if tat is None or tat < now:
+            tat = now
+        new_tat = tat + interval
+        allow_at = new_tat - interval * burst
+        return (allow_at - now if allow_at > now else 0.0), new_tat
+
+    def _charge(self, key: str, new_tat: float) -> None:
+        tats = self._tats
+        tats[key] = new_tat
+        tats.move_to_end(key)
+        if len(tats) > self.max_keys:
+            # Oldest-touched bucket; usually long since drained
+            tats.popitem(last=False)
+
+    async def hit_all(self, buckets: Sequence[Bucket]) -> List[float]:
+        """Count one request in every bucket, or in none if any would reject."""
+        return self.hit_all_now(buckets, time.monotonic())
+
+    def __len__(self) -> int:
+        return len(self._tats)
+
+
+# KEYS[i]=bucket, ARGV[2i-1]=interval, ARGV[2i]=burst. Uses server time so
+# all workers agree. Checks every bucket, sets them only if all allow, and
+# returns seconds until allowed per bucket ("0" when allowed).
+_GCRA_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local waits, tats = {}, {}
+local rejected = false
+for i, key in ipairs(KEYS) do
+  local interval = tonumber(ARGV[2 * i - 1])
+  local burst = tonumber(ARGV[2 * i])
+  local tat = tonumber(redis.call('GET', key) or now)
+  if tat < now then tat = now end
+  tats[i] = tat + interval
+  local allow_at = tats[i] - interval * burst
+  if allow_at > now then
+    waits[i] = tostring(allow_at - now)
+    rejected = true
+  else
+    waits[i] = '0'
+  end
+end
+if not rejected then
+  for i, key in ipairs(KEYS) do
+    redis.call('SET', key, tostring(tats[i]), 'PX', math.ceil((tats[i] - now) * 1000))
+  end
+end
+return waits
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """GCRA buckets in a Redis-protocol server, shared by all workers.
+
+    Accepts any asyncio client exposing ``register_script`` (redis-py's
+    ``redis.asyncio``, or a fake in tests).
+    """
+
+    name = "redis"
+
+    def __init__(self, client: Any, prefix: str = "lendcommunity:ratelimit"):
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(_GCRA_SCRIPT)
+
+    async def hit_all(self, buckets: Sequence[Bucket]) -> List[float]:
+        """Count one request in every bucket, or in none if any would reject."""
+        keys = [f"{self.prefix}:{key}" for key, _, _ in buckets]
+        args = [value for _, interval, burst in buckets for value in (interval, burst)]
+        return [float(wait) for wait in await self._script(keys=keys, args=args)]
+
+
+class RateLimitMiddleware:
+    """Reject over-limit requests with 429 before they reach a route."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: Optional[RateLimitBackend] = None,
+        per_minute: Optional[int] = None,
+        routes: Optional[Dict[str, int]] = None,
+        burst: Optional[int] = None,
+        ip_multiplier: Optional[int] = None,
+        trust_forwarded_for: Optional[bool] = None,
+    ):
+        settings = get_settings()
+        self.app = app
+        self.backend = backend if backend is not None else get_rate_limit_backend()
+        # In-process backends are checked synchronously: no coroutine per request
+        self._hit_all_now = getattr(self.backend, "hit_all_now", None)
+        self.burst = settings.rate_limit_burst if burst is None else burst
+        self.ip_multiplier = (
+            settings.rate_limit_ip_multiplier if ip_multiplier is None else ip_multiplier
+        )
+        if self.burst < 1 or self.ip_multiplier < 1:
+            raise ValueError("rate limit burst and ip_multiplier must be at least 1")
+        self.trust_forwarded_for = (
+            settings.rate_limit_trust_forwarded_for
+            if trust_forwarded_for is None
+            else trust_forwarded_for
+        )
+        self.default_limit = self._limit(
+            settings.rate_limit_per_minute if per_minute is None else per_minute
+        )
+        # Resolved once: per-request lookup is a single dict get
+        self.route_limits: Dict[str, Optional[Limit]] = {
+            path: self._limit(limit)
+            for path, limit in (routes if routes is not None else settings.rate_limit_routes).items()
+        }
+
+    def _limit(self, per_minute: int) -> Optional[Limit]:
+        """Bucket parameters for a per-minute limit; None means unlimited."""
+        if per_minute <= 0:
+            return None
+        interval = 60.0 / per_minute
+        burst = min(self.burst, per_minute)
+        return interval, burst, interval / self.ip_multiplier, burst * self.ip_multiplier
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        limit = self.route_limits.get(path, self.default_limit)
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        interval, burst, ip_interval, ip_burst = limit
+        session_id, client_ip = self._identity(scope)
+        buckets = [(f"ip:{path}:{client_ip}", ip_interval, ip_burst)]
+        if session_id:
+            buckets.append((f"s:{path}:{session_id}", interval, burst))
+
+        try:
+            if self._hit_all_now is not None:
+                waits = self._hit_all_now(buckets, time.monotonic())
+            else:
+                waits = await self.backend.hit_all(buckets)
+        except Exception as e:
+            # Fail open: an unavailable limiter must not take the routes down with it
+            _backend_errors.inc()
+            backend_logger.info("Rate limit check failed for %s, allowing request: %s", path, e)
+            await self.app(scope, receive, send)
+            return
+
+        wait = max(waits)
+        if wait:
+            session_wait = waits[1] if len(waits) > 1 else 0.0
+            (_limited_session if session_wait else _limited_ip).inc()
+            await _send_too_many_requests(send, wait)
+            return
+        await self.app(scope, receive, send)
+
+    def _identity(self, scope: Scope) -> Tuple[Optional[str], str]:
+        """(session id, client ip) from raw ASGI headers."""
+        session_id = None
+        forwarded = None
+        for name, value in scope["headers"]:
+            if name == _SESSION_HEADER:
+                session_id = value.decode("latin-1")
+            elif name == _FORWARDED_HEADER and self.trust_forwarded_for:
+                forwarded = value.decode("latin-1").split(",", 1)[0].strip()
+        client = scope.get("client")
+        return session_id, forwarded or (client[0] if client else "unknown")
+
+
+async def _send_too_many_requests(send: Send, retry_after: float) -> None:
+    """429 in the same shape as the app's JSON error responses."""
+    body = json.dumps({"ok": False, "error": "Rate limit exceeded"}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+@lru_cache
+def get_rate_limit_backend() -> RateLimitBackend:
+    """Get the configured rate limit backend (falls back to memory)."""
+    settings = get_settings()
+    if settings.rate_limit_backend == "redis":
+        if redis_asyncio is not None:
+            client = redis_asyncio.Redis.from_url(settings.rate_limit_redis_url)
+            return RedisRateLimitBackend(client)
+        logger.warning("rate_limit_backend=redis but redis is not installed; using memory")
+    return MemoryRateLimitBackend(max_keys=settings.rate_limit_max_keys)
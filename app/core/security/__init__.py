@@ -1,4 +1,5 @@
 """Security utilities."""
+from .admin import require_admin
 from .helpers import hash_email, generate_etag
 
-__all__ = ["hash_email", "generate_etag"]
+__all__ = ["hash_email", "generate_etag", "require_admin"]
@@ -0,0 +1,20 @@
+"""Admin endpoint guard."""
+import hmac
+from typing import Optional
+
+from fastapi import Header
+
+from app.core.config import get_settings
+from app.core.http.error_handlers import ForbiddenException
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None, alias="X-Admin-Token")) -> None:
+    """FastAPI dependency: require a matching X-Admin-Token header."""
+    expected = get_settings().admin_token
+    if not expected:
+        raise ForbiddenException("Admin endpoints are disabled")
+    # compare_digest only accepts ASCII str; headers can carry any latin-1 text
+    if not x_admin_token or not hmac.compare_digest(
+        x_admin_token.encode("utf-8"), expected.encode("utf-8")
+    ):
+        raise ForbiddenException("Invalid admin token")
@@ -1,4 +1,29 @@
 """Telemetry, logging, and metrics."""
-from .logging import logger, setup_logging
+from .logging import get_logger, logger, setup_logging, shutdown_logging
+from .metrics import (
+    DEFAULT_LATENCY_BUCKETS,
+    CallbackGauge,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+from .profiler import SamplingProfiler, get_profiler, profiled_request
 
-__all__ = ["logger", "setup_logging"]
+__all__ = [
+    "logger",
+    "get_logger",
+    "setup_logging",
+    "shutdown_logging",
+    "DEFAULT_LATENCY_BUCKETS",
+    "CallbackGauge",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "SamplingProfiler",
+    "get_profiler",
+    "profiled_request",
+]
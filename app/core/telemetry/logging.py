@@ -1,22 +1,173 @@
-"""Logging configuration."""
+"""Logging configuration.
+
+Request threads only build a LogRecord and put it on a bounded queue; a
+``QueueListener`` thread formats it (JSON by default) and writes stdout. If
+the queue is full, records are dropped and counted instead of blocking.
+
+High-volume loggers can be sampled or rate limited per logger name via the
+``log_sample_rates`` and ``log_rate_limits`` settings.
+"""
+import atexit
+import json
 import logging
+import queue
+import random
 import sys
-from typing import Any
+import threading
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 
 from app.core.config import get_settings
 
+from .metrics import get_metrics_registry
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+_listener: Optional[QueueListener] = None
+_stream_handler: Optional[logging.Handler] = None
+_setup_lock = threading.Lock()
+
+_dropped_records = get_metrics_registry().counter(
+    "log_records_dropped_total", "Log records dropped because the log queue was full"
+)
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line, including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """Enqueue records unformatted; drop (and count) when the queue is full."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The default prepare() formats the message on the calling thread;
+        # leave that to the listener so request threads stay cheap
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _dropped_records.inc()
+
+
+class SampleFilter(logging.Filter):
+    """Pass a fixed fraction of records."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or random.random() < self.rate
+
+
+class RateLimitFilter(logging.Filter):
+    """Token bucket: at most ``per_second`` records/s (bursts up to one second's worth)."""
+
+    def __init__(self, per_second: float):
+        super().__init__()
+        self.per_second = per_second
+        self.tokens = per_second
+        self.updated = time.monotonic()
+        self.suppressed = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        now = time.monotonic()
+        self.tokens = min(self.per_second, self.tokens + (now - self.updated) * self.per_second)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            if self.suppressed:
+                record.suppressed = self.suppressed
+                self.suppressed = 0
+            return True
+        self.suppressed += 1
+        return False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a child of the application logger (e.g. ``landing.cache``)."""
+    return logger.getChild(name)
+
 
 def setup_logging() -> None:
-    """Configure application logging."""
-    settings = get_settings()
+    """Configure application logging (idempotent)."""
+    global _listener, _stream_handler
 
+    settings = get_settings()
     level = logging.DEBUG if settings.debug else logging.INFO
 
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    with _setup_lock:
+        if _listener is not None:
+            return
+
+        if settings.log_format == "json":
+            formatter: logging.Formatter = JSONFormatter()
+        else:
+            formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+
+        log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+        queue_handler = _NonBlockingQueueHandler(log_queue)
+
+        root = logging.getLogger()
+        root.handlers = [queue_handler]
+        root.setLevel(level)
+
+        for name, rate in settings.log_sample_rates.items():
+            logging.getLogger(name).addFilter(SampleFilter(rate))
+        for name, per_second in settings.log_rate_limits.items():
+            logging.getLogger(name).addFilter(RateLimitFilter(per_second))
+
+        _stream_handler = stream_handler
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread.
+
+    Later records are written synchronously so shutdown messages are kept.
+    """
+    global _listener
+
+    with _setup_lock:
+        if _listener is None:
+            return
+        logging.getLogger().handlers = [_stream_handler]
+        _listener.stop()
+        _listener = None
 
 
 # Create application logger
@@ -0,0 +1,305 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+Hot-path cost is kept to a dict lookup plus a few integer/float updates:
+
+- Resolve label children once (``labels(...)``) and keep them in module
+  constants where the label values are static.
+- Updates take no lock. They rely on the GIL, so a concurrent increment can
+  rarely be lost; that is an accepted trade-off for telemetry. Only child
+  creation and registration lock.
+- Gauges that are expensive to compute (DB pool, queue depth) are callbacks
+  evaluated at scrape time, not on requests.
+"""
+import math
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds: 0.5ms .. 10s
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+
+class _CounterChild:
+    """Counter value for one label combination."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter."""
+        self.value += amount
+
+
+class _GaugeChild:
+    """Gauge value for one label combination."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge."""
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge."""
+        self.value -= amount
+
+
+class _HistogramChild:
+    """Bucketed observations for one label combination."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # One slot per bound plus +Inf; non-cumulative until rendered
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class _Metric:
+    """Base for labeled metrics."""
+
+    kind = "untyped"
+    _child_cls: Callable = _CounterChild
+
+    def __init__(self, name: str, description: str = "", labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    def _new_child(self):
+        return self._child_cls()
+
+    def labels(self, *values: str):
+        """Get the child for a label combination (resolve once, reuse on hot paths)."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self._children[values] = child
+        return child
+
+    def children(self) -> List[Tuple[Tuple[str, ...], object]]:
+        """Snapshot of (label values, child) pairs."""
+        return list(self._children.items())
+
+
+class Counter(_Metric):
+    """Monotonic counter, optionally split by label values."""
+
+    kind = "counter"
+    _child_cls = _CounterChild
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment an unlabeled counter."""
+        self._children[()].inc(amount)
+
+    def samples(self) -> Dict[Tuple[str, ...], float]:
+        """Snapshot of values by label combination."""
+        return {labels: child.value for labels, child in self.children()}
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+    _child_cls = _GaugeChild
+
+    def set(self, value: float) -> None:
+        """Set an unlabeled gauge."""
+        self._children[()].set(value)
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        labelnames: Tuple[str, ...] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        self.bounds = tuple(sorted(buckets))
+        super().__init__(name, description, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on an unlabeled histogram."""
+        self._children[()].observe(value)
+
+
+class CallbackGauge:
+    """Gauge whose samples are computed at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        callback: Callable[[], Dict[Tuple[str, ...], float]],
+        labelnames: Tuple[str, ...] = (),
+    ):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class MetricsRegistry:
+    """Registry of named metrics."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, factory: Callable[[], object]):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            return metric
+
+    def counter(
+        self, name: str, description: str = "", labelnames: Tuple[str, ...] = ()
+    ) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(name, lambda: Counter(name, description, labelnames))
+
+    def gauge(self, name: str, description: str = "", labelnames: Tuple[str, ...] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(name, lambda: Gauge(name, description, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        labelnames: Tuple[str, ...] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(
+            name, lambda: Histogram(name, description, labelnames, buckets)
+        )
+
+    def register_callback(
+        self,
+        name: str,
+        description: str,
+        callback: Callable[[], Dict[Tuple[str, ...], float]],
+        labelnames: Tuple[str, ...] = (),
+    ) -> CallbackGauge:
+        """Register (or replace) a scrape-time gauge."""
+        metric = CallbackGauge(name, description, callback, labelnames)
+        with self._lock:
+            self._metrics[name] = metric
+        return metric
+
+    def get(self, name: str):
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format (0.0.4)."""
+        lines: List[str] = []
+        for name, metric in sorted(self._metrics.items()):
+            samples = self._render_metric(metric)
+            if samples is None:
+                continue
+            lines.append(f"# HELP {name} {metric.description}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+    def _render_metric(self, metric) -> Optional[List[str]]:
+        name = metric.name
+        names = metric.labelnames
+
+        if isinstance(metric, CallbackGauge):
+            try:
+                values = metric.callback()
+            except Exception:
+                # A failing collector must not break the whole scrape
+                return None
+            return [
+                f"{name}{_format_labels(names, labels)} {_format_value(value)}"
+                for labels, value in values.items()
+            ]
+
+        samples = []
+        for labels, child in metric.children():
+            if isinstance(child, _HistogramChild):
+                cumulative = 0
+                for bound, count in zip(child.bounds + (math.inf,), child.counts):
+                    cumulative += count
+                    le = f'le="{_format_value(float(bound))}"'
+                    samples.append(
+                        f"{name}_bucket{_format_labels(names, labels, le)} {cumulative}"
+                    )
+                samples.append(
+                    f"{name}_sum{_format_labels(names, labels)} {_format_value(child.sum)}"
+                )
+                samples.append(f"{name}_count{_format_labels(names, labels)} {child.count}")
+            else:
+                samples.append(
+                    f"{name}{_format_labels(names, labels)} {_format_value(child.value)}"
+                )
+        return samples
+
+
+@lru_cache
+def get_metrics_registry() -> MetricsRegistry:
+    """Get singleton metrics registry."""
+    return MetricsRegistry()
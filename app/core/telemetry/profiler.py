@@ -0,0 +1,180 @@
+"""Runtime-toggled sampling profiler.
+
+A background thread snapshots ``sys._current_frames()`` every few
+milliseconds while a profiling window is open and aggregates the stacks in
+collapsed format (``root;child;leaf count``), which flamegraph.pl,
+speedscope and inferno read directly.
+
+Two modes:
+
+- Whole process: every thread is sampled for the window.
+- Selected requests: ``ProfilerMiddleware`` runs a chosen share of requests
+  under a route prefix through ``profiled_request``. Only stacks that pass
+  through that marker frame are kept, so samples belong to those requests.
+
+When no window is open there is no thread. The per-request cost is one
+attribute read (``profiler.active``).
+"""
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter as StackCounter
+from functools import lru_cache
+from types import CodeType, FrameType
+from typing import Dict, Optional, Tuple
+
+from app.core.config import get_settings
+
+from .logging import logger
+
+_MAX_STACK_DEPTH = 128
+
+
+async def profiled_request(app, scope, receive, send) -> None:
+    """Marker frame: samples below this frame belong to a selected request."""
+    await app(scope, receive, send)
+
+
+_MARKER_CODE = profiled_request.__code__
+
+
+class SamplingProfiler:
+    """Samples thread stacks while a profiling window is open."""
+
+    def __init__(self, interval_seconds: float = 0.005):
+        self.interval_seconds = interval_seconds
+        self.active = False
+        self.route_prefix: Optional[str] = None
+        self.sample_rate = 1.0
+        self.request_mode = False
+        self.started_at: Optional[float] = None
+        self.deadline: Optional[float] = None
+        self.samples = 0
+        self._stacks: StackCounter = StackCounter()
+        self._labels: Dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        duration_seconds: float,
+        route_prefix: Optional[str] = None,
+        sample_rate: float = 1.0,
+        interval_seconds: Optional[float] = None,
+    ) -> None:
+        """Open a profiling window, discarding stacks from the previous one."""
+        with self._lock:
+            self._stop_thread()
+            self._stacks = StackCounter()
+            self.samples = 0
+            self.route_prefix = route_prefix
+            self.sample_rate = sample_rate
+            self.request_mode = route_prefix is not None or sample_rate < 1.0
+            if interval_seconds:
+                self.interval_seconds = interval_seconds
+            self.started_at = time.time()
+            self.deadline = time.monotonic() + duration_seconds
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, name="sampling-profiler", daemon=True
+            )
+            self.active = True
+            self._thread.start()
+        logger.info(
+            "Sampling profiler started for %ss (route_prefix=%s, sample_rate=%s)",
+            duration_seconds,
+            route_prefix,
+            sample_rate,
+        )
+
+    def stop(self) -> None:
+        """Close the profiling window; collected stacks are kept."""
+        with self._lock:
+            self._stop_thread()
+
+    def _stop_thread(self) -> None:
+        self.active = False
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def select(self, path: str) -> bool:
+        """Whether a request should run under the marker frame."""
+        if not self.request_mode:
+            return False
+        if self.route_prefix and not path.startswith(self.route_prefix):
+            return False
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval_seconds):
+            if time.monotonic() >= self.deadline:
+                break
+            self._sample(own_id)
+        self.active = False
+
+    def _sample(self, own_id: int) -> None:
+        self.samples += 1
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            stack = self._walk(frame)
+            if stack:
+                self._stacks[stack] += 1
+
+    def _walk(self, frame: Optional[FrameType]) -> Optional[Tuple[str, ...]]:
+        """Stack from root to leaf; None if filtered out by request mode."""
+        labels = []
+        while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+            code = frame.f_code
+            if code is _MARKER_CODE and self.request_mode:
+                labels.append(self._label(code))
+                return tuple(reversed(labels))
+            labels.append(self._label(code))
+            frame = frame.f_back
+        if self.request_mode:
+            return None
+        return tuple(reversed(labels))
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            filename = os.path.basename(code.co_filename)
+            label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def collapsed(self) -> str:
+        """Collected stacks in collapsed (folded) format, hottest first."""
+        # dict() copies in one C call, safe against the sampler thread
+        stacks = StackCounter(dict(self._stacks))
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in stacks.most_common())
+
+    def status(self) -> dict:
+        """Current window and collection summary."""
+        return {
+            "active": self.active,
+            "request_mode": self.request_mode,
+            "route_prefix": self.route_prefix,
+            "sample_rate": self.sample_rate,
+            "interval_seconds": self.interval_seconds,
+            "started_at": self.started_at,
+            "remaining_seconds": (
+                max(0.0, round(self.deadline - time.monotonic(), 3))
+                if self.active and self.deadline
+                else 0.0
+            ),
+            "samples": self.samples,
+            "unique_stacks": len(self._stacks),
+        }
+
+
+@lru_cache
+def get_profiler() -> SamplingProfiler:
+    """Get singleton sampling profiler."""
+    return SamplingProfiler(interval_seconds=get_settings().profiler_interval_ms / 1000)
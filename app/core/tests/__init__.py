@@ -0,0 +1 @@
+"""Core shared kernel tests."""
@@ -0,0 +1,11 @@
+"""Pytest configuration for core tests."""
+import pytest
+from sqlalchemy import create_engine
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine, disposed after the test."""
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
@@ -0,0 +1,28 @@
+"""Tests for ETag helpers."""
+import pytest
+
+from app.core.http.etag import if_none_match_matches, quote_etag
+
+
+def test_quote_etag():
+    """Test ETag header formatting."""
+    assert quote_etag("abc") == '"abc"'
+    assert quote_etag("abc", weak=True) == 'W/"abc"'
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ('"abc"', True),
+        ("abc", True),
+        ('W/"abc"', True),
+        ('"xyz", W/"abc"', True),
+        ("*", True),
+        ('"xyz"', False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_if_none_match_matches(header, expected):
+    """Test If-None-Match weak comparison and list handling."""
+    assert if_none_match_matches(header, "abc") is expected
@@ -0,0 +1,53 @@
+"""Tests for the HyperLogLog sketch."""
+import pytest
+
+from app.core.utils import HyperLogLog
+
+
+def _sketch(values, precision=12):
+    sketch = HyperLogLog(precision)
+    sketch.update(values)
+    return sketch
+
+
+def test_estimates_within_error_bounds():
+    """Test small counts are near exact and large ones within 4 standard errors."""
+    assert _sketch(f"s{i}" for i in range(10)).count() == 10
+    assert _sketch(["same"] * 1000).count() == 1
+
+    sketch = _sketch(f"sess_{i}" for i in range(50_000))
+    assert abs(sketch.count() - 50_000) / 50_000 < 4 * sketch.relative_error()
+
+
+def test_merge_is_union_and_round_trips():
+    """Test merged sketches count the union and survive serialization."""
+    first = _sketch(f"s{i}" for i in range(0, 20_000))
+    second = _sketch(f"s{i}" for i in range(10_000, 30_000))
+    union = HyperLogLog.from_bytes(first.to_bytes())
+    union.merge(HyperLogLog.from_bytes(second.to_bytes()))
+
+    assert abs(union.count() - 30_000) / 30_000 < 4 * union.relative_error()
+    assert union.count() == _sketch(f"s{i}" for i in range(30_000)).count()
+    # Sparse sketches stay small on disk
+    assert len(_sketch(["a", "b", "c"]).to_bytes()) < 100
+
+
+def test_precision_must_be_in_range():
+    """Test out-of-range precisions are rejected."""
+    with pytest.raises(ValueError):
+        HyperLogLog(20)
+
+
+def test_merge_across_precisions_folds_to_lower():
+    """Test sketches of different precision merge as if both were built at the lower one."""
+    values = [f"s{i}" for i in range(5_000)]
+    coarse = _sketch(values[:3_000], precision=10)
+    fine = _sketch(values[2_000:], precision=14)
+
+    assert fine.fold(10).to_bytes() == _sketch(values[2_000:], precision=10).to_bytes()
+    assert _sketch([], precision=14).merge(coarse).precision == 10
+    merged = HyperLogLog.from_bytes(fine.to_bytes()).merge(coarse)
+    assert merged.precision == 10
+    assert merged.to_bytes() == _sketch(values, precision=10).to_bytes()
+    with pytest.raises(ValueError):
+        coarse.fold(12)
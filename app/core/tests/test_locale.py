@@ -0,0 +1,51 @@
+"""Tests for locale canonicalization and negotiation."""
+import pytest
+
+from app.core.utils import LocaleResolver, canonicalize_locale, parse_accept_language
+
+
+@pytest.mark.parametrize(
+    "tag, expected",
+    [
+        ("en-us", "en-US"),
+        ("EN_us", "en-US"),
+        ("en_US.UTF-8", "en-US"),
+        ("zh-hant-tw", "zh-Hant-TW"),
+        ("es-419", "es-419"),
+        ("de-DE-u-co-phonebk", "de-DE"),
+        ("../etc/passwd", None),
+        ("x", None),
+        ("", None),
+    ],
+)
+def test_canonicalize_locale(tag, expected):
+    """Test BCP 47 casing, POSIX spellings and rejection of non-tags."""
+    assert canonicalize_locale(tag) == expected
+
+
+def test_accept_language_ordered_by_quality():
+    """Test ranges come out by q, header order breaking ties, q=0 and * dropped."""
+    header = "fr;q=0.5, vi-VN, *;q=0.1, de;q=0, en;q=0.5"
+    assert parse_accept_language(header) == ["vi-VN", "fr", "en"]
+
+
+def test_resolver_maps_spellings_onto_supported_locales():
+    """Test every spelling resolves to one interned supported locale."""
+    resolver = LocaleResolver(["en-US", "vi-VN", "zh-Hant-TW"], default="en-US")
+
+    assert resolver.resolve("vi_vn") is resolver.resolve("VI-VN") is resolver.supported[1]
+    assert resolver.resolve("zh-TW") == "zh-Hant-TW"  # same language
+    assert resolver.resolve("en-GB") == "en-US"
+    assert resolver.resolve("junk!") == "en-US"
+    assert resolver.resolve(None, "fr, vi;q=0.8") == "vi-VN"
+    assert resolver.resolve("fr-FR", "zh-Hant") == "zh-Hant-TW"
+
+
+def test_resolver_memo_is_bounded():
+    """Test arbitrary requested tags cannot grow the memo table past its size."""
+    resolver = LocaleResolver(["en-US"], default="en-US", max_entries=8)
+
+    for i in range(100):
+        resolver.resolve(f"zz-{i:04d}x")
+
+    assert len(resolver._memo) <= 8
@@ -0,0 +1,51 @@
+"""Tests for structured, non-blocking logging."""
+import json
+import logging
+import queue
+
+from app.core.telemetry.logging import (
+    JSONFormatter,
+    RateLimitFilter,
+    _NonBlockingQueueHandler,
+)
+
+
+def _record(msg="hello %s", args=("world",), level=logging.INFO, **extra):
+    record = logging.LogRecord("lendcommunity.test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_extra_fields():
+    """Test JSON output carries the message and extra fields."""
+    line = JSONFormatter().format(_record(duration_ms=1.5))
+
+    entry = json.loads(line)
+    assert entry["message"] == "hello world"
+    assert entry["logger"] == "lendcommunity.test"
+    assert entry["duration_ms"] == 1.5
+
+
+def test_queue_handler_defers_formatting_and_drops_when_full():
+    """Test records are queued unformatted and overflow does not block."""
+    log_queue = queue.Queue(maxsize=1)
+    handler = _NonBlockingQueueHandler(log_queue)
+
+    handler.handle(_record())
+    handler.handle(_record())
+
+    queued = log_queue.get_nowait()
+    assert queued.args == ("world",)
+    assert log_queue.empty()
+
+
+def test_rate_limit_filter_passes_warnings_and_counts_suppressed():
+    """Test INFO lines are capped while warnings always pass."""
+    rate_filter = RateLimitFilter(per_second=2)
+
+    passed = [rate_filter.filter(_record()) for _ in range(5)]
+
+    assert passed[:2] == [True, True]
+    assert not any(passed[2:])
+    assert rate_filter.filter(_record(level=logging.WARNING))
+    assert rate_filter.suppressed == 3
@@ -0,0 +1,40 @@
+"""Tests for the in-process metrics registry."""
+from app.core.telemetry import MetricsRegistry
+
+
+def test_histogram_buckets_are_cumulative_when_rendered():
+    """Test observations land in the right bucket and render cumulatively."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+    child = histogram.labels("/page")
+    for value in (0.05, 0.1, 0.5, 5.0):
+        child.observe(value)
+
+    text = registry.render()
+
+    assert 'latency_seconds_bucket{route="/page",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{route="/page",le="1"} 3' in text
+    assert 'latency_seconds_bucket{route="/page",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{route="/page"} 4' in text
+    assert "# TYPE latency_seconds histogram" in text
+
+
+def test_labels_returns_same_child():
+    """Test children are cached per label combination."""
+    registry = MetricsRegistry()
+    counter = registry.counter("hits_total", "Hits", ("result",))
+
+    assert counter.labels("hit") is counter.labels("hit")
+    assert registry.counter("hits_total") is counter
+
+
+def test_callback_gauge_failure_skips_metric():
+    """Test a failing collector is left out instead of breaking the scrape."""
+    registry = MetricsRegistry()
+    registry.register_callback("depth", "Depth", lambda: {(): 3})
+    registry.register_callback("broken", "Broken", lambda: 1 / 0)
+
+    text = registry.render()
+
+    assert "depth 3" in text
+    assert "broken" not in text
@@ -0,0 +1,54 @@
+"""Tests for pure-ASGI request middleware."""
+import asyncio
+
+from app.core.http.middleware import RequestIDMiddleware, TimingMiddleware, _request_duration
+
+
+async def _endpoint(scope, receive, send):
+    """Tiny ASGI app echoing the request ID seen in scope state."""
+    body = scope["state"]["request_id"].encode()
+    await send({"type": "http.response.start", "status": 201, "headers": []})
+    await send({"type": "http.response.body", "body": body})
+
+
+def _call(app, headers=(), method="GET"):
+    scope = {"type": "http", "method": method, "path": "/x", "headers": list(headers)}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+def test_request_id_generated_and_echoed():
+    """Test a request ID is generated, exposed in state and returned."""
+    start, body = _call(TimingMiddleware(RequestIDMiddleware(_endpoint)))
+
+    headers = dict(start["headers"])
+    assert start["status"] == 201
+    assert headers[b"x-request-id"] == body["body"]
+    assert float(headers[b"x-process-time"]) >= 0
+
+
+def test_request_id_propagated_from_header():
+    """Test an incoming X-Request-ID is reused."""
+    start, body = _call(RequestIDMiddleware(_endpoint), [(b"x-request-id", b"abc")])
+
+    assert dict(start["headers"])[b"x-request-id"] == b"abc"
+    assert body["body"] == b"abc"
+
+
+def test_unknown_methods_share_one_label():
+    """Test arbitrary client verbs do not create new latency series."""
+    app = TimingMiddleware(RequestIDMiddleware(_endpoint))
+    for method in ("GET", "FOO", "XYZZY"):
+        _call(app, method=method)
+
+    methods = {values[1] for values, _ in _request_duration.children()}
+    assert "GET" in methods and "other" in methods
+    assert not methods & {"FOO", "XYZZY"}
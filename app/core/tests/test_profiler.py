@@ -0,0 +1,80 @@
+"""Tests for runtime profiling and SQL statement timing."""
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+
+from app.core.db import SQLStatementTimer
+from app.core.http.error_handlers import ForbiddenException
+from app.core.security import require_admin
+from app.core.telemetry import SamplingProfiler, profiled_request
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_request_mode_keeps_only_marked_stacks():
+    """Test selected-request sampling keeps stacks rooted at the marker frame."""
+    profiler = SamplingProfiler(interval_seconds=0.001)
+    profiler.start(duration_seconds=5, route_prefix="/landing")
+
+    async def endpoint(scope, receive, send):
+        _busy(0.2)
+
+    assert profiler.select("/landing/v1/page")
+    assert not profiler.select("/health")
+    asyncio.run(profiled_request(endpoint, {}, None, None))
+    profiler.stop()
+
+    lines = profiler.collapsed().splitlines()
+    assert lines
+    assert all(line.startswith("profiled_request (") for line in lines)
+    assert any(";_busy (" in line for line in lines)
+    assert not profiler.active
+
+
+def test_profiler_inactive_by_default():
+    """Test a fresh profiler selects nothing and runs no thread."""
+    profiler = SamplingProfiler()
+
+    assert not profiler.active
+    assert not profiler.select("/landing/v1/page")
+    assert profiler.collapsed() == ""
+
+
+def test_statement_timer_aggregates_while_enabled(engine):
+    """Test statements are timed only between enable and disable."""
+    timer = SQLStatementTimer(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        timer.enable()
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("SELECT 1"))
+        timer.disable()
+        conn.execute(text("SELECT 1"))
+
+    [row] = timer.report()
+    assert row["statement"] == "SELECT 1"
+    assert row["count"] == 2
+
+
+def test_require_admin_checks_token():
+    """Test admin guard rejects missing config and wrong tokens."""
+    settings = MagicMock()
+    with patch("app.core.security.admin.get_settings", return_value=settings):
+        settings.admin_token = None
+        with pytest.raises(ForbiddenException):
+            require_admin("anything")
+
+        settings.admin_token = "s3cret"
+        with pytest.raises(ForbiddenException):
+            require_admin("wrong")
+        with pytest.raises(ForbiddenException):
+            require_admin("s3crét")
+        require_admin("s3cret")
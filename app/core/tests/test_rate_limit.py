@@ -0,0 +1,120 @@
+"""Tests for the GCRA rate limiter."""
+import asyncio
+
+import pytest
+
+from app.core.http.rate_limit import (
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimitMiddleware,
+)
+
+
+async def _ok(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _statuses(middleware, path, count, session=None, client="10.0.0.1"):
+    statuses = []
+
+    async def run():
+        for i in range(count):
+            headers = []
+            if session is not None:
+                value = f"{session}{i}" if session == "rotating" else session
+                headers.append((b"x-session-id", value.encode()))
+            scope = {"type": "http", "path": path, "headers": headers, "client": (client, 1)}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    statuses.append(message["status"])
+
+            await middleware(scope, None, send)
+
+    asyncio.run(run())
+    return statuses
+
+
+def _middleware(**kwargs):
+    kwargs.setdefault("burst", 3)
+    kwargs.setdefault("ip_multiplier", 2)
+    kwargs.setdefault("per_minute", 60)
+    kwargs.setdefault("routes", {"/join": 6, "/health": 0})
+    return RateLimitMiddleware(
+        _ok, backend=MemoryRateLimitBackend(), trust_forwarded_for=False, **kwargs
+    )
+
+
+def test_gcra_allows_burst_then_paces():
+    """Test a bucket admits the burst, then one request per interval."""
+    backend = MemoryRateLimitBackend()
+
+    assert [backend.hit_now("k", 10.0, 2, now=0.0) for _ in range(3)] == [0.0, 0.0, 10.0]
+    assert backend.hit_now("k", 10.0, 2, now=10.0) == 0.0
+    assert backend.hit_now("k", 10.0, 2, now=10.0) == 10.0
+
+
+def test_memory_backend_is_bounded():
+    """Test least recently used buckets are evicted past max_keys."""
+    backend = MemoryRateLimitBackend(max_keys=2)
+    for key in ("a", "b", "c"):
+        backend.hit_now(key, 1.0, 1, now=0.0)
+
+    assert len(backend) == 2
+
+
+def test_middleware_limits_per_route_and_exempts():
+    """Test route overrides apply and 0 disables limiting."""
+    middleware = _middleware()
+
+    assert _statuses(middleware, "/join", 4, session="abc") == [200, 200, 200, 429]
+    assert _statuses(middleware, "/health", 10, session="abc") == [200] * 10
+
+
+def test_rotating_sessions_hit_ip_limit():
+    """Test changing X-Session-ID per request does not bypass the IP bucket."""
+    middleware = _middleware()
+
+    statuses = _statuses(middleware, "/join", 8, session="rotating")
+
+    assert statuses == [200] * 6 + [429] * 2
+
+
+def test_unlisted_paths_are_unlimited_by_default():
+    """Test only rate_limit_routes paths are limited when per_minute is 0."""
+    middleware = _middleware(per_minute=0)
+
+    assert _statuses(middleware, "/landing/v1/page", 100) == [200] * 100
+    assert _statuses(middleware, "/join", 4, session="abc") == [200, 200, 200, 429]
+
+
+def test_rejection_charges_no_bucket():
+    """Test a request rejected by the IP bucket does not consume its session bucket."""
+    backend = MemoryRateLimitBackend()
+    buckets = [("ip", 10.0, 1), ("session", 10.0, 2)]
+
+    assert backend.hit_all_now(buckets, now=0.0) == [0.0, 0.0]
+    assert backend.hit_all_now(buckets, now=0.0) == [10.0, 0.0]
+    # The session bucket still has its second token
+    assert backend.hit_now("session", 10.0, 2, now=0.0) == 0.0
+
+
+def test_backend_failure_fails_open():
+    """Test a failing backend lets requests through instead of erroring."""
+
+    class BrokenBackend(RateLimitBackend):
+        async def hit_all(self, buckets):
+            raise ConnectionError("redis timed out")
+
+    middleware = RateLimitMiddleware(
+        _ok, backend=BrokenBackend(), per_minute=60, routes={}, trust_forwarded_for=False
+    )
+
+    assert _statuses(middleware, "/join", 3, session="abc") == [200] * 3
+
+
+def test_explicit_zero_burst_is_rejected_not_defaulted():
+    """Test burst=0 is validated instead of silently becoming the settings default."""
+    with pytest.raises(ValueError):
+        _middleware(burst=0)
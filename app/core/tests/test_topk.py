@@ -0,0 +1,61 @@
+"""Tests for the incremental top-K index."""
+import random
+
+import pytest
+
+from app.core.utils import TopKIndex
+
+
+def _expected(scores, k):
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return ranked[:k]
+
+
+def test_top_matches_full_sort_under_random_updates():
+    """Test the maintained head always equals a full sort."""
+    rng = random.Random(7)
+    index = TopKIndex(capacity=5)
+    scores = {}
+    for _ in range(3000):
+        key = f"c{rng.randrange(60)}"
+        if rng.random() < 0.1 and key in scores:
+            del scores[key]
+            index.remove(key)
+        else:
+            scores[key] = float(rng.randrange(100))
+            index.update(key, scores[key])
+        assert index.top(5) == _expected(scores, 5)
+
+    assert index.top(20) == _expected(scores, 20)
+
+
+def test_update_reports_head_changes():
+    """Test update returns True only when the top list changes."""
+    index = TopKIndex(capacity=2)
+    assert index.update("a", 10)
+    assert index.update("b", 5)
+    assert not index.update("c", 1)
+    assert not index.update("c", 2)
+    assert index.update("c", 20)
+    assert index.top(2) == [("c", 20), ("a", 10)]
+
+
+def test_capacity_must_be_positive():
+    """Test an empty window is rejected."""
+    with pytest.raises(ValueError):
+        TopKIndex(capacity=0)
+
+
+def test_load_then_update_matches_full_sort():
+    """Test a bulk-loaded index keeps its head correct under point updates."""
+    rng = random.Random(11)
+    scores = {f"c{i}": float(rng.randrange(1000)) for i in range(200)}
+    index = TopKIndex(capacity=5)
+    index.load(scores.items())
+
+    assert index.top(5) == _expected(scores, 5)
+    for _ in range(500):
+        key = f"c{rng.randrange(200)}"
+        scores[key] = float(rng.randrange(1000))
+        index.update(key, scores[key])
+        assert index.top(5) == _expected(scores, 5)
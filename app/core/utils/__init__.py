@@ -1,4 +1,16 @@
 """Generic utility functions."""
-from .helpers import utcnow, dict_hash
+from .helpers import utcnow, naive_utc, dict_hash
+from .hyperloglog import HyperLogLog
+from .locale import LocaleResolver, canonicalize_locale, parse_accept_language
+from .topk import TopKIndex
 
-__all__ = ["utcnow", "dict_hash"]
+__all__ = [
+    "utcnow",
+    "naive_utc",
+    "dict_hash",
+    "HyperLogLog",
+    "TopKIndex",
+    "LocaleResolver",
+    "canonicalize_locale",
+    "parse_accept_language",
+]
@@ -10,6 +10,13 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def naive_utc(value: datetime) -> datetime:
+    """Convert to naive UTC, as timestamp columns are stored (naive values pass through)."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 def dict_hash(data: Dict[str, Any]) -> str:
     """Generate hash from dictionary."""
     json_str = json.dumps(data, sort_keys=True, default=str)
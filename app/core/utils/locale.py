@@ -0,0 +1,142 @@
+"""Locale canonicalization and negotiation against a supported set.
+
+Request locales arrive in many spellings (``en-us``, ``en_US``, ``EN-US``)
+or as junk. ``LocaleResolver`` maps any of them, and ``Accept-Language``
+headers, onto one of a fixed set of supported locales. Callers can then key
+caches on a bounded set of values.
+
+Canonical form follows BCP 47 casing: language lowercase, script titlecase,
+region uppercase (``zh-hant-tw`` -> ``zh-Hant-TW``). Extensions and private
+use subtags are dropped.
+
+Matching falls back by truncation (``zh-Hant-TW`` -> ``zh-Hant`` -> ``zh``),
+then to any supported locale of the same language, then to the default.
+"""
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+
+_LANGUAGE = re.compile(r"^[a-z]{2,3}$|^[a-z]{5,8}$")
+_SCRIPT = re.compile(r"^[a-z]{4}$")
+_REGION = re.compile(r"^[a-z]{2}$|^[0-9]{3}$")
+_VARIANT = re.compile(r"^[a-z0-9]{5,8}$|^[0-9][a-z0-9]{3}$")
+_MAX_TAG_LENGTH = 64
+
+
+def canonicalize_locale(tag: str) -> Optional[str]:
+    """Canonical BCP 47 form of a language tag, or None if it is not one."""
+    # POSIX spellings: en_US.UTF-8, de_DE@euro
+    tag = tag.strip().split(".", 1)[0].split("@", 1)[0].replace("_", "-").lower()
+    if not tag or len(tag) > _MAX_TAG_LENGTH:
+        return None
+
+    subtags = tag.split("-")
+    if not _LANGUAGE.match(subtags[0]):
+        return None
+    canonical = [subtags[0]]
+    rest = subtags[1:]
+    if rest and _SCRIPT.match(rest[0]):
+        canonical.append(rest.pop(0).title())
+    if rest and _REGION.match(rest[0]):
+        canonical.append(rest.pop(0).upper())
+    for subtag in rest:
+        if len(subtag) == 1:
+            break  # extension or private use: not part of the locale identity
+        if not _VARIANT.match(subtag):
+            return None
+        canonical.append(subtag)
+    return "-".join(canonical)
+
+
+def parse_accept_language(header: Optional[str]) -> List[str]:
+    """Language ranges of an Accept-Language header, most preferred first (q=0 dropped)."""
+    if not header:
+        return []
+
+    ranges = []
+    for position, part in enumerate(header.split(",")):
+        tag, _, params = part.strip().partition(";")
+        tag = tag.strip()
+        if not tag or tag == "*":
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if q > 0:
+            ranges.append((-q, position, tag))
+    return [tag for _, _, tag in sorted(ranges)]
+
+
+class LocaleResolver:
+    """Resolves requested locales to supported ones, memoizing the mapping."""
+
+    def __init__(self, supported: Iterable[str], default: str, max_entries: int = 1024):
+        supported = list(supported)
+        canonical = [canonicalize_locale(locale) for locale in supported]
+        if None in canonical:
+            raise ValueError(f"Invalid supported locale in {supported!r}")
+        default_canonical = canonicalize_locale(default)
+        if default_canonical is None:
+            raise ValueError(f"Invalid default locale {default!r}")
+
+        # The same str objects are handed out for every spelling (interned)
+        self.supported = list(dict.fromkeys([default_canonical, *canonical]))
+        self.default = self.supported[0]
+        self._exact: Dict[str, str] = {locale.lower(): locale for locale in self.supported}
+        self._by_language: Dict[str, str] = {}
+        for locale in self.supported:
+            self._by_language.setdefault(locale.split("-", 1)[0].lower(), locale)
+
+        self.max_entries = max_entries
+        self._memo: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, locale: str) -> bool:
+        return locale in self.supported
+
+    def resolve(
+        self, requested: Optional[str] = None, accept_language: Optional[str] = None
+    ) -> str:
+        """Supported locale for a requested tag, else the Accept-Language choice, else default."""
+        if requested:
+            match = self.match(requested)
+            if match is not None:
+                return match
+        for tag in parse_accept_language(accept_language):
+            match = self.match(tag)
+            if match is not None:
+                return match
+        return self.default
+
+    def match(self, tag: str) -> Optional[str]:
+        """Best supported locale for one tag, or None if nothing is close."""
+        if len(tag) > _MAX_TAG_LENGTH:
+            return None
+        try:
+            return self._memo[tag]
+        except KeyError:
+            pass
+
+        match = self._match(tag)
+        with self._lock:
+            # Junk tags are memoized too; the table is bounded, not the input
+            if len(self._memo) >= self.max_entries:
+                self._memo.clear()
+            self._memo[tag] = match
+        return match
+
+    def _match(self, tag: str) -> Optional[str]:
+        canonical = canonicalize_locale(tag)
+        if canonical is None:
+            return None
+        subtags = canonical.lower().split("-")
+        while subtags:
+            exact = self._exact.get("-".join(subtags))
+            if exact is not None:
+                return exact
+            subtags.pop()
+        return self._by_language.get(canonical.split("-", 1)[0])
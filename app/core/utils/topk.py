@@ -0,0 +1,133 @@
+"""Incrementally maintained top-K index.
+
+Keeps the ``capacity`` highest-scoring keys in a sorted list and everything
+else in a lazy max-heap:
+
+- ``update``/``remove``: O(log n) heap push plus O(capacity) list edit.
+  Superseded heap entries are not deleted; they are skipped when popped, and
+  the heap is rebuilt once stale entries outnumber live ones.
+- ``top(k)`` for ``k <= capacity``: O(k) slice, no scan or sort.
+- ``load``: bulk (re)build in O(n + capacity log n).
+
+Ties are broken by key so the order is deterministic.
+"""
+import heapq
+from bisect import bisect_left, insort
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+Entry = Tuple[float, Hashable]  # (-score, key): ascending order = best first
+
+
+class TopKIndex:
+    """Top-``capacity`` keys by score, maintained under point updates."""
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._scores: Dict[Hashable, float] = {}
+        self._top: List[Entry] = []
+        self._in_top: Set[Hashable] = set()
+        self._rest: List[Entry] = []  # lazy max-heap via negated scores
+        # Bumped whenever the top list changes (membership, score or order)
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._scores
+
+    def score(self, key: Hashable) -> Optional[float]:
+        """Current score of a key, or None."""
+        return self._scores.get(key)
+
+    def update(self, key: Hashable, score: float) -> bool:
+        """Insert or rescore a key. Returns True if the top list changed."""
+        old = self._scores.get(key)
+        if old == score:
+            return False
+
+        version = self.version
+        if key in self._in_top:
+            self._remove_from_top(key, old)
+        self._scores[key] = score
+        heapq.heappush(self._rest, (-score, key))
+        self._rebalance()
+        self._maybe_compact()
+        return self.version != version
+
+    def load(self, items: Iterable[Tuple[Hashable, float]]) -> None:
+        """Replace the contents with (key, score) pairs."""
+        self._scores = dict(items)
+        entries = [(-score, key) for key, score in self._scores.items()]
+        heapq.heapify(entries)
+        self._top = [heapq.heappop(entries) for _ in range(min(self.capacity, len(entries)))]
+        self._in_top = {key for _, key in self._top}
+        self._rest = entries
+        self.version += 1
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove a key. Returns True if the top list changed."""
+        old = self._scores.pop(key, None)
+        if old is None:
+            return False
+        version = self.version
+        if key in self._in_top:
+            self._remove_from_top(key, old)
+        # A heap entry for the key, if any, is now stale
+        self._rebalance()
+        self._maybe_compact()
+        return self.version != version
+
+    def top(self, k: int) -> List[Tuple[Hashable, float]]:
+        """The k best (key, score) pairs, best first."""
+        if k <= self.capacity:
+            return [(key, -neg) for neg, key in self._top[:k]]
+        # Beyond the maintained window: fall back to a partial sort
+        best = heapq.nsmallest(k, ((-score, key) for key, score in self._scores.items()))
+        return [(key, -neg) for neg, key in best]
+
+    def _remove_from_top(self, key: Hashable, score: float) -> None:
+        entry = (-score, key)
+        index = bisect_left(self._top, entry)
+        del self._top[index]
+        self._in_top.discard(key)
+        self.version += 1
+
+    def _peek_rest(self) -> Optional[Entry]:
+        """Best live entry of the heap, dropping stale ones on the way."""
+        rest = self._rest
+        while rest:
+            neg, key = rest[0]
+            if key not in self._in_top and self._scores.get(key) == -neg:
+                return rest[0]
+            heapq.heappop(rest)
+        return None
+
+    def _rebalance(self) -> None:
+        """Restore: top holds the best ``capacity`` keys, heap the rest."""
+        while True:
+            candidate = self._peek_rest()
+            if candidate is None:
+                return
+            if len(self._top) < self.capacity:
+                heapq.heappop(self._rest)
+            elif candidate < self._top[-1]:
+                heapq.heappop(self._rest)
+                demoted = self._top.pop()
+                self._in_top.discard(demoted[1])
+                heapq.heappush(self._rest, demoted)
+            else:
+                return
+            insort(self._top, candidate)
+            self._in_top.add(candidate[1])
+            self.version += 1
+
+    def _maybe_compact(self) -> None:
+        live = len(self._scores) - len(self._top)
+        if len(self._rest) > 2 * live + 64:
+            self._rest = [
+                (-score, key) for key, score in self._scores.items() if key not in self._in_top
+            ]
+            heapq.heapify(self._rest)
@@ -1,8 +1,10 @@
 """Stub Analytics adapter for MVP."""
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Tuple
 
 from app.core.events import Event, get_event_dispatcher
-from app.core.telemetry import logger
+from app.core.telemetry import get_logger
+
+analytics_logger = get_logger("analytics")
 
 
 class AnalyticsStub:
@@ -14,12 +16,21 @@ class AnalyticsStub:
     def track_event(self, event_type: str, payload: Dict[str, Any]) -> None:
         """Track an analytics event."""
         # For MVP, just log and emit to event system
-        logger.info(f"Analytics event: {event_type}", extra={"payload": payload})
+        analytics_logger.info("Analytics event: %s", event_type, extra={"payload": payload})
 
         # Emit to event system
         event = Event(event_type=event_type, payload=payload)
         self.dispatcher.emit(event)
 
+    def track_events(self, events: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """Track a batch of (event_type, payload) pairs. Returns the number tracked."""
+        batch = [Event(event_type=event_type, payload=payload) for event_type, payload in events]
+        if not batch:
+            return 0
+        analytics_logger.info("Analytics batch: %d events", len(batch))
+        self.dispatcher.emit_many(batch)
+        return len(batch)
+
     def track_landing_impression(
         self,
         locale: str,
@@ -0,0 +1,163 @@
+"""Campaign catalog backing the Discovery adapter.
+
+Cards are kept by ID and ranked for teasers by score (funding, amount
+raised, recency, locale affinity; see ``CampaignScorer``). Each locale class
+has a ``TopKIndex`` holding the head of its ranking:
+
+- reads (``teasers``) are O(K) slices of the head;
+- a funding update that changes only its own campaign's score is applied to
+  each head in O(log n + K), so no rescan follows a pledge;
+- heads are rebuilt from one bulk scoring pass, O(n) per locale class, when
+  the recency bucket rolls over or a write rescales every score (campaign
+  added or removed, largest amount raised changed).
+
+``teaser_revision`` hashes the rendered cards of every head, so a funding
+change that keeps the order still changes the revision.
+"""
+import threading
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.utils import TopKIndex, dict_hash
+from app.modules.landing.domain import StartupCardVM
+
+from .campaign_scoring import CampaignScorer, LocaleClass
+
+
+def percent_funded(raised_cents: int, goal_cents: int) -> float:
+    """Funding percentage, capped at 100 like the card model."""
+    return min(100.0, round(raised_cents * 100 / goal_cents, 2))
+
+
+class CampaignCatalog:
+    """Campaign cards with incrementally maintained teaser rankings."""
+
+    def __init__(self, capacity: int = 50, scorer: Optional[CampaignScorer] = None):
+        self.capacity = capacity
+        self._cards: Dict[str, StartupCardVM] = {}
+        self.scorer = scorer if scorer is not None else CampaignScorer()
+        self._heads: Dict[LocaleClass, TopKIndex] = {}
+        self._heads_key: Optional[Tuple[int, float]] = None
+        # Bumped on every write; keys the memoized revisions
+        self._version = 0
+        self._revisions: Dict[int, str] = {}
+        self._revisions_key: Optional[Tuple[int, float]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def upsert(
+        self,
+        card: StartupCardVM,
+        launched_at: Optional[datetime] = None,
+        locale: Optional[str] = None,
+    ) -> None:
+        """Add or replace a campaign."""
+        with self._lock:
+            self._cards[card.id] = card
+            self.scorer.set(card.id, card.percent_funded, card.raised_cents, launched_at, locale)
+            self._version += 1
+
+    def upsert_many(self, cards: Iterable[StartupCardVM]) -> None:
+        """Bulk load campaigns."""
+        for card in cards:
+            self.upsert(card)
+
+    def remove(self, campaign_id: str) -> None:
+        """Remove a campaign."""
+        with self._lock:
+            self._cards.pop(campaign_id, None)
+            self.scorer.remove(campaign_id)
+            self._version += 1
+
+    def apply_funding_delta(self, campaign_id: str, delta_cents: int) -> None:
+        """Record pledged (or refunded) cents."""
+        with self._lock:
+            card = self._cards[campaign_id]
+            raised = max(0, card.raised_cents + delta_cents)
+            card = card.model_copy(
+                update={
+                    "raised_cents": raised,
+                    "percent_funded": percent_funded(raised, card.goal_cents),
+                }
+            )
+            self._cards[campaign_id] = card
+            self._version += 1
+            scorer = self.scorer
+            if scorer.set_funding(campaign_id, card.percent_funded, raised):
+                if self._heads_key == scorer.base_key:
+                    for locale_class, head in self._heads.items():
+                        head.update(campaign_id, scorer.score(campaign_id, locale_class))
+                else:
+                    self._heads = {}
+
+    def get(self, campaign_id: str) -> Optional[StartupCardVM]:
+        """Get a campaign card by ID."""
+        return self._cards.get(campaign_id)
+
+    def teasers(
+        self, limit: int, locale: Optional[str] = None, now: Optional[float] = None
+    ) -> List[StartupCardVM]:
+        """Best-scoring campaigns for a locale, best first."""
+        with self._lock:
+            ids = self._teaser_ids(self.scorer.locale_class(locale), limit, now)
+            # Resolved under the lock: a concurrent remove() must not drop an id we return
+            return [self._cards[key] for key in ids]
+
+    def teaser_revision(self, limit: int, now: Optional[float] = None) -> str:
+        """Token identifying the teaser cards served to every locale (memoized until a write)."""
+        now = time.time() if now is None else now
+        with self._lock:
+            key = (self._version, self.scorer.bucket(now))
+            if self._revisions_key != key:
+                self._revisions = {}
+                self._revisions_key = key
+            revision = self._revisions.get(limit)
+            if revision is None:
+                cards = self._cards
+                revision = dict_hash(
+                    {
+                        f"{locale_code}:{language_code}": [
+                            cards[campaign_id].model_dump(mode="json")
+                            for campaign_id in self._teaser_ids(
+                                (locale_code, language_code), limit, now
+                            )
+                        ]
+                        for locale_code, language_code in self.scorer.locale_classes()
+                    }
+                )
+                self._revisions[limit] = revision
+            return revision
+
+    def _teaser_ids(self, locale_class: LocaleClass, limit: int, now: Optional[float]) -> List[str]:
+        """Head of a locale class's ranking; heads are rebuilt when scores were invalidated."""
+        if limit <= 0:
+            return []
+        scorer = self.scorer
+        now = time.time() if now is None else now
+        key = (scorer.epoch, scorer.bucket(now))
+        if self._heads_key != key:
+            self._heads = {}
+            self._heads_key = key
+        head = self._heads.get(locale_class)
+        if head is None:
+            head = TopKIndex(self.capacity)
+            head.load(zip(scorer.ids, scorer.scores(locale_class, now)))
+            self._heads[locale_class] = head
+        return [campaign_id for campaign_id, _ in head.top(limit)]
+
+
+@lru_cache
+def get_campaign_catalog() -> CampaignCatalog:
+    """Get singleton campaign catalog."""
+    settings = get_settings()
+    scorer = CampaignScorer(
+        weights=settings.discovery_score_weights,
+        half_life_days=settings.discovery_recency_half_life_days,
+        bucket_seconds=settings.discovery_rescore_interval_seconds,
+    )
+    return CampaignCatalog(capacity=settings.discovery_top_k, scorer=scorer)
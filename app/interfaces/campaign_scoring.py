@@ -0,0 +1,296 @@
+"""Columnar campaign scoring for Discovery teasers.
+
+Campaign attributes live in parallel typed columns (``array.array``), one row
+per campaign. A scoring pass combines::
+
+    score = w_funded  * percent_funded / 100
+          + w_raised  * log1p(raised_cents) / log1p(max raised_cents)
+          + w_recency * 0.5 ** (age / half_life)
+          + w_locale  * affinity    # 1 same locale, 0.5 same language, else 0
+
+With NumPy installed the columns are viewed as arrays (no copy), scored in
+one vectorized pass and the top K picked with ``argpartition``. Without it
+the same formula runs as a plain loop with a heap selection.
+
+The locale-independent part is computed once per epoch and recency bucket
+(``now`` is rounded down to ``bucket_seconds``), so scores, and the revision
+token built from them, are stable between updates. A funding update that
+leaves the largest amount raised alone changes only its own row's score: the
+cached scores are patched in place and the epoch is kept. Other writes start
+a new epoch, invalidating every score.
+"""
+import heapq
+import math
+from array import array
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+try:  # Optional: vectorized scoring
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on installed extras
+    np = None
+
+DEFAULT_WEIGHTS = {"funded": 0.5, "raised": 0.2, "recency": 0.2, "locale": 0.1}
+
+# (locale code, language code); -1 means no match in the catalog
+LocaleClass = Tuple[int, int]
+NO_LOCALE: LocaleClass = (-1, -1)
+
+
+def _language(locale: str) -> str:
+    return locale.split("-", 1)[0].lower()
+
+
+class CampaignScorer:
+    """Campaign attributes in columns, scored in bulk."""
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, float]] = None,
+        half_life_days: float = 14.0,
+        bucket_seconds: int = 300,
+        vectorized: Optional[bool] = None,
+    ):
+        weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.w_funded = weights["funded"]
+        self.w_raised = weights["raised"]
+        self.w_recency = weights["recency"]
+        self.w_locale = weights["locale"]
+        self.half_life_seconds = half_life_days * 86400
+        self.bucket_seconds = max(1, bucket_seconds)
+        self.vectorized = np is not None if vectorized is None else vectorized and np is not None
+
+        self.ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._percent = array("d")
+        self._raised = array("d")
+        self._launched = array("d")  # epoch seconds; -inf when unknown
+        self._locale = array("i")
+        self._language = array("i")
+        self._locale_codes: Dict[str, int] = {}
+        self._language_codes: Dict[str, int] = {}
+        self._locale_language: Dict[int, int] = {}
+        # Bumped on writes that change every score; invalidates cached scores
+        self.epoch = 0
+        self._base_key: Optional[Tuple[int, float]] = None
+        self._base = None
+        self._top_raised = 0.0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def set(
+        self,
+        campaign_id: str,
+        percent_funded: float,
+        raised_cents: int,
+        launched_at: Optional[datetime] = None,
+        locale: Optional[str] = None,
+    ) -> None:
+        """Insert or overwrite a campaign's scoring attributes."""
+        launched = launched_at.timestamp() if launched_at else -math.inf
+        locale_code, language_code = self._encode_locale(locale, create=True)
+        row = self._rows.get(campaign_id)
+        if row is None:
+            self._rows[campaign_id] = len(self.ids)
+            self.ids.append(campaign_id)
+            self._percent.append(percent_funded)
+            self._raised.append(raised_cents)
+            self._launched.append(launched)
+            self._locale.append(locale_code)
+            self._language.append(language_code)
+        else:
+            self._percent[row] = percent_funded
+            self._raised[row] = raised_cents
+            self._launched[row] = launched
+            self._locale[row] = locale_code
+            self._language[row] = language_code
+        self.epoch += 1
+
+    def set_funding(self, campaign_id: str, percent_funded: float, raised_cents: int) -> bool:
+        """Update only the funding columns of a campaign.
+
+        Returns True if only this campaign's scores changed (cached scores were
+        patched in place), False if every score was invalidated.
+        """
+        row = self._rows[campaign_id]
+        old_raised = math.log1p(self._raised[row])
+        self._percent[row] = percent_funded
+        self._raised[row] = raised_cents
+        # The raised term is normalized by the largest amount: moving it rescales every row
+        if (
+            self._base_key is not None
+            and self._base_key[0] == self.epoch
+            and old_raised < self._top_raised
+            and math.log1p(raised_cents) <= self._top_raised
+        ):
+            self._base[row] = self._row_base(row, self._base_key[1])
+            return True
+        self.epoch += 1
+        return False
+
+    def remove(self, campaign_id: str) -> None:
+        """Remove a campaign (the last row moves into its slot)."""
+        row = self._rows.pop(campaign_id, None)
+        if row is None:
+            return
+        last = len(self.ids) - 1
+        for column in (
+            self.ids, self._percent, self._raised, self._launched, self._locale, self._language
+        ):
+            if row != last:
+                column[row] = column[last]
+            column.pop()
+        if row != last:
+            self._rows[self.ids[row]] = row
+        self.epoch += 1
+
+    def locale_class(self, locale: Optional[str]) -> LocaleClass:
+        """Ranking class of a requested locale: locales the catalog does not target share one."""
+        return self._encode_locale(locale, create=False)
+
+    def locale_classes(self) -> List[LocaleClass]:
+        """Every distinct ranking the catalog can produce."""
+        classes = [NO_LOCALE]
+        classes.extend((-1, code) for code in self._language_codes.values())
+        classes.extend(self._locale_language.items())
+        return classes
+
+    @property
+    def base_key(self) -> Optional[Tuple[int, float]]:
+        """(epoch, recency bucket) of the cached scores, or None."""
+        return self._base_key
+
+    def bucket(self, now: float) -> float:
+        """Recency bucket of a timestamp."""
+        return now - now % self.bucket_seconds
+
+    def top(
+        self, k: int, locale_class: LocaleClass = NO_LOCALE, now: float = 0.0
+    ) -> List[Tuple[str, float]]:
+        """The k best (campaign id, score) pairs for a locale class, best first."""
+        if k <= 0 or not self.ids:
+            return []
+        if self.vectorized:
+            return self._top_numpy(k, locale_class, now)
+        return self._top_python(k, locale_class, now)
+
+    def scores(self, locale_class: LocaleClass = NO_LOCALE, now: float = 0.0) -> List[float]:
+        """Score of every campaign for a locale class, in ``ids`` order."""
+        if not self.ids:
+            return []
+        if self.vectorized:
+            return self._scores_numpy(locale_class, now).tolist()
+        return self._scores_python(locale_class, now)
+
+    def score(self, campaign_id: str, locale_class: LocaleClass = NO_LOCALE) -> float:
+        """Score of one campaign from the cached scores (call ``scores``/``top`` first)."""
+        row = self._rows[campaign_id]
+        score = float(self._base[row])
+        locale_code, language_code = locale_class
+        if language_code >= 0 and self.w_locale:
+            if locale_code >= 0 and self._locale[row] == locale_code:
+                score += self.w_locale
+            elif self._language[row] == language_code:
+                score += self.w_locale * 0.5
+        return score
+
+    def _encode_locale(self, locale: Optional[str], create: bool) -> LocaleClass:
+        if not locale:
+            return NO_LOCALE
+        language = _language(locale)
+        language_code = self._language_codes.get(language, -1)
+        if language_code < 0 and create:
+            language_code = self._language_codes[language] = len(self._language_codes)
+        locale_code = self._locale_codes.get(locale, -1)
+        if locale_code < 0 and create:
+            locale_code = self._locale_codes[locale] = len(self._locale_codes)
+            self._locale_language[locale_code] = language_code
+        return locale_code, language_code
+
+    def _row_base(self, row: int, now: float) -> float:
+        """Locale-independent score of one row (same formula as the bulk pass)."""
+        age = max(now - self._launched[row], 0.0)
+        return (
+            self.w_funded / 100 * self._percent[row]
+            + self.w_raised / (self._top_raised or 1.0) * math.log1p(self._raised[row])
+            + self.w_recency * 0.5 ** (age / self.half_life_seconds)
+        )
+
+    def _top_numpy(self, k: int, locale_class: LocaleClass, now: float) -> List[Tuple[str, float]]:
+        scores = self._scores_numpy(locale_class, now)
+        n = len(scores)
+        if k < n:
+            candidates = np.argpartition(-scores, k - 1)[:k]
+        else:
+            candidates = np.arange(n)
+        ids = self.ids
+        ranked = sorted(((-float(scores[i]), ids[i]) for i in candidates.tolist()))
+        return [(campaign_id, -neg) for neg, campaign_id in ranked]
+
+    def _scores_numpy(self, locale_class: LocaleClass, now: float):
+        key = (self.epoch, self.bucket(now))
+        if self._base_key != key:
+            self._base = self._base_numpy(key[1])
+            self._base_key = key
+
+        scores = self._base
+        locale_code, language_code = locale_class
+        if language_code >= 0 and self.w_locale:
+            # Views over the columns: dropped before the next write resizes them
+            same_language = np.frombuffer(self._language, dtype=np.intc) == language_code
+            affinity = same_language * 0.5
+            if locale_code >= 0:
+                affinity[np.frombuffer(self._locale, dtype=np.intc) == locale_code] = 1.0
+            scores = scores + self.w_locale * affinity
+        return scores
+
+    def _base_numpy(self, now: float):
+        percent = np.frombuffer(self._percent, dtype=np.float64)
+        raised = np.log1p(np.frombuffer(self._raised, dtype=np.float64))
+        launched = np.frombuffer(self._launched, dtype=np.float64)
+        self._top_raised = float(raised.max())
+        age = np.maximum(now - launched, 0.0)
+        return (
+            (self.w_funded / 100) * percent
+            + (self.w_raised / (self._top_raised or 1.0)) * raised
+            + self.w_recency * np.exp2(-age / self.half_life_seconds)
+        )
+
+    def _top_python(self, k: int, locale_class: LocaleClass, now: float) -> List[Tuple[str, float]]:
+        scores = self._scores_python(locale_class, now)
+        ids = self.ids
+        best = heapq.nsmallest(k, range(len(scores)), key=lambda i: (-scores[i], ids[i]))
+        return [(ids[i], scores[i]) for i in best]
+
+    def _scores_python(self, locale_class: LocaleClass, now: float) -> List[float]:
+        key = (self.epoch, self.bucket(now))
+        if self._base_key != key:
+            self._base = self._base_python(key[1])
+            self._base_key = key
+
+        scores = self._base
+        locale_code, language_code = locale_class
+        if language_code >= 0 and self.w_locale:
+            full, half = self.w_locale, self.w_locale * 0.5
+            # -2 never matches a row (rows without a locale are coded -1)
+            exact = locale_code if locale_code >= 0 else -2
+            scores = [
+                score + (full if loc == exact else half if lang == language_code else 0.0)
+                for score, loc, lang in zip(scores, self._locale, self._language)
+            ]
+        return scores
+
+    def _base_python(self, now: float) -> List[float]:
+        raised = [math.log1p(value) for value in self._raised]
+        self._top_raised = max(raised)
+        w_funded = self.w_funded / 100
+        w_raised = self.w_raised / (self._top_raised or 1.0)
+        w_recency = self.w_recency
+        half_life = self.half_life_seconds
+        return [
+            w_funded * percent
+            + w_raised * log_raised
+            + w_recency * 0.5 ** (max(now - launched, 0.0) / half_life)
+            for percent, log_raised, launched in zip(self._percent, raised, self._launched)
+        ]
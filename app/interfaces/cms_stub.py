@@ -1,8 +1,12 @@
 """Stub CMS adapter for MVP."""
 from typing import Dict, List, Optional
 
+from app.core.events import Event, get_event_dispatcher
 from app.modules.landing.domain import CTA, HeroVM, TestimonialVM, ExitIntentCopyVM
 
+# Emitted when landing content is published (payload: locale, cms_etag)
+CMS_PUBLISHED = "cms.published"
+
 
 class CMSStub:
     """Stub implementation of CMS adapter."""
@@ -84,3 +88,15 @@ class CMSStub:
         """Get CMS content etag."""
         content = self.get_published_landing_content(locale)
         return content["cms_etag"]
+
+    def publish(self, locale: Optional[str] = None) -> None:
+        """Announce a publish of landing content (all locales if locale is None)."""
+        get_event_dispatcher().emit(
+            Event(
+                event_type=CMS_PUBLISHED,
+                payload={
+                    "locale": locale,
+                    "cms_etag": self.get_cms_etag(locale) if locale else None,
+                },
+            )
+        )
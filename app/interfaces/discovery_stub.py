@@ -1,54 +1,91 @@
 """Stub Discovery adapter for MVP."""
-from typing import List
+from datetime import timedelta
+from typing import List, Optional
 
+from app.core.events import Event, get_event_dispatcher
+from app.core.utils import utcnow
 from app.modules.landing.domain import StartupCardVM
-from app.core.utils import dict_hash
+
+from .campaign_catalog import CampaignCatalog, get_campaign_catalog
+
+# Emitted when teaser ranking changes (payload: discovery_rev)
+DISCOVERY_RANKING_CHANGED = "discovery.ranking_changed"
+
+# Mock data
+_SEED_CAMPAIGNS = [
+    StartupCardVM(
+        id="camp_001",
+        name="FreshBites",
+        tagline="Farm-to-table meal delivery for busy professionals",
+        raised_cents=75000_00,
+        goal_cents=100000_00,
+        percent_funded=75.0,
+        logo_url="https://via.placeholder.com/100x100?text=FB",
+        cover_url="https://images.unsplash.com/photo-1498837167922-ddd27525d352",
+    ),
+    StartupCardVM(
+        id="camp_002",
+        name="CodeMentor",
+        tagline="1-on-1 coding mentorship for career changers",
+        raised_cents=120000_00,
+        goal_cents=150000_00,
+        percent_funded=80.0,
+        logo_url="https://via.placeholder.com/100x100?text=CM",
+        cover_url="https://images.unsplash.com/photo-1516321318423-f06f85e504b3",
+    ),
+    StartupCardVM(
+        id="camp_003",
+        name="GreenCycle",
+        tagline="Smart recycling solutions for urban communities",
+        raised_cents=45000_00,
+        goal_cents=80000_00,
+        percent_funded=56.25,
+        logo_url="https://via.placeholder.com/100x100?text=GC",
+        cover_url="https://images.unsplash.com/photo-1532996122724-e3c354a0b15b",
+    ),
+]
+
+# Scoring attributes not shown on cards: (days since launch, target locale)
+_SEED_ATTRIBUTES = {
+    "camp_001": (30, "en-US"),
+    "camp_002": (10, "en-US"),
+    "camp_003": (3, "en-US"),
+}
 
 
 class DiscoveryStub:
     """Stub implementation of Discovery adapter."""
 
-    def get_top_campaigns(self, limit: int = 3) -> List[StartupCardVM]:
-        """Get top campaigns for teaser."""
-        # Mock data
-        campaigns = [
-            StartupCardVM(
-                id="camp_001",
-                name="FreshBites",
-                tagline="Farm-to-table meal delivery for busy professionals",
-                raised_cents=75000_00,
-                goal_cents=100000_00,
-                percent_funded=75.0,
-                logo_url="https://via.placeholder.com/100x100?text=FB",
-                cover_url="https://images.unsplash.com/photo-1498837167922-ddd27525d352",
-            ),
-            StartupCardVM(
-                id="camp_002",
-                name="CodeMentor",
-                tagline="1-on-1 coding mentorship for career changers",
-                raised_cents=120000_00,
-                goal_cents=150000_00,
-                percent_funded=80.0,
-                logo_url="https://via.placeholder.com/100x100?text=CM",
-                cover_url="https://images.unsplash.com/photo-1516321318423-f06f85e504b3",
-            ),
-            StartupCardVM(
-                id="camp_003",
-                name="GreenCycle",
-                tagline="Smart recycling solutions for urban communities",
-                raised_cents=45000_00,
-                goal_cents=80000_00,
-                percent_funded=56.25,
-                logo_url="https://via.placeholder.com/100x100?text=GC",
-                cover_url="https://images.unsplash.com/photo-1532996122724-e3c354a0b15b",
-            ),
-        ]
-
-        return campaigns[:limit]
+    def __init__(self, catalog: Optional[CampaignCatalog] = None):
+        self.catalog = catalog if catalog is not None else get_campaign_catalog()
+        if not len(self.catalog):
+            now = utcnow()
+            for card in _SEED_CAMPAIGNS:
+                days, locale = _SEED_ATTRIBUTES[card.id]
+                self.catalog.upsert(card, launched_at=now - timedelta(days=days), locale=locale)
+
+    def get_top_campaigns(
+        self, limit: int = 3, locale: Optional[str] = None
+    ) -> List[StartupCardVM]:
+        """Get top campaigns for teaser, best scoring first."""
+        return self.catalog.teasers(limit, locale)
 
     def get_discovery_revision(self, limit: int = 3) -> str:
-        """Get discovery revision hash based on current campaigns."""
-        campaigns = self.get_top_campaigns(limit)
-        # Create a deterministic hash from campaign data
-        data = {c.id: c.percent_funded for c in campaigns}
-        return dict_hash(data)
+        """Get discovery revision hash based on current top campaigns (all locales)."""
+        return self.catalog.teaser_revision(limit)
+
+    def record_funding(self, campaign_id: str, delta_cents: int, limit: int = 3) -> None:
+        """Apply a funding delta; announce a ranking change if the teaser changed."""
+        before = self.get_discovery_revision(limit)
+        self.catalog.apply_funding_delta(campaign_id, delta_cents)
+        if self.get_discovery_revision(limit) != before:
+            self.notify_ranking_changed(limit)
+
+    def notify_ranking_changed(self, limit: int = 3) -> None:
+        """Announce that the top campaigns or their funding changed."""
+        get_event_dispatcher().emit(
+            Event(
+                event_type=DISCOVERY_RANKING_CHANGED,
+                payload={"discovery_rev": self.get_discovery_revision(limit)},
+            )
+        )
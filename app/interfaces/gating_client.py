@@ -0,0 +1,174 @@
+"""Gating client with local rule evaluation and a per-session decision cache.
+
+Decisions are resolved in this order:
+
+1. Local rules: compiled from the rule set Gating publishes
+   (``gating.rules_published``, or pulled at startup). No network.
+2. Decision cache: per-session, short TTL, bounded by session count (LRU).
+3. Remote: every rule still unresolved goes out in one ``evaluate_rules``
+   batch call, and the results are cached.
+
+Rule spec (all keys optional)::
+
+    {"enabled": true, "rollout_percent": 100, "require_session": false}
+
+``rollout_percent`` buckets sessions stably by hashing rule name and session.
+"""
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.events import Event, EventDispatcher, get_event_dispatcher
+from app.core.telemetry import logger
+
+from .gating_stub import GATING_RULES_PUBLISHED, GatingStub
+
+EXIT_INTENT_RULE = "landing.exit_intent"
+
+CompiledRule = Callable[[Optional[str]], bool]
+
+
+def compile_rule(rule_name: str, spec: Dict) -> CompiledRule:
+    """Compile a rule spec into a predicate over the session ID."""
+    enabled = bool(spec.get("enabled", True))
+    rollout = int(spec.get("rollout_percent", 100))
+    require_session = bool(spec.get("require_session", False))
+    salt = f"{rule_name}:".encode()
+
+    if not enabled or rollout <= 0:
+        return lambda session_id: False
+
+    def evaluate(session_id: Optional[str]) -> bool:
+        if session_id is None:
+            # Anonymous requests cannot be bucketed: only full rollouts apply
+            return not require_session and rollout >= 100
+        if rollout >= 100:
+            return True
+        return zlib.crc32(salt + session_id.encode()) % 100 < rollout
+
+    return evaluate
+
+
+class GatingClient:
+    """Gating adapter that keeps rule evaluation off the network where possible."""
+
+    def __init__(
+        self,
+        remote: Optional[GatingStub] = None,
+        ttl_seconds: Optional[int] = None,
+        max_sessions: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.remote = remote or GatingStub()
+        self.ttl_seconds = (
+            settings.gating_decision_ttl_seconds if ttl_seconds is None else ttl_seconds
+        )
+        # 0 disables the per-session decision cache
+        self.max_sessions = (
+            settings.gating_decision_cache_size if max_sessions is None else max_sessions
+        )
+        self.rule_set_version: Optional[str] = None
+        self._rules: Dict[str, CompiledRule] = {}
+        # session_id -> {rule_name: (decision, expires_at)}
+        self._decisions: "OrderedDict[Optional[str], Dict[str, Tuple[bool, float]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def load_rule_set(self, version: str, rules: Dict[str, Dict]) -> None:
+        """Compile and swap in a rule set; cached remote decisions for it are dropped."""
+        compiled = {name: compile_rule(name, spec) for name, spec in rules.items()}
+        with self._lock:
+            self._rules = compiled
+            self.rule_set_version = version
+            self._decisions.clear()
+        logger.info("Gating rule set %s loaded (%d rules)", version, len(compiled))
+
+    def refresh_rule_set(self) -> None:
+        """Pull the current rule set from Gating, if it offers one."""
+        get_rule_set = getattr(self.remote, "get_rule_set", None)
+        if get_rule_set is None:
+            return
+        try:
+            rule_set = get_rule_set()
+        except Exception as e:
+            logger.warning("Could not load gating rule set: %s", e)
+            return
+        self.load_rule_set(rule_set["version"], rule_set["rules"])
+
+    def on_rules_published(self, event: Event) -> None:
+        """Handle gating.rules_published."""
+        self.load_rule_set(event.payload["version"], event.payload["rules"])
+
+    def evaluate_rules(
+        self, rule_names: Iterable[str], session_id: Optional[str] = None
+    ) -> Dict[str, bool]:
+        """Evaluate several rules, using at most one remote call."""
+        results: Dict[str, bool] = {}
+        missing = []
+        now = time.monotonic()
+        rules = self._rules
+
+        with self._lock:
+            cached = self._decisions.get(session_id)
+            if cached is not None:
+                self._decisions.move_to_end(session_id)
+            for name in rule_names:
+                rule = rules.get(name)
+                if rule is not None:
+                    results[name] = rule(session_id)
+                    continue
+                entry = cached.get(name) if cached else None
+                if entry is not None and entry[1] > now:
+                    results[name] = entry[0]
+                else:
+                    missing.append(name)
+
+        if missing:
+            fetched = self.remote.evaluate_rules(missing, session_id)
+            results.update(fetched)
+            if self.ttl_seconds > 0 and self.max_sessions > 0:
+                self._store(session_id, fetched, now + self.ttl_seconds)
+        return results
+
+    def _store(
+        self, session_id: Optional[str], decisions: Dict[str, bool], expires_at: float
+    ) -> None:
+        with self._lock:
+            entry = self._decisions.get(session_id)
+            if entry is None:
+                entry = self._decisions[session_id] = {}
+                if len(self._decisions) > self.max_sessions:
+                    self._decisions.popitem(last=False)
+            for name, decision in decisions.items():
+                entry[name] = (decision, expires_at)
+
+    def evaluate_rule(self, rule_name: str, session_id: Optional[str] = None) -> bool:
+        """Evaluate a single gating rule."""
+        return self.evaluate_rules((rule_name,), session_id)[rule_name]
+
+    def can_show_exit_intent(self, session_id: Optional[str] = None) -> bool:
+        """Check if exit intent can be shown."""
+        return self.evaluate_rule(EXIT_INTENT_RULE, session_id)
+
+
+@lru_cache
+def get_gating_client() -> GatingClient:
+    """Get singleton gating client."""
+    return GatingClient()
+
+
+def register_gating_event_handlers(
+    dispatcher: Optional[EventDispatcher] = None,
+    client: Optional[GatingClient] = None,
+) -> GatingClient:
+    """Load the current rule set and subscribe to rule set publishes."""
+    dispatcher = dispatcher or get_event_dispatcher()
+    client = client or get_gating_client()
+    client.refresh_rule_set()
+    dispatcher.register(GATING_RULES_PUBLISHED, client.on_rules_published)
+    return client
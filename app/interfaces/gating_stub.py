@@ -1,5 +1,8 @@
 """Stub Gating adapter for MVP."""
-from typing import Optional
+from typing import Dict, Iterable, Optional
+
+# Emitted when Gating publishes a new compiled rule set (payload: version, rules)
+GATING_RULES_PUBLISHED = "gating.rules_published"
 
 
 class GatingStub:
@@ -16,6 +19,21 @@ class GatingStub:
         # Default to allowing
         return True
 
+    def evaluate_rules(
+        self, rule_names: Iterable[str], session_id: Optional[str] = None
+    ) -> Dict[str, bool]:
+        """Evaluate several rules in one call."""
+        return {name: self.evaluate_rule(name, session_id) for name in rule_names}
+
+    def get_rule_set(self) -> Dict:
+        """Get the current rule set for local evaluation."""
+        return {
+            "version": "rules_v1",
+            "rules": {
+                "landing.exit_intent": {"enabled": True, "rollout_percent": 100},
+            },
+        }
+
     def can_show_exit_intent(self, session_id: Optional[str] = None) -> bool:
         """Check if exit intent can be shown."""
         return self.evaluate_rule("landing.exit_intent", session_id)
@@ -0,0 +1,88 @@
+"""Tests for the teaser-ranked campaign catalog and Discovery adapter."""
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.core.events import EventDispatcher
+from app.interfaces.campaign_catalog import CampaignCatalog
+from app.interfaces.campaign_scoring import CampaignScorer
+from app.interfaces.discovery_stub import DISCOVERY_RANKING_CHANGED, DiscoveryStub
+from app.modules.landing.domain import StartupCardVM
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_funding_updates_keep_heads_equal_to_full_scoring():
+    """Test incrementally updated heads match a fresh scoring pass, without rebuilds."""
+    rng = random.Random(5)
+    catalog = CampaignCatalog(capacity=5)
+    attributes = {}
+    for i in range(100):
+        goal = rng.randrange(10000_00, 90000_00)
+        card = StartupCardVM(
+            id=f"c{i}", name=f"C{i}", raised_cents=0, goal_cents=goal, percent_funded=0.0
+        )
+        attributes[card.id] = (
+            NOW - timedelta(days=rng.uniform(0, 60)), rng.choice(["en-US", "de-DE", None])
+        )
+        catalog.upsert(card, *attributes[card.id])
+    # One large campaign holds the maximum raised, so pledges elsewhere stay local
+    catalog.apply_funding_delta("c0", 100000_00)
+    now = NOW.timestamp()
+    catalog.teasers(5, "en-US", now)
+    epoch = catalog.scorer.epoch
+
+    for _ in range(300):
+        catalog.apply_funding_delta(f"c{rng.randrange(1, 100)}", rng.randrange(1, 500_00))
+        catalog.teasers(5, "de-DE", now)
+    assert catalog.scorer.epoch == epoch
+
+    fresh = CampaignScorer()
+    for campaign_id, (launched_at, locale) in attributes.items():
+        card = catalog.get(campaign_id)
+        fresh.set(campaign_id, card.percent_funded, card.raised_cents, launched_at, locale)
+    for locale in ("en-US", "de-DE", None):
+        expected = [key for key, _ in fresh.top(5, fresh.locale_class(locale), now)]
+        assert [c.id for c in catalog.teasers(5, locale, now)] == expected
+
+
+def test_discovery_teasers_weigh_recency():
+    """Test teaser scoring lets a recent launch overtake an older, better funded one."""
+    discovery = DiscoveryStub(catalog=CampaignCatalog(capacity=10))
+
+    assert [c.id for c in discovery.get_top_campaigns(3)] == ["camp_002", "camp_003", "camp_001"]
+    assert [c.id for c in discovery.get_top_campaigns(3, locale="de-DE")] == [
+        "camp_002",
+        "camp_003",
+        "camp_001",
+    ]
+
+
+def test_funding_delta_reorders_and_announces(monkeypatch):
+    """Test a pledge that changes the teaser emits a ranking change."""
+    dispatcher = EventDispatcher()
+    events = []
+    dispatcher.register(DISCOVERY_RANKING_CHANGED, events.append)
+    monkeypatch.setattr("app.interfaces.discovery_stub.get_event_dispatcher", lambda: dispatcher)
+    discovery = DiscoveryStub(catalog=CampaignCatalog(capacity=10))
+    before = discovery.get_discovery_revision()
+
+    # GreenCycle: 45,000 -> 78,000 of 80,000 (97.5%)
+    discovery.record_funding("camp_003", 33000_00)
+
+    assert discovery.get_top_campaigns(1)[0].id == "camp_003"
+    assert discovery.get_top_campaigns(1)[0].percent_funded == 97.5
+    assert [e.payload["discovery_rev"] for e in events] == [discovery.get_discovery_revision()]
+    assert discovery.get_discovery_revision() != before
+
+
+def test_revision_covers_card_funding_without_reordering():
+    """Test a pledge that keeps the teaser order still changes the revision."""
+    discovery = DiscoveryStub(catalog=CampaignCatalog(capacity=10))
+    order = [c.id for c in discovery.get_top_campaigns(3)]
+    before = discovery.get_discovery_revision()
+
+    # CodeMentor: 80.0% -> 80.67%, still first
+    discovery.record_funding("camp_002", 1000_00)
+
+    assert [c.id for c in discovery.get_top_campaigns(3)] == order
+    assert discovery.get_discovery_revision() != before
@@ -0,0 +1,78 @@
+"""Tests for columnar campaign scoring."""
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.interfaces.campaign_scoring import NO_LOCALE, CampaignScorer
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _scorer(**kwargs) -> CampaignScorer:
+    scorer = CampaignScorer(**kwargs)
+    scorer.set("us_old", 90.0, 90000_00, NOW - timedelta(days=60), "en-US")
+    scorer.set("gb_new", 60.0, 30000_00, NOW - timedelta(days=1), "en-GB")
+    scorer.set("de_mid", 70.0, 50000_00, NOW - timedelta(days=7), "de-DE")
+    scorer.set("unknown", 80.0, 10000_00)
+    return scorer
+
+
+def _ids(scorer, k, locale=None):
+    return [key for key, _ in scorer.top(k, scorer.locale_class(locale), NOW.timestamp())]
+
+
+def test_locale_affinity_boosts_matching_campaigns():
+    """Test exact locale beats same language, which beats no match."""
+    scorer = _scorer(weights={"funded": 0.0, "raised": 0.0, "recency": 0.0, "locale": 1.0})
+
+    assert _ids(scorer, 2, "en-GB") == ["gb_new", "us_old"]
+    assert _ids(scorer, 1, "de-DE") == ["de_mid"]
+    # Locales the catalog does not target share the language-level ranking
+    assert scorer.locale_class("en-AU") == (-1, scorer.locale_class("en-US")[1])
+    assert scorer.locale_class("fr-FR") == NO_LOCALE
+
+
+def test_recency_decays_with_half_life():
+    """Test a campaign one half-life old gets half the recency score."""
+    scorer = CampaignScorer(
+        weights={"funded": 0.0, "raised": 0.0, "recency": 1.0, "locale": 0.0}, half_life_days=7
+    )
+    scorer.set("fresh", 0.0, 0, NOW)
+    scorer.set("week", 0.0, 0, NOW - timedelta(days=7))
+
+    assert scorer.top(2, now=NOW.timestamp()) == [("fresh", 1.0), ("week", 0.5)]
+
+
+def test_remove_moves_last_row():
+    """Test removal keeps the remaining rows addressable."""
+    scorer = _scorer()
+    scorer.remove("us_old")
+    scorer.set_funding("unknown", 100.0, 99000_00)
+
+    assert len(scorer) == 3
+    assert _ids(scorer, 1) == ["unknown"]
+
+
+def test_vectorized_matches_pure_python():
+    """Test NumPy and fallback scoring agree."""
+    pytest.importorskip("numpy")
+    rng = random.Random(3)
+    scorers = [CampaignScorer(vectorized=True), CampaignScorer(vectorized=False)]
+    for i in range(500):
+        args = (
+            f"c{i}",
+            rng.uniform(0, 100),
+            rng.randrange(10**8),
+            NOW - timedelta(days=rng.uniform(0, 90)),
+            rng.choice(["en-US", "en-GB", "de-DE", None]),
+        )
+        for scorer in scorers:
+            scorer.set(*args)
+
+    for locale in (None, "en-US", "en-AU", "de-DE"):
+        fast, slow = (
+            scorer.top(10, scorer.locale_class(locale), NOW.timestamp()) for scorer in scorers
+        )
+        assert [key for key, _ in fast] == [key for key, _ in slow]
+        assert [score for _, score in fast] == pytest.approx([score for _, score in slow])
@@ -0,0 +1,77 @@
+"""Tests for the gating client."""
+from unittest.mock import Mock
+
+import pytest
+
+from app.core.events import Event, EventDispatcher
+from app.interfaces.gating_client import (
+    GatingClient,
+    compile_rule,
+    register_gating_event_handlers,
+)
+from app.interfaces.gating_stub import GATING_RULES_PUBLISHED
+
+
+@pytest.fixture
+def remote():
+    """Remote gating adapter answering every rule with True."""
+    remote = Mock(spec=["evaluate_rules"])
+    remote.evaluate_rules.side_effect = lambda names, session_id: {n: True for n in names}
+    return remote
+
+
+def test_remote_decisions_batched_and_cached(remote):
+    """Test misses go out in one batch call and are then served from cache."""
+    client = GatingClient(remote=remote, ttl_seconds=30, max_sessions=10)
+
+    assert client.evaluate_rules(["a", "b"], "s1") == {"a": True, "b": True}
+    assert client.evaluate_rules(["a", "b"], "s1") == {"a": True, "b": True}
+    remote.evaluate_rules.assert_called_once_with(["a", "b"], "s1")
+
+
+def test_decision_cache_bounded_by_sessions(remote):
+    """Test least recently used sessions are evicted."""
+    client = GatingClient(remote=remote, ttl_seconds=30, max_sessions=2)
+    for session in ("s1", "s2", "s3"):
+        client.evaluate_rule("a", session)
+
+    client.evaluate_rule("a", "s1")
+
+    assert remote.evaluate_rules.call_count == 4
+
+
+def test_zero_max_sessions_disables_cache(remote):
+    """Test an explicit max_sessions=0 is not replaced by the settings default."""
+    client = GatingClient(remote=remote, ttl_seconds=30, max_sessions=0)
+    client.evaluate_rule("a", "s1")
+    client.evaluate_rule("a", "s1")
+
+    assert remote.evaluate_rules.call_count == 2
+
+
+def test_local_rules_skip_remote(remote):
+    """Test rules from a published rule set are evaluated locally."""
+    client = GatingClient(remote=remote, ttl_seconds=30, max_sessions=10)
+    dispatcher = EventDispatcher()
+    register_gating_event_handlers(dispatcher, client)
+
+    dispatcher.emit(
+        Event(
+            event_type=GATING_RULES_PUBLISHED,
+            payload={"version": "v2", "rules": {"landing.exit_intent": {"enabled": False}}},
+        )
+    )
+
+    assert client.can_show_exit_intent("s1") is False
+    assert client.rule_set_version == "v2"
+    remote.evaluate_rules.assert_not_called()
+
+
+def test_rollout_is_stable_per_session():
+    """Test percentage rollouts bucket sessions deterministically."""
+    rule = compile_rule("landing.exit_intent", {"rollout_percent": 50})
+    decisions = [rule(f"session-{i}") for i in range(1000)]
+
+    assert decisions == [rule(f"session-{i}") for i in range(1000)]
+    assert 400 < sum(decisions) < 600
+    assert rule(None) is False
@@ -2,13 +2,25 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
 from app.core.config import get_settings
-from app.core.db import init_db, close_db
+from app.core.db import init_db, close_db, get_statement_timer, register_pool_metrics
 from app.core.http import create_app
-from app.core.telemetry import setup_logging, logger
+from app.core.http.admin_router import router as admin_router
+from app.core.telemetry import get_metrics_registry, get_profiler, setup_logging, shutdown_logging, logger
+from app.interfaces.gating_client import register_gating_event_handlers
 from app.modules.landing.migrations import run_migrations as run_landing_migrations
+from app.modules.landing.routers import internal_router as landing_internal_router
 from app.modules.landing.routers import router as landing_router
+from app.modules.landing.services import (
+    register_landing_event_handlers,
+    register_landing_metrics,
+    start_analytics_rollup,
+    start_cache_janitor,
+    stop_analytics_rollup,
+    stop_landing_event_handlers,
+)
 
 
 @asynccontextmanager
@@ -17,7 +29,7 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting LendCommunity application...")
     settings = get_settings()
-    logger.info(f"Environment: debug={settings.debug}")
+    logger.info("Environment: debug=%s", settings.debug)
 
     # Initialize database
     init_db()
@@ -34,11 +46,33 @@ async def lifespan(app: FastAPI):
     finally:
         db.close()
 
+    # Scrape-time gauges (pool stats, email buffer depth, cache hit ratio)
+    register_pool_metrics()
+    register_landing_metrics()
+
+    # Subscribe to upstream change events (CMS publish, Discovery re-rank,
+    # Gating rule sets)
+    register_landing_event_handlers()
+    register_gating_event_handlers()
+
+    # Background cleanup of the assembly cache table
+    janitor_task = start_cache_janitor()
+
+    # Per-minute analytics counters flushed to landing_analytics_rollup
+    rollup_task = start_analytics_rollup()
+
     yield
 
     # Shutdown
     logger.info("Shutting down LendCommunity application...")
+    if janitor_task:
+        janitor_task.cancel()
+    get_profiler().stop()
+    get_statement_timer().disable()
+    stop_analytics_rollup(rollup_task)
+    stop_landing_event_handlers()
     close_db()
+    shutdown_logging()
 
 
 def create_application() -> FastAPI:
@@ -55,6 +89,10 @@ def create_application() -> FastAPI:
     # Register module routers
     app.include_router(landing_router)
 
+    # Admin diagnostics and internal reports (disabled unless ADMIN_TOKEN is set)
+    app.include_router(admin_router)
+    app.include_router(landing_internal_router)
+
     # Root endpoint
     @app.get("/")
     async def root():
@@ -71,6 +109,16 @@ def create_application() -> FastAPI:
         """Health check endpoint."""
         return {"status": "ok"}
 
+    # Plain def: scrape-time collectors query the database, so render in the
+    # threadpool rather than blocking the event loop
+    @app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+    def metrics():
+        """Prometheus metrics endpoint."""
+        return PlainTextResponse(
+            get_metrics_registry().render(),
+            media_type="text/plain; version=0.0.4",
+        )
+
     logger.info("Application created and configured")
     return app
 
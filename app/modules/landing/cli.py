@@ -0,0 +1,114 @@
+"""Landing module command line tools.
+
+    python -m app.modules.landing.cli publish-snapshots [--locale en-US ...] [--workers 4]
+    python -m app.modules.landing.cli export-emails [--format csv|ndjson] [--gzip]
+        [--status new] [--source hero] [--since 2024-01-01] [--until ...] [--output FILE]
+"""
+import argparse
+import sys
+from datetime import datetime
+from typing import List, Optional, get_args
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal, init_db
+from app.core.telemetry import setup_logging, shutdown_logging
+from app.core.utils import naive_utc
+from app.modules.landing.domain import EmailSource, EmailStatus
+from app.modules.landing.migrations import run_migrations
+from app.modules.landing.services import EXPORT_FORMATS, EmailExportService, publish_snapshots
+
+
+def prepare_database() -> None:
+    """Create tables and apply landing migrations, as the app lifespan does."""
+    init_db()
+    db = SessionLocal()
+    try:
+        run_migrations(db)
+    finally:
+        db.close()
+
+
+def utc_datetime(value: str) -> datetime:
+    """ISO 8601 argument as naive UTC; values with an offset are converted."""
+    return naive_utc(datetime.fromisoformat(value))
+
+
+def publish_snapshots_command(args: argparse.Namespace) -> int:
+    """Publish snapshots; exit status 1 if any locale could not be published."""
+    snapshots = publish_snapshots(args.locale, workers=args.workers)
+    failed = 0
+    for locale, snapshot in snapshots.items():
+        if snapshot is None:
+            failed += 1
+            print(f"{locale}: not published")
+        else:
+            encodings = ", ".join(sorted(snapshot.files))
+            print(f"{locale}: {snapshot.etag} ({encodings})")
+    return 1 if failed else 0
+
+
+def export_emails_command(args: argparse.Namespace) -> int:
+    """Stream the email buffer export to a file or stdout."""
+    chunks = EmailExportService().stream(
+        args.format, args.gzip, args.status, args.source, args.since, args.until
+    )
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+        out.flush()
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.modules.landing.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    publish = commands.add_parser(
+        "publish-snapshots", help="Rebuild the static landing page snapshots"
+    )
+    publish.add_argument(
+        "--locale",
+        action="append",
+        help="Locale to publish (repeatable; default: SNAPSHOT_LOCALES or SUPPORTED_LOCALES)",
+    )
+    publish.add_argument(
+        "--workers",
+        type=int,
+        default=get_settings().snapshot_workers,
+        help="Snapshots compressed and written in parallel",
+    )
+    publish.set_defaults(handler=publish_snapshots_command)
+
+    export = commands.add_parser(
+        "export-emails", help="Stream the email buffer as CSV or NDJSON"
+    )
+    export.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    export.add_argument("--gzip", action="store_true", help="Gzip the output")
+    export.add_argument("--status", choices=get_args(EmailStatus))
+    export.add_argument("--source", choices=get_args(EmailSource))
+    export.add_argument(
+        "--since", type=utc_datetime, help="created_at lower bound (UTC, inclusive)"
+    )
+    export.add_argument(
+        "--until", type=utc_datetime, help="created_at upper bound (UTC, exclusive)"
+    )
+    export.add_argument("--output", help="File to write (default: stdout)")
+    export.set_defaults(handler=export_emails_command)
+
+    args = parser.parse_args(argv)
+    # Application logs go to stdout: keep them out of an export written there
+    if not (args.command == "export-emails" and not args.output):
+        setup_logging()
+    try:
+        prepare_database()
+        return args.handler(args)
+    finally:
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
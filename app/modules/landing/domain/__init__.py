@@ -4,18 +4,30 @@ from .models import (
     CTAAction,
     CTAClickRequest,
     CTAClickResponse,
+    AnalyticsBatchResponse,
+    AnalyticsEventIn,
+    CTAClickEventIn,
+    ExitIntentShownEventIn,
+    ImpressionEventIn,
     EmailSource,
     EmailStatus,
     ExitIntentCopyVM,
     HeroVM,
     JoinEmailRequest,
     JoinEmailResponse,
+    LANDING_SECTIONS,
     LandingPageVM,
+    LandingSection,
+    LandingSectionsVM,
+    LandingSessionVM,
     StartupCardVM,
     TeaserSectionVM,
     TestimonialVM,
     AssemblyCacheEntry,
+    CacheJanitorReport,
     EmailBufferEntry,
+    ReachEventType,
+    ReachReport,
     LandingImpressionEvent,
     LandingCTAClickEvent,
     LandingExitIntentShownEvent,
@@ -27,18 +39,30 @@ __all__ = [
     "CTAAction",
     "CTAClickRequest",
     "CTAClickResponse",
+    "AnalyticsBatchResponse",
+    "AnalyticsEventIn",
+    "CTAClickEventIn",
+    "ExitIntentShownEventIn",
+    "ImpressionEventIn",
     "EmailSource",
     "EmailStatus",
     "ExitIntentCopyVM",
     "HeroVM",
     "JoinEmailRequest",
     "JoinEmailResponse",
+    "LANDING_SECTIONS",
     "LandingPageVM",
+    "LandingSection",
+    "LandingSectionsVM",
+    "LandingSessionVM",
     "StartupCardVM",
     "TeaserSectionVM",
     "TestimonialVM",
     "AssemblyCacheEntry",
+    "CacheJanitorReport",
     "EmailBufferEntry",
+    "ReachEventType",
+    "ReachReport",
     "LandingImpressionEvent",
     "LandingCTAClickEvent",
     "LandingExitIntentShownEvent",
@@ -1,6 +1,6 @@
 """Domain models and view models for Landing module."""
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import Annotated, Dict, List, Literal, Optional, Union
 
 from pydantic import AnyUrl, BaseModel, EmailStr, Field
 
@@ -8,6 +8,8 @@ from pydantic import AnyUrl, BaseModel, EmailStr, Field
 CTAAction = Literal["open_signup", "open_browse", "custom_url"]
 EmailSource = Literal["hero", "exit_intent", "footer"]
 EmailStatus = Literal["new", "synced", "error"]
+LandingSection = Literal["hero", "teaser", "testimonials", "disclaimers", "exit_intent"]
+LANDING_SECTIONS = ("hero", "teaser", "testimonials", "disclaimers", "exit_intent")
 
 
 # ==================== View Models (DTOs) ====================
@@ -84,6 +86,28 @@ class LandingPageVM(BaseModel):
     testimonials: List[TestimonialVM]
     disclaimers_html: Optional[str] = None
     exit_intent: Optional[ExitIntentCopyVM] = None
+    # Per-section etags, so clients can refetch only changed sections
+    section_etags: Dict[LandingSection, str] = {}
+
+
+class LandingSectionsVM(BaseModel):
+    """Subset of landing page sections (``GET /page?sections=...``)."""
+
+    locale: str
+    version: int
+    etag: str  # composite of the requested sections' etags
+    section_etags: Dict[LandingSection, str]
+    hero: Optional[HeroVM] = None
+    teaser: Optional[TeaserSectionVM] = None
+    testimonials: Optional[List[TestimonialVM]] = None
+    disclaimers_html: Optional[str] = None
+    exit_intent: Optional[ExitIntentCopyVM] = None
+
+
+class LandingSessionVM(BaseModel):
+    """Per-session landing state, kept out of shared-cacheable page bodies."""
+
+    can_show_exit_intent: bool
 
 
 # ==================== Request/Response Models ====================
@@ -124,6 +148,50 @@ class CTAClickResponse(BaseModel):
     ok: bool
 
 
+class ImpressionEventIn(BaseModel):
+    """Client-side impression in an analytics batch."""
+
+    type: Literal["impression"]
+    locale: str = "en-US"
+    section: Optional[str] = None  # e.g. "teaser"; None for the whole page
+    cms_version: Optional[int] = None
+    etag: Optional[str] = None
+    session_id: Optional[str] = None
+
+
+class CTAClickEventIn(BaseModel):
+    """CTA click in an analytics batch."""
+
+    type: Literal["cta_click"]
+    placement: str
+    label: str
+    action: CTAAction
+    locale: str = "en-US"
+    session_id: Optional[str] = None
+
+
+class ExitIntentShownEventIn(BaseModel):
+    """Exit intent modal shown, in an analytics batch."""
+
+    type: Literal["exit_intent_shown"]
+    locale: str = "en-US"
+    session_id: Optional[str] = None
+
+
+AnalyticsEventIn = Annotated[
+    Union[ImpressionEventIn, CTAClickEventIn, ExitIntentShownEventIn],
+    Field(discriminator="type"),
+]
+
+
+class AnalyticsBatchResponse(BaseModel):
+    """Analytics batch ingestion response."""
+
+    ok: bool
+    accepted: int
+    rejected: int
+
+
 # ==================== Event Payloads ====================
 
 
@@ -173,6 +241,26 @@ class JoinSubmitEvent(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
+# ==================== Internal Reports ====================
+
+
+ReachEventType = Literal["landing.impression", "landing.exit_intent_shown"]
+
+
+class ReachReport(BaseModel):
+    """Estimated unique sessions over a time range (HyperLogLog)."""
+
+    event_type: ReachEventType
+    since: datetime
+    until: datetime
+    locale: Optional[str] = None
+    etag: Optional[str] = None
+    unique_sessions: int
+    relative_error: float  # standard error of each estimate, as a fraction
+    sketches: int  # stored sketches merged
+    groups: Optional[Dict[str, int]] = None  # unique sessions per group_by value
+
+
 # ==================== Database Models ====================
 
 
@@ -183,11 +271,25 @@ class AssemblyCacheEntry(BaseModel):
     locale: str
     cms_etag: str
     discovery_rev: str
-    payload_json: str
+    payload_hash: Optional[str] = None  # landing_cache_blobs row holding the payload
+    payload_json: Optional[Union[str, bytes]] = None  # inline payload of pre-blob rows
     expires_at: datetime
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class CacheJanitorReport(BaseModel):
+    """Outcome of one cache janitor run."""
+
+    expired_rows: int = 0
+    expired_bytes: int = 0
+    evicted_rows: int = 0
+    evicted_bytes: int = 0
+    touched_keys: int = 0
+    remaining_rows: int = 0
+    remaining_bytes: int = 0
+    duration_ms: float = 0.0
+
+
 class EmailBufferEntry(BaseModel):
     """Email buffer entry."""
 
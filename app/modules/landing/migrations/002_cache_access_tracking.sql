@@ -0,0 +1,8 @@
+-- Landing module: assembly cache access tracking
+-- Lets the cache janitor evict least-recently-used entries when the table
+-- exceeds its row/byte caps. Rows written before this migration have a NULL
+-- last_accessed_at and are evicted first.
+
+ALTER TABLE landing_assembly_cache ADD COLUMN last_accessed_at DATETIME;
+
+CREATE INDEX IF NOT EXISTS idx_landing_cache_lru ON landing_assembly_cache(last_accessed_at);
@@ -0,0 +1,17 @@
+-- Landing module: pre-aggregated analytics counters
+-- One row per (bucket, event type, dimensions). The rollup aggregator adds
+-- to count with an upsert, so rows grow with distinct dimensions, not
+-- traffic. Absent dimensions are stored as '' / 0 so the key stays unique.
+
+CREATE TABLE IF NOT EXISTS landing_analytics_rollup (
+  bucket_start  DATETIME NOT NULL,
+  event_type    TEXT NOT NULL,
+  locale        TEXT NOT NULL DEFAULT '',
+  cms_version   INTEGER NOT NULL DEFAULT 0,
+  etag          TEXT NOT NULL DEFAULT '',
+  placement     TEXT NOT NULL DEFAULT '',
+  action        TEXT NOT NULL DEFAULT '',
+  count         INTEGER NOT NULL DEFAULT 0,
+  updated_at    DATETIME DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (bucket_start, event_type, locale, cms_version, etag, placement, action)
+) WITHOUT ROWID;
@@ -0,0 +1,15 @@
+-- Landing module: unique-session reach sketches
+-- One HyperLogLog sketch (precision byte + zlib-compressed registers) per
+-- (bucket, event type, locale, etag). Flushes from every worker merge into
+-- the stored sketch with the hll_merge() SQL function the repository
+-- registers, so storage is fixed per key whatever the traffic.
+
+CREATE TABLE IF NOT EXISTS landing_reach_sketches (
+  bucket_start  DATETIME NOT NULL,
+  event_type    TEXT NOT NULL,
+  locale        TEXT NOT NULL DEFAULT '',
+  etag          TEXT NOT NULL DEFAULT '',
+  sketch        BLOB NOT NULL,
+  updated_at    DATETIME DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (bucket_start, event_type, locale, etag)
+) WITHOUT ROWID;
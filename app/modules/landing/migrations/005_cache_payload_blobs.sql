@@ -0,0 +1,72 @@
+-- Landing module: content-addressed assembly cache payloads
+-- Payloads are stored once in landing_cache_blobs, keyed by a hash of their
+-- content. Cache rows reference a blob through payload_hash. Triggers keep
+-- refcount equal to the number of referencing rows and delete a blob when
+-- its last reference goes, whichever code path removes the row.
+-- payload_json becomes nullable and only holds the inline payload of rows
+-- written before this migration. The table is rebuilt to relax the column.
+
+CREATE TABLE IF NOT EXISTS landing_cache_blobs (
+  payload_hash  TEXT PRIMARY KEY,
+  payload       BLOB NOT NULL,
+  refcount      INTEGER NOT NULL DEFAULT 0,
+  created_at    DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE landing_assembly_cache_new (
+  id               INTEGER PRIMARY KEY,
+  locale           TEXT NOT NULL,
+  cms_etag         TEXT NOT NULL,
+  discovery_rev    TEXT NOT NULL,
+  payload_hash     TEXT REFERENCES landing_cache_blobs(payload_hash),
+  payload_json     TEXT,
+  expires_at       DATETIME NOT NULL,
+  created_at       DATETIME DEFAULT CURRENT_TIMESTAMP,
+  last_accessed_at DATETIME,
+  UNIQUE(locale, cms_etag, discovery_rev)
+);
+
+INSERT INTO landing_assembly_cache_new
+  (id, locale, cms_etag, discovery_rev, payload_json, expires_at, created_at, last_accessed_at)
+SELECT id, locale, cms_etag, discovery_rev, payload_json, expires_at, created_at, last_accessed_at
+FROM landing_assembly_cache;
+
+DROP TABLE landing_assembly_cache;
+
+ALTER TABLE landing_assembly_cache_new RENAME TO landing_assembly_cache;
+
+CREATE INDEX IF NOT EXISTS idx_landing_cache_exp ON landing_assembly_cache(expires_at);
+
+CREATE INDEX IF NOT EXISTS idx_landing_cache_lru ON landing_assembly_cache(last_accessed_at);
+
+CREATE INDEX IF NOT EXISTS idx_landing_cache_hash ON landing_assembly_cache(payload_hash);
+
+CREATE TRIGGER IF NOT EXISTS landing_cache_blob_ref
+AFTER INSERT ON landing_assembly_cache
+WHEN NEW.payload_hash IS NOT NULL
+BEGIN
+  UPDATE landing_cache_blobs SET refcount = refcount + 1
+  WHERE payload_hash = NEW.payload_hash;
+END;
+
+CREATE TRIGGER IF NOT EXISTS landing_cache_blob_unref
+AFTER DELETE ON landing_assembly_cache
+WHEN OLD.payload_hash IS NOT NULL
+BEGIN
+  UPDATE landing_cache_blobs SET refcount = refcount - 1
+  WHERE payload_hash = OLD.payload_hash;
+  DELETE FROM landing_cache_blobs
+  WHERE payload_hash = OLD.payload_hash AND refcount <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS landing_cache_blob_reref
+AFTER UPDATE OF payload_hash ON landing_assembly_cache
+WHEN OLD.payload_hash IS NOT NEW.payload_hash
+BEGIN
+  UPDATE landing_cache_blobs SET refcount = refcount + 1
+  WHERE payload_hash = NEW.payload_hash;
+  UPDATE landing_cache_blobs SET refcount = refcount - 1
+  WHERE payload_hash = OLD.payload_hash;
+  DELETE FROM landing_cache_blobs
+  WHERE payload_hash = OLD.payload_hash AND refcount <= 0;
+END;
@@ -1,6 +1,7 @@
 """Migration runner for landing module."""
+import sqlite3
 from pathlib import Path
-from typing import List
+from typing import List, Set
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -14,24 +15,61 @@ def get_migration_files() -> List[Path]:
     return sorted(migrations_dir.glob("*.sql"))
 
 
+def split_statements(sql: str) -> List[str]:
+    """Split a script on the semicolons that end statements (not those in trigger bodies)."""
+    statements = []
+    current = ""
+    for part in sql.split(";"):
+        current += part + ";"
+        if sqlite3.complete_statement(current):
+            statements.append(current)
+            current = ""
+    statements.append(current)
+    return [s.strip().rstrip(";").strip() for s in statements if s.strip().rstrip(";").strip()]
+
+
+def _ensure_migrations_table(db: Session) -> None:
+    """Create the table recording applied migration files."""
+    db.execute(
+        text(
+            """
+            CREATE TABLE IF NOT EXISTS landing_schema_migrations (
+              filename   TEXT PRIMARY KEY,
+              applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+    )
+    db.commit()
+
+
+def _applied_migrations(db: Session) -> Set[str]:
+    """Get filenames of migrations already applied."""
+    rows = db.execute(text("SELECT filename FROM landing_schema_migrations")).fetchall()
+    return {row[0] for row in rows}
+
+
 def run_migrations(db: Session) -> None:
-    """Run all migration files."""
-    migration_files = get_migration_files()
+    """Run migration files that have not been applied yet."""
+    _ensure_migrations_table(db)
+    applied = _applied_migrations(db)
+    migration_files = [f for f in get_migration_files() if f.name not in applied]
 
-    logger.info(f"Running {len(migration_files)} migrations for landing module")
+    logger.info("Running %d migrations for landing module", len(migration_files))
 
     for migration_file in migration_files:
-        logger.info(f"Applying migration: {migration_file.name}")
+        logger.info("Applying migration: %s", migration_file.name)
 
         with open(migration_file, "r") as f:
             sql_content = f.read()
 
-        # Split by semicolon and execute each statement
-        statements = [s.strip() for s in sql_content.split(";") if s.strip()]
-
-        for statement in statements:
+        for statement in split_statements(sql_content):
             db.execute(text(statement))
 
+        db.execute(
+            text("INSERT INTO landing_schema_migrations (filename) VALUES (:filename)"),
+            {"filename": migration_file.name},
+        )
         db.commit()
 
     logger.info("Landing module migrations completed")
@@ -3,7 +3,7 @@
 This is the stable interface that other modules use to interact with Landing.
 No other module should import directly from landing's internal packages.
 """
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from sqlalchemy.orm import Session
 
@@ -33,6 +33,12 @@ class LandingFacade:
         """Get assembled landing page."""
         return self.assembly_service.get_landing_page(locale, session_id)
 
+    def get_landing_pages(
+        self, locales: Iterable[str], session_id: Optional[str] = None
+    ) -> Dict[str, LandingPageVM]:
+        """Get assembled landing pages for several locales in one pass."""
+        return self.assembly_service.get_landing_pages(locales, session_id)
+
     def get_exit_intent(
         self, locale: str = "en-US", session_id: Optional[str] = None
     ) -> Optional[ExitIntentCopyVM]:
@@ -1,5 +1,21 @@
 """Landing module repositories."""
+from .cache_backends import SQLiteCacheBackend, get_access_tracker
 from .cache_repo import AssemblyCacheRepository
 from .email_repo import EmailBufferRepository
+from .fragment_cache import FragmentCache, get_fragment_cache, section_etags
+from .rollup_repo import AnalyticsRollupRepository
+from .variant_cache import ResponseVariantCache, get_variant_cache, variant_key
 
-__all__ = ["AssemblyCacheRepository", "EmailBufferRepository"]
+__all__ = [
+    "AssemblyCacheRepository",
+    "SQLiteCacheBackend",
+    "get_access_tracker",
+    "EmailBufferRepository",
+    "FragmentCache",
+    "get_fragment_cache",
+    "section_etags",
+    "AnalyticsRollupRepository",
+    "ResponseVariantCache",
+    "get_variant_cache",
+    "variant_key",
+]
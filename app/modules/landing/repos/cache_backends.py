@@ -0,0 +1,590 @@
+"""Storage backends for the assembly cache.
+
+Backends store opaque, codec-encoded payloads keyed by
+``(locale, cms_etag, discovery_rev)``:
+
+- ``sqlite``: the module-owned ``landing_assembly_cache`` table (default),
+  with payloads stored once per content hash in ``landing_cache_blobs``
+- ``redis``: any Redis-protocol server, shared by all workers and hosts
+- ``shm``: an mmap'd file (e.g. under /dev/shm) shared by workers on one host
+
+The shared backends keep cache writes off the SQLite write lock, and let one
+worker's assembly serve every other worker.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.telemetry import logger
+
+try:  # Optional: Redis-protocol client
+    import redis
+except ImportError:  # pragma: no cover - depends on installed extras
+    redis = None
+
+try:  # POSIX only: cross-process locking for the shm backend
+    import fcntl
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None
+
+CacheKey = Tuple[str, str, str]  # (locale, cms_etag, discovery_rev)
+Payload = Union[bytes, str]
+AddressedPayload = Tuple[CacheKey, str, bytes]  # (key, payload_hash, payload)
+
+# Bytes attributed to a cache row: its inline payload plus an equal share of
+# its blob, so shares over all rows add up to the stored bytes
+_ROW_BYTES = (
+    "COALESCE(length(c.payload_json), 0) + COALESCE(length(b.payload) / b.refcount, 0)"
+)
+# Ids bound per DELETE: older SQLite builds allow at most 999 variables
+_DELETE_CHUNK = 500
+
+
+def payload_digest(data: bytes) -> str:
+    """Content hash addressing a stored payload."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class CacheBackend:
+    """Interface for assembly cache storage."""
+
+    name = "base"
+
+    def get(self, key: CacheKey) -> Optional[Payload]:
+        """Get an unexpired payload, or None."""
+        raise NotImplementedError
+
+    def set(self, key: CacheKey, payload: bytes, ttl_seconds: int) -> None:
+        """Store a payload with a TTL."""
+        raise NotImplementedError
+
+    def set_addressed(
+        self, key: CacheKey, payload_hash: str, payload: bytes, ttl_seconds: int
+    ) -> None:
+        """Store a payload known by its content hash (backends may share it between keys)."""
+        self.set(key, payload, ttl_seconds)
+
+    def set_many_addressed(self, items: List[AddressedPayload], ttl_seconds: int) -> int:
+        """Store several payloads (in one transaction where supported). Returns blobs stored."""
+        for key, payload_hash, payload in items:
+            self.set_addressed(key, payload_hash, payload, ttl_seconds)
+        return len(items)
+
+    def link(self, key: CacheKey, payload_hash: str, ttl_seconds: int) -> bool:
+        """Point a key at an already stored payload. Returns False if there is none to share."""
+        return False
+
+    def delete(self, key: CacheKey) -> None:
+        """Remove a payload if present."""
+        raise NotImplementedError
+
+    def clear_expired(self, batch_size: Optional[int] = None) -> int:
+        """Remove expired payloads. Returns count removed (0 if self-expiring)."""
+        return 0
+
+
+class AccessTracker:
+    """Buffers cache-hit times in memory so reads never write to SQLite.
+
+    The cache janitor flushes them into ``last_accessed_at`` in one batch.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._accessed: Dict[CacheKey, datetime] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: CacheKey) -> None:
+        """Record a hit for a key."""
+        if len(self._accessed) >= self.max_keys and key not in self._accessed:
+            return
+        self._accessed[key] = datetime.utcnow()
+
+    def drain(self) -> Dict[CacheKey, datetime]:
+        """Take all buffered hits."""
+        with self._lock:
+            accessed, self._accessed = self._accessed, {}
+        return accessed
+
+
+@lru_cache
+def get_access_tracker() -> AccessTracker:
+    """Get singleton cache access tracker."""
+    return AccessTracker()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache rows in the landing_assembly_cache table, payloads in landing_cache_blobs."""
+
+    name = "sqlite"
+
+    def __init__(self, db: Session, access_tracker: Optional[AccessTracker] = None):
+        self.db = db
+        self.access_tracker = access_tracker or get_access_tracker()
+
+    def get(self, key: CacheKey) -> Optional[Payload]:
+        """Get an unexpired payload, or None."""
+        # payload_json: inline payload of rows from before content addressing
+        query = text(
+            """
+            SELECT COALESCE(b.payload, c.payload_json)
+            FROM landing_assembly_cache c
+            LEFT JOIN landing_cache_blobs b ON b.payload_hash = c.payload_hash
+            WHERE c.locale = :locale
+              AND c.cms_etag = :cms_etag
+              AND c.discovery_rev = :discovery_rev
+              AND c.expires_at > :now
+            LIMIT 1
+            """
+        )
+
+        locale, cms_etag, discovery_rev = key
+        try:
+            result = self.db.execute(
+                query,
+                {
+                    "locale": locale,
+                    "cms_etag": cms_etag,
+                    "discovery_rev": discovery_rev,
+                    "now": datetime.utcnow(),
+                },
+            ).fetchone()
+        except Exception:
+            # Leave the request's session usable (e.g. after a lock timeout)
+            self.db.rollback()
+            raise
+
+        if not result or result[0] is None:
+            return None
+        self.access_tracker.record(key)
+        return result[0]
+
+    def set(self, key: CacheKey, payload: bytes, ttl_seconds: int) -> None:
+        """Store a payload with a TTL."""
+        self.set_addressed(key, payload_digest(payload), payload, ttl_seconds)
+
+    def set_addressed(
+        self, key: CacheKey, payload_hash: str, payload: bytes, ttl_seconds: int
+    ) -> None:
+        """Store the blob unless it exists, then point the key at it."""
+        try:
+            self._insert_blob(payload_hash, payload)
+            self._upsert_key(key, payload_hash, ttl_seconds)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def set_many_addressed(self, items: List[AddressedPayload], ttl_seconds: int) -> int:
+        """Store several payloads and their keys in one transaction. Returns blobs stored."""
+        stored = 0
+        try:
+            for key, payload_hash, payload in items:
+                stored += self._insert_blob(payload_hash, payload)
+                self._upsert_key(key, payload_hash, ttl_seconds)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return stored
+
+    def _insert_blob(self, payload_hash: str, payload: bytes) -> bool:
+        """Insert a blob unless it exists. Returns whether it was inserted."""
+        result = self.db.execute(
+            text(
+                """
+                INSERT INTO landing_cache_blobs (payload_hash, payload, created_at)
+                VALUES (:payload_hash, :payload, :created_at)
+                ON CONFLICT(payload_hash) DO NOTHING
+                """
+            ),
+            {"payload_hash": payload_hash, "payload": payload, "created_at": datetime.utcnow()},
+        )
+        return result.rowcount == 1
+
+    def link(self, key: CacheKey, payload_hash: str, ttl_seconds: int) -> bool:
+        """Point a key at a stored blob. Returns False if the blob does not exist."""
+        try:
+            linked = self._upsert_key(key, payload_hash, ttl_seconds)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return linked
+
+    def _upsert_key(self, key: CacheKey, payload_hash: str, ttl_seconds: int) -> bool:
+        """Insert or repoint a key row, only if the blob exists (triggers keep refcounts)."""
+        query = text(
+            """
+            INSERT INTO landing_assembly_cache
+            (locale, cms_etag, discovery_rev, payload_hash, payload_json, expires_at,
+             created_at, last_accessed_at)
+            SELECT :locale, :cms_etag, :discovery_rev, payload_hash, NULL, :expires_at,
+                   :created_at, :created_at
+            FROM landing_cache_blobs
+            WHERE payload_hash = :payload_hash
+            ON CONFLICT(locale, cms_etag, discovery_rev) DO UPDATE SET
+              payload_hash = excluded.payload_hash,
+              payload_json = NULL,
+              expires_at = excluded.expires_at,
+              created_at = excluded.created_at,
+              last_accessed_at = excluded.last_accessed_at
+            """
+        )
+
+        locale, cms_etag, discovery_rev = key
+        now = datetime.utcnow()
+        result = self.db.execute(
+            query,
+            {
+                "locale": locale,
+                "cms_etag": cms_etag,
+                "discovery_rev": discovery_rev,
+                "payload_hash": payload_hash,
+                "expires_at": now + timedelta(seconds=ttl_seconds),
+                "created_at": now,
+            },
+        )
+        return result.rowcount == 1
+
+    def delete(self, key: CacheKey) -> None:
+        """Remove a payload if present."""
+        query = text(
+            """
+            DELETE FROM landing_assembly_cache
+            WHERE locale = :locale
+              AND cms_etag = :cms_etag
+              AND discovery_rev = :discovery_rev
+            """
+        )
+
+        locale, cms_etag, discovery_rev = key
+        self.db.execute(
+            query,
+            {"locale": locale, "cms_etag": cms_etag, "discovery_rev": discovery_rev},
+        )
+        self.db.commit()
+
+    def clear_expired(self, batch_size: Optional[int] = None) -> int:
+        """Clear expired cache entries. Returns count of deleted rows."""
+        if batch_size is None:
+            query = text(
+                """
+                DELETE FROM landing_assembly_cache
+                WHERE expires_at <= :now
+                """
+            )
+
+            result = self.db.execute(query, {"now": datetime.utcnow()})
+            self.db.commit()
+            return result.rowcount
+
+        return self.delete_expired_batch(batch_size)[0]
+
+    def delete_expired_batch(self, batch_size: int) -> Tuple[int, int]:
+        """Delete up to batch_size expired rows. Returns (rows, bytes) reclaimed."""
+        query = text(
+            f"""
+            SELECT c.id, {_ROW_BYTES}
+            FROM landing_assembly_cache c
+            LEFT JOIN landing_cache_blobs b ON b.payload_hash = c.payload_hash
+            WHERE c.expires_at <= :now
+            ORDER BY c.expires_at
+            LIMIT :limit
+            """
+        )
+
+        rows = self.db.execute(query, {"now": datetime.utcnow(), "limit": batch_size}).fetchall()
+        return self._delete_rows(rows)
+
+    def delete_lru_batch(self, batch_size: int) -> Tuple[int, int]:
+        """Delete up to batch_size least-recently-used rows. Returns (rows, bytes)."""
+        query = text(
+            f"""
+            SELECT c.id, {_ROW_BYTES}
+            FROM landing_assembly_cache c
+            LEFT JOIN landing_cache_blobs b ON b.payload_hash = c.payload_hash
+            ORDER BY c.last_accessed_at
+            LIMIT :limit
+            """
+        )
+
+        rows = self.db.execute(query, {"limit": batch_size}).fetchall()
+        return self._delete_rows(rows)
+
+    def _delete_rows(self, rows: List[Tuple[int, int]]) -> Tuple[int, int]:
+        """Delete rows by rowid in one short transaction (chunked IN lists)."""
+        if not rows:
+            return 0, 0
+
+        ids = [row[0] for row in rows]
+        for start in range(0, len(ids), _DELETE_CHUNK):
+            chunk = ids[start:start + _DELETE_CHUNK]
+            params = {f"id{i}": row_id for i, row_id in enumerate(chunk)}
+            placeholders = ", ".join(f":{name}" for name in params)
+            self.db.execute(
+                text(f"DELETE FROM landing_assembly_cache WHERE id IN ({placeholders})"),
+                params,
+            )
+        self.db.commit()
+        return len(ids), sum(row[1] or 0 for row in rows)
+
+    def touch_many(self, accessed: Dict[CacheKey, datetime]) -> int:
+        """Persist buffered access times. Returns number of keys written."""
+        if not accessed:
+            return 0
+
+        query = text(
+            """
+            UPDATE landing_assembly_cache
+            SET last_accessed_at = :accessed_at
+            WHERE locale = :locale
+              AND cms_etag = :cms_etag
+              AND discovery_rev = :discovery_rev
+            """
+        )
+
+        self.db.execute(
+            query,
+            [
+                {
+                    "locale": key[0],
+                    "cms_etag": key[1],
+                    "discovery_rev": key[2],
+                    "accessed_at": accessed_at,
+                }
+                for key, accessed_at in accessed.items()
+            ],
+        )
+        self.db.commit()
+        return len(accessed)
+
+    def stats(self) -> Tuple[int, int]:
+        """Get (row count, payload bytes) of the cache and blob tables."""
+        query = text(
+            """
+            SELECT
+              (SELECT COUNT(*) FROM landing_assembly_cache),
+              (SELECT COALESCE(SUM(length(payload_json)), 0) FROM landing_assembly_cache)
+              + (SELECT COALESCE(SUM(length(payload)), 0) FROM landing_cache_blobs)
+            """
+        )
+
+        rows, size = self.db.execute(query).fetchone()
+        return rows, size
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache payloads in a Redis-protocol server.
+
+    Accepts any client exposing ``get``, ``set(name, value, ex=...)`` and
+    ``delete`` (redis-py, or an in-process fake in tests). Expiry is left to
+    the server.
+    """
+
+    name = "redis"
+
+    def __init__(self, client: Any, prefix: str = "lendcommunity:landing:page"):
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key: CacheKey) -> str:
+        return f"{self.prefix}:" + ":".join(key)
+
+    def get(self, key: CacheKey) -> Optional[Payload]:
+        """Get an unexpired payload, or None."""
+        return self.client.get(self._key(key))
+
+    def set(self, key: CacheKey, payload: bytes, ttl_seconds: int) -> None:
+        """Store a payload with a TTL."""
+        self.client.set(self._key(key), payload, ex=max(1, int(ttl_seconds)))
+
+    def delete(self, key: CacheKey) -> None:
+        """Remove a payload if present."""
+        self.client.delete(self._key(key))
+
+
+class SharedMemoryCacheBackend(CacheBackend):
+    """Cache payloads in a fixed-slot hash table in an mmap'd file.
+
+    Layout: a 16-byte header (magic, slot count, slot size) followed by
+    ``slots`` fixed-size slots. Each slot holds
+    ``[expires_at f64][key_len u16][value_len u32][key][value]``. Keys hash to
+    one slot; a colliding write simply replaces the previous entry. Payloads
+    larger than a slot are not stored. Readers and writers serialize through
+    ``flock`` on the backing file, so every process on the host sees a
+    consistent table.
+    """
+
+    name = "shm"
+
+    _MAGIC = b"LCSHM001"
+    _HEADER = struct.Struct("<8sII")
+    _SLOT_HEADER = struct.Struct("<dHI")
+
+    def __init__(self, path: str, slots: int = 1024, slot_size: int = 64 * 1024):
+        if fcntl is None:
+            raise RuntimeError("Shared memory cache backend requires POSIX fcntl")
+
+        self.path = path
+        self.slots = slots
+        self.slot_size = slot_size
+        self.size = self._HEADER.size + slots * slot_size
+        self._pid = None
+        self._file = None
+        self._map = None
+        self._lock = threading.Lock()
+
+    def _ensure_open(self) -> None:
+        """(Re)open the mapping, once per process."""
+        pid = os.getpid()
+        if self._pid == pid:
+            return
+
+        f = open(self.path, "a+b")
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            if os.fstat(f.fileno()).st_size != self.size:
+                f.truncate(self.size)
+            mapped = mmap.mmap(f.fileno(), self.size)
+            magic, slots, slot_size = self._HEADER.unpack_from(mapped, 0)
+            if (magic, slots, slot_size) != (self._MAGIC, self.slots, self.slot_size):
+                # New file or different geometry: start from an empty table
+                mapped[:] = bytes(self.size)
+                self._HEADER.pack_into(mapped, 0, self._MAGIC, self.slots, self.slot_size)
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+        self._file = f
+        self._map = mapped
+        self._pid = pid
+
+    def _offset(self, key_bytes: bytes) -> int:
+        digest = hashlib.blake2b(key_bytes, digest_size=8).digest()
+        index = int.from_bytes(digest, "little") % self.slots
+        return self._HEADER.size + index * self.slot_size
+
+    @staticmethod
+    def _encode_key(key: CacheKey) -> bytes:
+        return "\x1f".join(key).encode("utf-8")
+
+    def get(self, key: CacheKey) -> Optional[Payload]:
+        """Get an unexpired payload, or None."""
+        key_bytes = self._encode_key(key)
+        with self._lock:
+            self._ensure_open()
+            offset = self._offset(key_bytes)
+            fcntl.flock(self._file, fcntl.LOCK_SH)
+            try:
+                expires_at, key_len, value_len = self._SLOT_HEADER.unpack_from(self._map, offset)
+                if not key_len or expires_at <= time.time():
+                    return None
+                start = offset + self._SLOT_HEADER.size
+                if self._map[start:start + key_len] != key_bytes:
+                    return None
+                start += key_len
+                return self._map[start:start + value_len]
+            finally:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+
+    def set(self, key: CacheKey, payload: bytes, ttl_seconds: int) -> None:
+        """Store a payload with a TTL."""
+        key_bytes = self._encode_key(key)
+        needed = self._SLOT_HEADER.size + len(key_bytes) + len(payload)
+        if needed > self.slot_size:
+            logger.debug("Payload of %d bytes exceeds shm slot size, not cached", len(payload))
+            return
+
+        with self._lock:
+            self._ensure_open()
+            offset = self._offset(key_bytes)
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+            try:
+                start = offset + self._SLOT_HEADER.size
+                self._map[start:start + len(key_bytes)] = key_bytes
+                start += len(key_bytes)
+                self._map[start:start + len(payload)] = payload
+                # Header last: a slot only becomes visible once fully written
+                self._SLOT_HEADER.pack_into(
+                    self._map, offset, time.time() + ttl_seconds, len(key_bytes), len(payload)
+                )
+            finally:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+
+    def delete(self, key: CacheKey) -> None:
+        """Remove a payload if present."""
+        key_bytes = self._encode_key(key)
+        with self._lock:
+            self._ensure_open()
+            offset = self._offset(key_bytes)
+            fcntl.flock(self._file, fcntl.LOCK_EX)
+            try:
+                _, key_len, _ = self._SLOT_HEADER.unpack_from(self._map, offset)
+                start = offset + self._SLOT_HEADER.size
+                if key_len and self._map[start:start + key_len] == key_bytes:
+                    self._SLOT_HEADER.pack_into(self._map, offset, 0.0, 0, 0)
+            finally:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+
+
+@lru_cache
+def get_redis_client(url: str) -> Any:
+    """Get a shared Redis client (connection pool) for a URL."""
+    return redis.Redis.from_url(url)
+
+
+@lru_cache
+def get_shared_memory_backend(path: str, slots: int, slot_size: int) -> SharedMemoryCacheBackend:
+    """Get the process-wide shared memory backend for a path."""
+    return SharedMemoryCacheBackend(path, slots=slots, slot_size=slot_size)
+
+
+def default_shm_path() -> str:
+    """Default location of the shared memory cache file."""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(base, "lendcommunity-landing-cache")
+
+
+@lru_cache
+def resolve_backend_name(requested: str) -> str:
+    """Map the configured backend to one usable here (warns once on fallback)."""
+    if requested == "redis" and redis is None:
+        logger.warning("cache_backend=redis but redis is not installed; using sqlite")
+        return "sqlite"
+    if requested == "shm" and fcntl is None:
+        logger.warning("cache_backend=shm is not supported on this platform; using sqlite")
+        return "sqlite"
+    if requested not in ("sqlite", "redis", "shm"):
+        logger.warning("Unknown cache_backend=%s; using sqlite", requested)
+        return "sqlite"
+    return requested
+
+
+def build_cache_backend(db: Session) -> CacheBackend:
+    """Build the configured cache backend."""
+    settings = get_settings()
+    backend = resolve_backend_name(settings.cache_backend)
+
+    if backend == "redis":
+        return RedisCacheBackend(
+            get_redis_client(settings.cache_redis_url),
+            prefix=settings.cache_redis_prefix,
+        )
+    if backend == "shm":
+        return get_shared_memory_backend(
+            settings.cache_shm_path or default_shm_path(),
+            settings.cache_shm_slots,
+            settings.cache_shm_slot_size,
+        )
+    return SQLiteCacheBackend(db)
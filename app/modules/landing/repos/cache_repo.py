@@ -1,54 +1,102 @@
-"""Assembly cache repository."""
-import json
-from datetime import datetime, timedelta
-from typing import Optional
+"""Assembly cache repository.
+
+Stored payloads are content addressed. Fields derived from the key
+(``locale``, and ``etag``/``section_etags`` when computed from the key's
+tokens) are blanked before hashing and restored on read. Pages for
+different keys with the same content therefore share one stored payload.
+When the hash is already stored, ``set`` skips the codec encode and the
+payload write.
+"""
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.core.security import generate_etag
+from app.core.telemetry import get_metrics_registry, logger
 from app.modules.landing.domain import AssemblyCacheEntry, LandingPageVM
 
+from .cache_backends import (
+    AddressedPayload,
+    CacheBackend,
+    build_cache_backend,
+    payload_digest,
+)
+from .fragment_cache import section_etags
+from .payload_codec import (
+    SERIALIZER_JSON,
+    PayloadCodec,
+    PayloadCodecError,
+    get_payload_codec,
+)
+
+_payload_writes = get_metrics_registry().counter(
+    "landing_cache_payload_writes_total",
+    "Assembly cache sets by whether the payload was already stored",
+    labelnames=("result",),
+)
+_payload_reused = _payload_writes.labels("reused")
+_payload_stored = _payload_writes.labels("stored")
+
+# (locale, cms_etag, discovery_rev, page)
+CacheEntry = Tuple[str, str, str, LandingPageVM]
+
+
+def cache_content(
+    payload: LandingPageVM, locale: str, cms_etag: str, discovery_rev: str
+) -> LandingPageVM:
+    """Copy of a page with the fields its cache key implies blanked."""
+    update = {}
+    if payload.locale == locale:
+        update["locale"] = ""
+    if payload.etag == generate_etag(cms_etag, discovery_rev) and (
+        payload.section_etags == section_etags(locale, cms_etag, discovery_rev)
+    ):
+        update["etag"] = ""
+        update["section_etags"] = {}
+    return payload.model_copy(update=update) if update else payload
+
 
 class AssemblyCacheRepository:
     """Repository for assembly cache operations."""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        codec: Optional[PayloadCodec] = None,
+        backend: Optional[CacheBackend] = None,
+    ):
         self.db = db
         self.settings = get_settings()
+        self.codec = codec or get_payload_codec()
+        self.backend = backend or build_cache_backend(db)
 
     def get(
         self, locale: str, cms_etag: str, discovery_rev: str
     ) -> Optional[LandingPageVM]:
         """Get cached landing page by locale and etags."""
-        query = text(
-            """
-            SELECT payload_json, expires_at
-            FROM landing_assembly_cache
-            WHERE locale = :locale
-              AND cms_etag = :cms_etag
-              AND discovery_rev = :discovery_rev
-              AND expires_at > :now
-            LIMIT 1
-            """
-        )
-
-        result = self.db.execute(
-            query,
-            {
-                "locale": locale,
-                "cms_etag": cms_etag,
-                "discovery_rev": discovery_rev,
-                "now": datetime.utcnow(),
-            },
-        ).fetchone()
-
-        if not result:
+        payload = self.backend.get((locale, cms_etag, discovery_rev))
+        if payload is None:
+            return None
+
+        try:
+            serializer_id, body = self.codec.unpack(payload)
+            if serializer_id == SERIALIZER_JSON:
+                # Parse and validate in one pass inside pydantic-core
+                page = LandingPageVM.model_validate_json(body)
+            else:
+                page = LandingPageVM.model_validate(self.codec.deserialize(serializer_id, body))
+        except (PayloadCodecError, ValueError) as e:
+            logger.warning("Discarding undecodable cache entry for %s: %s", locale, e)
             return None
 
-        payload_json, expires_at = result
-        payload_dict = json.loads(payload_json)
-        return LandingPageVM(**payload_dict)
+        # Restore what cache_content blanked
+        if not page.locale:
+            page.locale = locale
+        if not page.etag:
+            page.etag = generate_etag(cms_etag, discovery_rev)
+            page.section_etags = section_etags(locale, cms_etag, discovery_rev)
+        return page
 
     def set(
         self,
@@ -58,44 +106,46 @@ class AssemblyCacheRepository:
         payload: LandingPageVM,
         ttl_seconds: Optional[int] = None,
     ) -> None:
-        """Store landing page in cache."""
+        """Store landing page in cache, reusing an identical stored payload."""
         if ttl_seconds is None:
             ttl_seconds = self.settings.cache_ttl_seconds
 
-        expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
-        payload_json = payload.model_dump_json()
-
-        # Upsert using INSERT OR REPLACE
-        query = text(
-            """
-            INSERT OR REPLACE INTO landing_assembly_cache
-            (locale, cms_etag, discovery_rev, payload_json, expires_at, created_at)
-            VALUES (:locale, :cms_etag, :discovery_rev, :payload_json, :expires_at, :created_at)
-            """
-        )
-
-        self.db.execute(
-            query,
-            {
-                "locale": locale,
-                "cms_etag": cms_etag,
-                "discovery_rev": discovery_rev,
-                "payload_json": payload_json,
-                "expires_at": expires_at,
-                "created_at": datetime.utcnow(),
-            },
-        )
-        self.db.commit()
-
-    def clear_expired(self) -> int:
+        key = (locale, cms_etag, discovery_rev)
+        content = cache_content(payload, locale, cms_etag, discovery_rev)
+        payload_hash = payload_digest(content.model_dump_json().encode())
+        if self.backend.link(key, payload_hash, ttl_seconds):
+            _payload_reused.inc()
+            return
+
+        encoded = self.codec.encode(content.model_dump(mode="json"))
+        self.backend.set_addressed(key, payload_hash, encoded, ttl_seconds)
+        _payload_stored.inc()
+
+    def set_many(self, entries: List[CacheEntry], ttl_seconds: Optional[int] = None) -> None:
+        """Store several landing pages in one backend write (one transaction on SQLite)."""
+        if not entries:
+            return
+        if ttl_seconds is None:
+            ttl_seconds = self.settings.cache_ttl_seconds
+
+        items: List[AddressedPayload] = []
+        encoded: Dict[str, bytes] = {}
+        for locale, cms_etag, discovery_rev, payload in entries:
+            content = cache_content(payload, locale, cms_etag, discovery_rev)
+            payload_hash = payload_digest(content.model_dump_json().encode())
+            # Identical content within the batch is encoded once
+            if payload_hash not in encoded:
+                encoded[payload_hash] = self.codec.encode(content.model_dump(mode="json"))
+            items.append(((locale, cms_etag, discovery_rev), payload_hash, encoded[payload_hash]))
+
+        stored = self.backend.set_many_addressed(items, ttl_seconds)
+        _payload_stored.inc(stored)
+        _payload_reused.inc(len(items) - stored)
+
+    def delete(self, locale: str, cms_etag: str, discovery_rev: str) -> None:
+        """Remove a cached landing page."""
+        self.backend.delete((locale, cms_etag, discovery_rev))
+
+    def clear_expired(self, batch_size: Optional[int] = None) -> int:
         """Clear expired cache entries. Returns count of deleted rows."""
-        query = text(
-            """
-            DELETE FROM landing_assembly_cache
-            WHERE expires_at <= :now
-            """
-        )
-
-        result = self.db.execute(query, {"now": datetime.utcnow()})
-        self.db.commit()
-        return result.rowcount
+        return self.backend.clear_expired(batch_size)
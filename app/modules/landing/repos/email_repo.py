@@ -1,12 +1,27 @@
 """Email buffer repository."""
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.modules.landing.domain import EmailBufferEntry, EmailSource, EmailStatus
 
+# Column order of iter_rows tuples (and of exports)
+EMAIL_COLUMNS = (
+    "id",
+    "email",
+    "locale",
+    "source",
+    "utm_source",
+    "utm_medium",
+    "utm_campaign",
+    "referrer_url",
+    "session_id",
+    "status",
+    "created_at",
+)
+
 
 class EmailBufferRepository:
     """Repository for email buffer operations."""
@@ -117,3 +132,57 @@ class EmailBufferRepository:
         )
 
         return self.db.execute(query, {"status": status}).scalar()
+
+    def iter_rows(
+        self,
+        status: Optional[EmailStatus] = None,
+        source: Optional[EmailSource] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[List[Tuple]]:
+        """
+        Yield matching rows (EMAIL_COLUMNS tuples) in id order, one batch at a time.
+
+        Keyset pagination on id: each batch is its own short query and read
+        transaction, so memory stays flat and writers are not held off for
+        the length of an export. Rows added meanwhile with a higher id are
+        included.
+        """
+        conditions = ["id > :after"]
+        if status is not None:
+            conditions.append("status = :status")
+        if source is not None:
+            conditions.append("source = :source")
+        if since is not None:
+            conditions.append("created_at >= :since")
+        if until is not None:
+            conditions.append("created_at < :until")
+        query = text(
+            f"""
+            SELECT {", ".join(EMAIL_COLUMNS)}
+            FROM landing_email_buffer
+            WHERE {" AND ".join(conditions)}
+            ORDER BY id
+            LIMIT :limit
+            """
+        )
+
+        params = {
+            "after": 0,
+            "status": status,
+            "source": source,
+            "since": since,
+            "until": until,
+            "limit": batch_size,
+        }
+        while True:
+            rows = [tuple(row) for row in self.db.execute(query, params).fetchall()]
+            # End the read transaction between batches
+            self.db.rollback()
+            if not rows:
+                return
+            yield rows
+            if len(rows) < batch_size:
+                return
+            params["after"] = rows[-1][0]
@@ -0,0 +1,72 @@
+"""In-process cache of landing page sections (fragments).
+
+Each section is keyed only on the revision tokens it is built from:
+
+- ``hero``, ``testimonials``, ``disclaimers``, ``exit_intent``: the CMS etag
+- ``teaser``: the Discovery revision, plus the CMS etag (title, mask_after)
+
+A Discovery re-rank therefore rebuilds the teaser alone, and section etags
+derived from the same tokens tell clients which sections changed.
+"""
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from app.core.config import get_settings
+from app.core.security import generate_etag
+from app.modules.landing.domain import LANDING_SECTIONS
+
+
+def section_tokens(section: str, cms_etag: str, discovery_rev: str) -> Tuple[str, ...]:
+    """Revision tokens a section depends on."""
+    if section == "teaser":
+        return (cms_etag, discovery_rev)
+    return (cms_etag,)
+
+
+def section_etags(locale: str, cms_etag: str, discovery_rev: str) -> Dict[str, str]:
+    """Etag of every section, from revision tokens only."""
+    return {
+        section: generate_etag(section, locale, *section_tokens(section, cms_etag, discovery_rev))
+        for section in LANDING_SECTIONS
+    }
+
+
+class FragmentCache:
+    """Bounded LRU of built sections keyed by (section, locale, tokens)."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Get a fragment, building and storing it on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        # Built outside the lock: concurrent misses may build twice, harmlessly
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop all fragments."""
+        with self._lock:
+            self._entries.clear()
+
+
+@lru_cache
+def get_fragment_cache() -> FragmentCache:
+    """Get singleton fragment cache."""
+    return FragmentCache(max_entries=get_settings().fragment_cache_size)
@@ -0,0 +1,163 @@
+"""Binary payload codec for the assembly cache.
+
+Encoded payloads start with a fixed header so the format can evolve without
+invalidating rows written by older releases:
+
+    byte 0  format version (currently 1)
+    byte 1  serializer id  (json / msgpack)
+    byte 2  compression id (none / zlib / zstd)
+
+Rows written before the codec existed hold plain JSON text and are still
+decoded transparently.
+"""
+import json
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, Tuple, Union
+
+from app.core.config import get_settings
+
+try:  # Optional: compact binary serialization
+    import msgpack
+except ImportError:  # pragma: no cover - depends on installed extras
+    msgpack = None
+
+try:  # Optional: faster/better compression than zlib
+    import zstandard
+except ImportError:  # pragma: no cover - depends on installed extras
+    zstandard = None
+
+FORMAT_VERSION = 1
+
+SERIALIZER_JSON = 0
+SERIALIZER_MSGPACK = 1
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+
+_SERIALIZERS = {"json": SERIALIZER_JSON, "msgpack": SERIALIZER_MSGPACK}
+_COMPRESSIONS = {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "zstd": COMPRESSION_ZSTD}
+
+_HEADER_SIZE = 3
+
+
+class PayloadCodecError(ValueError):
+    """Raised when a cached payload cannot be decoded."""
+
+
+class PayloadCodec:
+    """Encode/decode cache payloads with a versioned binary header."""
+
+    def __init__(
+        self,
+        serializer: str = "msgpack",
+        compression: str = "zlib",
+        compression_level: int = 6,
+        min_compress_size: int = 256,
+    ):
+        if serializer not in _SERIALIZERS:
+            raise ValueError(f"Unknown payload serializer: {serializer}")
+        if compression not in _COMPRESSIONS:
+            raise ValueError(f"Unknown payload compression: {compression}")
+
+        # Fall back to what is installed rather than failing at startup
+        if serializer == "msgpack" and msgpack is None:
+            serializer = "json"
+        if compression == "zstd" and zstandard is None:
+            compression = "zlib"
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compression_level = compression_level
+        self.min_compress_size = min_compress_size
+
+        self._serializer_id = _SERIALIZERS[serializer]
+        self._compression_id = _COMPRESSIONS[compression]
+        self._zstd_compressor = (
+            zstandard.ZstdCompressor(level=compression_level)
+            if self._compression_id == COMPRESSION_ZSTD
+            else None
+        )
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """Encode a JSON-compatible dict into a versioned binary payload."""
+        if self._serializer_id == SERIALIZER_MSGPACK:
+            body = msgpack.packb(data, use_bin_type=True)
+        else:
+            body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+        compression_id = self._compression_id
+        if len(body) < self.min_compress_size:
+            compression_id = COMPRESSION_NONE
+
+        if compression_id == COMPRESSION_ZLIB:
+            body = zlib.compress(body, self.compression_level)
+        elif compression_id == COMPRESSION_ZSTD:
+            body = self._zstd_compressor.compress(body)
+
+        return bytes((FORMAT_VERSION, self._serializer_id, compression_id)) + body
+
+    def decode(self, payload: Union[bytes, str]) -> Dict[str, Any]:
+        """Decode a payload written by any codec version (or legacy JSON text)."""
+        return self.deserialize(*self.unpack(payload))
+
+    def deserialize(self, serializer_id: int, body: bytes) -> Dict[str, Any]:
+        """Deserialize an unpacked body."""
+        if serializer_id == SERIALIZER_MSGPACK:
+            if msgpack is None:
+                raise PayloadCodecError("msgpack payload found but msgpack is not installed")
+            return msgpack.unpackb(body, raw=False)
+        return json.loads(body)
+
+    def unpack(self, payload: Union[bytes, str]) -> Tuple[int, bytes]:
+        """Strip header and compression. Returns (serializer_id, serialized body)."""
+        if isinstance(payload, str):
+            # Legacy row: plain JSON text
+            return SERIALIZER_JSON, payload.encode("utf-8")
+
+        payload = bytes(payload)
+        if not payload:
+            raise PayloadCodecError("Empty cache payload")
+        if payload[:1] in (b"{", b"["):
+            # Legacy row stored as bytes by the driver
+            return SERIALIZER_JSON, payload
+
+        version = payload[0]
+        if version != FORMAT_VERSION or len(payload) < _HEADER_SIZE:
+            raise PayloadCodecError(f"Unsupported cache payload format version: {version}")
+
+        serializer_id = payload[1]
+        compression_id = payload[2]
+        body = payload[_HEADER_SIZE:]
+
+        if compression_id == COMPRESSION_ZLIB:
+            try:
+                body = zlib.decompress(body)
+            except zlib.error as e:
+                raise PayloadCodecError(f"Corrupt zlib cache payload: {e}") from e
+        elif compression_id == COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise PayloadCodecError("zstd payload found but zstandard is not installed")
+            try:
+                body = zstandard.ZstdDecompressor().decompress(body)
+            except zstandard.ZstdError as e:
+                raise PayloadCodecError(f"Corrupt zstd cache payload: {e}") from e
+        elif compression_id != COMPRESSION_NONE:
+            raise PayloadCodecError(f"Unknown cache payload compression: {compression_id}")
+
+        if serializer_id not in (SERIALIZER_JSON, SERIALIZER_MSGPACK):
+            raise PayloadCodecError(f"Unknown cache payload serializer: {serializer_id}")
+
+        return serializer_id, body
+
+
+@lru_cache
+def get_payload_codec() -> PayloadCodec:
+    """Get codec configured from settings."""
+    settings = get_settings()
+    return PayloadCodec(
+        serializer=settings.cache_payload_serializer,
+        compression=settings.cache_payload_compression,
+        compression_level=settings.cache_payload_compression_level,
+    )
@@ -0,0 +1,146 @@
+"""Analytics rollup repository (event counters and reach sketches)."""
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.utils import HyperLogLog
+
+# (bucket_start, event_type, locale, cms_version, etag, placement, action)
+RollupKey = Tuple[datetime, str, str, int, str, str, str]
+# (bucket_start, event_type, locale, etag)
+ReachKey = Tuple[datetime, str, str, str]
+
+
+def _hll_merge(stored: bytes, incoming: bytes) -> bytes:
+    """SQL function: union of two serialized sketches."""
+    return HyperLogLog.from_bytes(stored).merge(HyperLogLog.from_bytes(incoming)).to_bytes()
+
+
+class AnalyticsRollupRepository:
+    """Repository for landing_analytics_rollup counters."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def add_counts(self, counts: Iterable[Tuple[RollupKey, int]]) -> int:
+        """Add counts to their rows (created as needed). Returns rows written."""
+        query = text(
+            """
+            INSERT INTO landing_analytics_rollup
+            (bucket_start, event_type, locale, cms_version, etag, placement, action,
+             count, updated_at)
+            VALUES (:bucket_start, :event_type, :locale, :cms_version, :etag, :placement,
+                    :action, :count, :updated_at)
+            ON CONFLICT (bucket_start, event_type, locale, cms_version, etag, placement, action)
+            DO UPDATE SET count = count + excluded.count, updated_at = excluded.updated_at
+            """
+        )
+
+        now = datetime.utcnow()
+        params = [
+            {
+                "bucket_start": key[0],
+                "event_type": key[1],
+                "locale": key[2],
+                "cms_version": key[3],
+                "etag": key[4],
+                "placement": key[5],
+                "action": key[6],
+                "count": count,
+                "updated_at": now,
+            }
+            for key, count in counts
+        ]
+        if not params:
+            return 0
+        self.db.execute(query, params)
+        self.db.commit()
+        return len(params)
+
+    def get_counts(
+        self,
+        since: datetime,
+        event_type: Optional[str] = None,
+    ) -> List[Tuple[RollupKey, int]]:
+        """Get counters for buckets starting at or after ``since``."""
+        query = text(
+            """
+            SELECT bucket_start, event_type, locale, cms_version, etag, placement, action, count
+            FROM landing_analytics_rollup
+            WHERE bucket_start >= :since
+              AND (:event_type IS NULL OR event_type = :event_type)
+            ORDER BY bucket_start, event_type
+            """
+        )
+
+        rows = self.db.execute(query, {"since": since, "event_type": event_type}).fetchall()
+        return [(tuple(row[:7]), row[7]) for row in rows]
+
+    def merge_sketches(self, sketches: Iterable[Tuple[ReachKey, bytes]]) -> int:
+        """Union serialized sketches into their rows (created as needed). Returns rows written."""
+        query = text(
+            """
+            INSERT INTO landing_reach_sketches
+            (bucket_start, event_type, locale, etag, sketch, updated_at)
+            VALUES (:bucket_start, :event_type, :locale, :etag, :sketch, :updated_at)
+            ON CONFLICT (bucket_start, event_type, locale, etag)
+            DO UPDATE SET sketch = hll_merge(sketch, excluded.sketch),
+                          updated_at = excluded.updated_at
+            """
+        )
+
+        now = datetime.utcnow()
+        params = [
+            {
+                "bucket_start": key[0],
+                "event_type": key[1],
+                "locale": key[2],
+                "etag": key[3],
+                "sketch": sketch,
+                "updated_at": now,
+            }
+            for key, sketch in sketches
+        ]
+        if not params:
+            return 0
+        # Per connection; re-registering is cheap and keeps pooled connections covered
+        self.db.connection().connection.dbapi_connection.create_function(
+            "hll_merge", 2, _hll_merge, deterministic=True
+        )
+        self.db.execute(query, params)
+        self.db.commit()
+        return len(params)
+
+    def get_sketches(
+        self,
+        event_type: str,
+        since: datetime,
+        until: datetime,
+        locale: Optional[str] = None,
+        etag: Optional[str] = None,
+    ) -> List[Tuple[ReachKey, bytes]]:
+        """Get sketches for buckets starting in [since, until)."""
+        query = text(
+            """
+            SELECT bucket_start, event_type, locale, etag, sketch
+            FROM landing_reach_sketches
+            WHERE event_type = :event_type
+              AND bucket_start >= :since
+              AND bucket_start < :until
+              AND (:locale IS NULL OR locale = :locale)
+              AND (:etag IS NULL OR etag = :etag)
+            ORDER BY bucket_start
+            """
+        )
+
+        params = {
+            "event_type": event_type,
+            "since": since,
+            "until": until,
+            "locale": locale,
+            "etag": etag,
+        }
+        rows = self.db.execute(query, params).fetchall()
+        return [(tuple(row[:4]), row[4]) for row in rows]
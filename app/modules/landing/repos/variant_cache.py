@@ -0,0 +1,68 @@
+"""In-process store of serialized + precompressed landing page bodies."""
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Hashable, Optional
+
+from app.core.config import get_settings
+from app.core.http.compression import compress_variants
+from app.modules.landing.domain import LandingPageVM
+
+
+class ResponseVariantCache:
+    """Bounded LRU of encoded response bodies keyed by payload identity.
+
+    Each entry maps a content coding ("identity", "gzip", "br") to the bytes
+    to send, so the hot path only picks a variant.
+    """
+
+    def __init__(self, max_entries: int = 256, minimum_size: int = 1000):
+        self.max_entries = max_entries
+        self.minimum_size = minimum_size
+        self._entries: "OrderedDict[Hashable, Dict[str, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Dict[str, bytes]]:
+        """Get variants for a key, if present."""
+        with self._lock:
+            variants = self._entries.get(key)
+            if variants is not None:
+                self._entries.move_to_end(key)
+            return variants
+
+    def put(self, key: Hashable, landing_page: LandingPageVM) -> Dict[str, bytes]:
+        """Serialize and compress a page once and store its variants."""
+        body = landing_page.model_dump_json().encode("utf-8")
+        variants = compress_variants(body, minimum_size=self.minimum_size)
+
+        with self._lock:
+            self._entries[key] = variants
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return variants
+
+    def get_or_build(self, key: Hashable, landing_page: LandingPageVM) -> Dict[str, bytes]:
+        """Get variants for a key, building them from the page on a miss."""
+        variants = self.get(key)
+        if variants is None:
+            variants = self.put(key, landing_page)
+        return variants
+
+    def clear(self) -> None:
+        """Drop all stored variants."""
+        with self._lock:
+            self._entries.clear()
+
+
+def variant_key(landing_page: LandingPageVM) -> tuple:
+    """Key identifying a page body (the etag alone does not cover locale or gating)."""
+    can_show = bool(landing_page.exit_intent and landing_page.exit_intent.can_show_now)
+    return (landing_page.locale, landing_page.etag, can_show)
+
+
+@lru_cache
+def get_variant_cache() -> ResponseVariantCache:
+    """Get singleton response variant cache."""
+    settings = get_settings()
+    return ResponseVariantCache(max_entries=settings.response_variant_cache_size)
@@ -1,4 +1,5 @@
 """Landing module routers."""
+from .internal_router import router as internal_router
 from .landing_router import router
 
-__all__ = ["router"]
+__all__ = ["router", "internal_router"]
@@ -0,0 +1,78 @@
+"""Internal landing endpoints (admin token required)."""
+from datetime import datetime, timedelta
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.db import get_db
+from app.core.http.error_handlers import BadRequestException
+from app.core.security import require_admin
+from app.core.utils import naive_utc
+from app.modules.landing.domain import EmailSource, EmailStatus, ReachEventType, ReachReport
+from app.modules.landing.services import EmailExportService, ReachService
+from app.modules.landing.services.email_export import MEDIA_TYPES
+
+router = APIRouter(
+    prefix="/landing/v1/internal",
+    tags=["landing-internal"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("/reach", response_model=ReachReport)
+async def get_reach(
+    event_type: ReachEventType = "landing.impression",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    locale: Optional[str] = None,
+    etag: Optional[str] = None,
+    group_by: Optional[Literal["bucket", "locale", "etag"]] = None,
+    db: Session = Depends(get_db),
+):
+    """
+    Estimate unique sessions (HyperLogLog) for impressions or exit-intent exposures.
+
+    Merges the stored per-bucket sketches in [since, until) (UTC, default:
+    the last 24 hours). Counts lag by up to one rollup flush interval.
+    """
+    until = naive_utc(until) if until else datetime.utcnow()
+    since = naive_utc(since) if since else until - timedelta(days=1)
+    if since >= until:
+        raise BadRequestException("since must be before until")
+    return ReachService(db).get_reach(event_type, since, until, locale, etag, group_by)
+
+
+@router.get("/emails/export")
+async def export_emails(
+    format: Literal["csv", "ndjson"] = "csv",
+    gzip: bool = False,
+    status: Optional[EmailStatus] = None,
+    source: Optional[EmailSource] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    """
+    Stream the email buffer as CSV or NDJSON, optionally gzipped.
+
+    Rows come in id order from keyset-paginated batches, so memory stays flat
+    for any table size. ``since``/``until`` filter on created_at (UTC, [since, until)).
+    """
+    since = naive_utc(since) if since else None
+    until = naive_utc(until) if until else None
+    if since and until and since >= until:
+        raise BadRequestException("since must be before until")
+
+    chunks = EmailExportService().stream(format, gzip, status, source, since, until)
+    filename = f"landing-emails-{datetime.utcnow():%Y%m%dT%H%M%SZ}.{format}"
+    if gzip:
+        filename += ".gz"
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "private, no-store",
+        },
+    )
@@ -1,27 +1,55 @@
 """Landing page HTTP router."""
-from typing import Optional
+import time
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, Depends, Header, Request, Response, status
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.core.db import get_db
-from app.core.telemetry import logger
+from app.core.http.compression import IDENTITY, select_encoding
+from app.core.http.error_handlers import BadRequestException, PayloadTooLargeException
+from app.core.http.etag import if_none_match_matches, quote_etag
+from app.core.telemetry import get_metrics_registry, logger
 from app.interfaces.analytics_stub import AnalyticsStub
+from app.interfaces.gating_client import get_gating_client
 from app.modules.landing.domain import (
+    AnalyticsBatchResponse,
     CTAClickRequest,
     CTAClickResponse,
     ExitIntentCopyVM,
     JoinEmailRequest,
     JoinEmailResponse,
+    LANDING_SECTIONS,
     LandingPageVM,
+    LandingSessionVM,
 )
+from app.modules.landing.repos import get_variant_cache, section_etags, variant_key
 from app.modules.landing.services import (
     EmailCaptureService,
     LandingAssemblyService,
+    Snapshot,
+    get_analytics_rollup,
+    get_locale_resolver,
+    get_snapshot_store,
 )
+from app.modules.landing.services.analytics_batch import parse_event_batch, to_tracked
+from app.modules.landing.services.assembly_service import sections_etag
+from app.modules.landing.services.instrumentation import STAGE_ANALYTICS_EMIT
 
 router = APIRouter(prefix="/landing/v1", tags=["landing"])
 
+_page_responses = get_metrics_registry().counter(
+    "landing_page_responses_total",
+    "Landing page responses by result",
+    labelnames=("result",),
+)
+_page_not_modified_fast = _page_responses.labels("not_modified_fast")
+_page_not_modified = _page_responses.labels("not_modified")
+_page_ok = _page_responses.labels("ok")
+_page_snapshot = _page_responses.labels("snapshot")
+
 
 def get_session_id(request: Request) -> Optional[str]:
     """Extract session ID from request."""
@@ -32,11 +60,71 @@ def get_session_id(request: Request) -> Optional[str]:
     return session_id
 
 
+# Per-session responses must never be stored by shared caches
+PRIVATE_NO_STORE = "private, no-store"
+
+
+def surrogate_keys(locale: str, cms_etag: str, discovery_rev: str) -> str:
+    """Surrogate-Key header value: purge by locale, CMS revision or Discovery revision."""
+    keys = ("landing", f"landing-{locale}", f"cms-{cms_etag}", f"disc-{discovery_rev}")
+    return " ".join("".join(key.split()) for key in keys)
+
+
+def resolve_locale(request: Request, locale: Optional[str]) -> str:
+    """Supported locale for the ``locale`` parameter, else negotiated from Accept-Language."""
+    return get_locale_resolver().resolve(locale, request.headers.get("Accept-Language"))
+
+
+def _cache_headers(
+    etag: str,
+    locale: Optional[str] = None,
+    tokens: Optional[Tuple[str, str]] = None,
+    negotiated: bool = False,
+) -> dict:
+    """
+    Validator and caching headers shared by 200 and 304 page responses.
+
+    In CDN mode, responses whose revision tokens are known (not fallback
+    pages) also get shared-cache directives and surrogate keys. Responses
+    whose locale came from Accept-Language vary on it.
+    """
+    headers = {
+        "ETag": quote_etag(etag),
+        "Cache-Control": "public, max-age=60",
+        "Vary": "Accept-Encoding, Accept-Language" if negotiated else "Accept-Encoding",
+    }
+    if locale:
+        headers["Content-Language"] = locale
+    settings = get_settings()
+    if settings.cdn_mode and tokens is not None:
+        headers["Cache-Control"] = (
+            f"public, max-age=60, s-maxage={settings.cdn_s_maxage_seconds}, "
+            f"stale-while-revalidate={settings.cdn_stale_while_revalidate_seconds}, "
+            f"stale-if-error={settings.cdn_stale_if_error_seconds}"
+        )
+        headers["Surrogate-Key"] = surrogate_keys(locale, *tokens)
+    return headers
+
+
+def _not_modified(
+    etag: str,
+    locale: Optional[str] = None,
+    tokens: Optional[Tuple[str, str]] = None,
+    negotiated: bool = False,
+) -> Response:
+    """Build a 304 response carrying the validators a 200 would have."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=_cache_headers(etag, locale, tokens, negotiated),
+    )
+
+
 @router.get("/page", response_model=LandingPageVM)
 async def get_landing_page(
     request: Request,
     response: Response,
-    locale: str = "en-US",
+    locale: Optional[str] = None,
+    sections: Optional[str] = None,
     if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
     db: Session = Depends(get_db),
 ):
@@ -45,42 +133,199 @@ async def get_landing_page(
 
     Supports:
     - ETag/304 responses for efficient caching
-    - Locale-specific content
+    - Precompressed gzip/brotli bodies (bypasses GZipMiddleware)
+    - Locale-specific content: ``locale`` (any spelling) or Accept-Language,
+      resolved to a supported locale
     - Session-based gating decisions
+    - ``sections=teaser,hero``: only those sections, with their own etag
+      (compare ``section_etags`` from an earlier response to pick them)
+    - CDN mode: session-independent body, s-maxage and surrogate keys;
+      gating comes from /exit-intent or /session
+    - Static snapshots: a published file for the current etag is sent as is
     """
     session_id = get_session_id(request)
+    assembly_service = LandingAssemblyService(db)
+    settings = get_settings()
+    cdn_mode = settings.cdn_mode
+    negotiated = locale is None
+    locale = resolve_locale(request, locale)
+
+    if sections is not None:
+        return _get_sections(
+            assembly_service,
+            _parse_sections(sections),
+            locale,
+            session_id,
+            if_none_match,
+            negotiated,
+        )
+
+    # Conditional fast path: compare against the etag derived from revision
+    # tokens before touching the cache or assembling anything. CDN mode
+    # needs the tokens for surrogate keys, snapshots to find the file.
+    tokens = None
+    probed_etag = None
+    if if_none_match or cdn_mode or settings.snapshot_enabled:
+        try:
+            probed_etag, tokens = assembly_service.compute_etag(locale)
+        except Exception as e:
+            logger.warning("ETag probe failed, skipping 304 fast path: %s", e)
+        else:
+            if if_none_match_matches(if_none_match, probed_etag):
+                _page_not_modified_fast.inc()
+                return _not_modified(probed_etag, locale, tokens, negotiated)
+
+    # Published snapshot for the current etag: no cache read or assembly
+    if settings.snapshot_enabled and tokens is not None:
+        snapshot = get_snapshot_store().find(locale, probed_etag)
+        if snapshot is not None:
+            return _snapshot_response(request, snapshot, session_id, tokens, negotiated)
 
     # Assemble landing page
-    assembly_service = LandingAssemblyService(db)
-    landing_page = assembly_service.get_landing_page(locale, session_id)
+    landing_page = assembly_service.get_landing_page(locale, session_id, tokens=tokens)
 
-    # Check ETag for 304 Not Modified
+    # Shared-cache headers only for the page the tokens describe (not a fallback)
     etag = landing_page.etag
-    if if_none_match == etag:
-        logger.debug(f"ETag match, returning 304: {etag}")
-        response.status_code = status.HTTP_304_NOT_MODIFIED
-        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    cache_tokens = tokens if etag == probed_etag else None
 
-    # Set ETag header
-    response.headers["ETag"] = etag
-    response.headers["Cache-Control"] = "public, max-age=60"
+    # Check ETag for 304 Not Modified (covers a failed fast-path probe)
+    if if_none_match_matches(if_none_match, etag):
+        logger.debug("ETag match, returning 304: %s", etag)
+        _page_not_modified.inc()
+        return _not_modified(etag, locale, cache_tokens, negotiated)
 
-    # Track impression (optional - could be done client-side)
-    analytics = AnalyticsStub()
-    analytics.track_landing_impression(
+    _track_impression(locale, landing_page.version, etag, session_id)
+
+    # Serve the precompressed variant matching Accept-Encoding
+    variants = get_variant_cache().get_or_build(variant_key(landing_page), landing_page)
+    encoding = select_encoding(request.headers.get("Accept-Encoding"), variants)
+
+    _page_ok.inc()
+    headers = _cache_headers(etag, locale, cache_tokens, negotiated)
+    if encoding != IDENTITY:
+        headers["Content-Encoding"] = encoding
+
+    return Response(
+        content=variants[encoding],
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def _track_impression(
+    locale: str, version: int, etag: str, session_id: Optional[str]
+) -> None:
+    """
+    Track a page impression (optional - could be done client-side).
+
+    Behind a CDN the origin only sees cache misses, so clients report impressions.
+    """
+    # Client-reported events for this etag are then counted under it
+    get_analytics_rollup().register_etag(etag, version)
+    if get_settings().cdn_mode:
+        return
+    started = time.perf_counter_ns()
+    AnalyticsStub().track_landing_impression(
         locale=locale,
-        cms_version=landing_page.version,
+        cms_version=version,
         etag=etag,
         session_id=session_id,
     )
+    STAGE_ANALYTICS_EMIT.observe((time.perf_counter_ns() - started) / 1e9)
 
-    return landing_page
+
+def _snapshot_response(
+    request: Request,
+    snapshot: Snapshot,
+    session_id: Optional[str],
+    tokens: Tuple[str, str],
+    negotiated: bool = False,
+) -> FileResponse:
+    """Send a published snapshot file in the best encoding the client accepts."""
+    _track_impression(snapshot.locale, snapshot.version, snapshot.etag, session_id)
+
+    encoding = select_encoding(request.headers.get("Accept-Encoding"), snapshot.files)
+    path, stat_result = snapshot.files[encoding]
+    headers = _cache_headers(snapshot.etag, snapshot.locale, tokens, negotiated)
+    if encoding != IDENTITY:
+        headers["Content-Encoding"] = encoding
+
+    _page_snapshot.inc()
+    # The stat from publishing is reused, and our ETag wins over Starlette's
+    return FileResponse(
+        path, stat_result=stat_result, media_type="application/json", headers=headers
+    )
+
+
+def _parse_sections(value: str) -> Tuple[str, ...]:
+    """Validate a comma-separated section list."""
+    requested = tuple(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in LANDING_SECTIONS]
+    if unknown or not requested:
+        raise BadRequestException(
+            f"sections must be a comma-separated subset of: {', '.join(LANDING_SECTIONS)}"
+        )
+    return requested
+
+
+def _get_sections(
+    assembly_service: LandingAssemblyService,
+    sections: Tuple[str, ...],
+    locale: str,
+    session_id: Optional[str],
+    if_none_match: Optional[str],
+    negotiated: bool = False,
+) -> Response:
+    """Serve a subset of sections, revalidated on their combined etag."""
+    tokens = None
+    probed_etag = None
+    try:
+        tokens = assembly_service.get_revision_tokens(locale)
+    except Exception as e:
+        logger.warning("Revision probe failed, skipping 304 fast path: %s", e)
+    else:
+        etags = section_etags(locale, *tokens)
+        probed_etag = sections_etag({name: etags[name] for name in sections})
+        if if_none_match_matches(if_none_match, probed_etag):
+            _page_not_modified_fast.inc()
+            return _not_modified(probed_etag, locale, tokens, negotiated)
+
+    # Falls back to placeholder sections when the sources stay unavailable
+    subset = assembly_service.get_sections(sections, locale, session_id, tokens=tokens)
+    etag = subset.etag
+    cache_tokens = tokens if etag == probed_etag else None
+    if if_none_match_matches(if_none_match, etag):
+        _page_not_modified.inc()
+        return _not_modified(etag, locale, cache_tokens, negotiated)
+
+    get_analytics_rollup().register_etag(etag, subset.version)
+    _page_ok.inc()
+    return Response(
+        content=subset.model_dump_json(exclude_unset=True),
+        media_type="application/json",
+        headers=_cache_headers(etag, locale, cache_tokens, negotiated),
+    )
+
+
+@router.get("/session", response_model=LandingSessionVM)
+async def get_session_state(request: Request, response: Response):
+    """
+    Get the per-session part of the landing page (gating decisions).
+
+    Companion to a shared-cacheable page in CDN mode: tiny and never cached.
+    """
+    session_id = get_session_id(request)
+    response.headers["Cache-Control"] = PRIVATE_NO_STORE
+    return LandingSessionVM(
+        can_show_exit_intent=get_gating_client().can_show_exit_intent(session_id)
+    )
 
 
 @router.get("/exit-intent", response_model=Optional[ExitIntentCopyVM])
 async def get_exit_intent(
     request: Request,
-    locale: str = "en-US",
+    response: Response,
+    locale: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
     """
@@ -89,6 +334,8 @@ async def get_exit_intent(
     Returns exit intent modal content and whether it can be shown now.
     """
     session_id = get_session_id(request)
+    locale = resolve_locale(request, locale)
+    response.headers["Cache-Control"] = PRIVATE_NO_STORE
 
     assembly_service = LandingAssemblyService(db)
     exit_intent = assembly_service.get_exit_intent(locale, session_id)
@@ -138,13 +385,50 @@ async def track_cta_click(
         placement=cta_request.placement,
         label=cta_request.label,
         action=cta_request.action,
-        locale=cta_request.locale,
+        locale=get_locale_resolver().resolve(cta_request.locale),
         session_id=session_id,
     )
 
     return CTAClickResponse(ok=True)
 
 
+@router.post(
+    "/events",
+    response_model=AnalyticsBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def track_events(request: Request):
+    """
+    Track a batch of client analytics events (fire-and-forget).
+
+    Body is a JSON array or newline-delimited JSON of impression, cta_click
+    and exit_intent_shown events. Also accepts ``navigator.sendBeacon``
+    payloads (text/plain). Invalid events are dropped and counted.
+    """
+    settings = get_settings()
+    body = await _read_body(request, settings.analytics_batch_max_bytes)
+    events, rejected = parse_event_batch(body, settings.analytics_batch_max_events)
+
+    session_id = get_session_id(request)
+    started = time.perf_counter_ns()
+    AnalyticsStub().track_events(to_tracked(event, session_id) for event in events)
+    STAGE_ANALYTICS_EMIT.observe((time.perf_counter_ns() - started) / 1e9)
+
+    return AnalyticsBatchResponse(ok=True, accepted=len(events), rejected=rejected)
+
+
+async def _read_body(request: Request, limit: int) -> bytes:
+    """Read the request body, refusing more than ``limit`` bytes."""
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            raise PayloadTooLargeException(f"Event batch exceeds {limit} bytes")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
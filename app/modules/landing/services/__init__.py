@@ -1,5 +1,54 @@
 """Landing module services."""
+from .analytics_rollup import (
+    AnalyticsRollup,
+    get_analytics_rollup,
+    start_analytics_rollup,
+    stop_analytics_rollup,
+)
 from .assembly_service import LandingAssemblyService
+from .cache_invalidation import (
+    CacheInvalidationHandler,
+    RevisionRegistry,
+    get_revision_registry,
+    register_landing_event_handlers,
+    stop_landing_event_handlers,
+)
+from .cache_janitor import CacheJanitor, start_cache_janitor
+from .email_export import EXPORT_FORMATS, EmailExportService
 from .email_service import EmailCaptureService
+from .instrumentation import register_landing_metrics
+from .locales import get_locale_resolver
+from .reach_service import ReachService
+from .snapshot_service import (
+    Snapshot,
+    SnapshotStore,
+    get_snapshot_store,
+    publish_snapshot,
+    publish_snapshots,
+)
 
-__all__ = ["LandingAssemblyService", "EmailCaptureService"]
+__all__ = [
+    "LandingAssemblyService",
+    "EmailCaptureService",
+    "EmailExportService",
+    "EXPORT_FORMATS",
+    "CacheInvalidationHandler",
+    "RevisionRegistry",
+    "get_revision_registry",
+    "register_landing_event_handlers",
+    "stop_landing_event_handlers",
+    "CacheJanitor",
+    "start_cache_janitor",
+    "register_landing_metrics",
+    "get_locale_resolver",
+    "AnalyticsRollup",
+    "get_analytics_rollup",
+    "start_analytics_rollup",
+    "stop_analytics_rollup",
+    "ReachService",
+    "Snapshot",
+    "SnapshotStore",
+    "get_snapshot_store",
+    "publish_snapshot",
+    "publish_snapshots",
+]
@@ -0,0 +1,88 @@
+"""Parsing for batched client analytics events.
+
+Accepts a JSON array or newline-delimited JSON (one event per line).
+``navigator.sendBeacon`` bodies arrive as ``text/plain`` and are handled the
+same way: the format is picked from the first non-blank byte, not the
+content type.
+
+The batch is validated in one ``TypeAdapter`` pass straight from the bytes.
+If any event is invalid, the valid ones are kept and the rest counted as
+rejected, so one bad event does not drop a whole beacon.
+"""
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.core.http.error_handlers import BadRequestException
+from app.modules.landing.domain import AnalyticsEventIn
+
+from .locales import get_locale_resolver
+
+EVENT_TYPES = {
+    "impression": "landing.impression",
+    "cta_click": "landing.cta_click",
+    "exit_intent_shown": "landing.exit_intent_shown",
+}
+
+_batch_adapter = TypeAdapter(List[AnalyticsEventIn])
+_event_adapter = TypeAdapter(AnalyticsEventIn)
+
+
+def parse_event_batch(body: bytes, max_events: int) -> Tuple[List[AnalyticsEventIn], int]:
+    """Parse and validate a batch. Returns (valid events, rejected count)."""
+    body = body.strip()
+    if not body:
+        return [], 0
+
+    is_array = body[:1] == b"["
+    document = body if is_array else b"[" + b",".join(_lines(body)) + b"]"
+    try:
+        events = _batch_adapter.validate_json(document)
+        rejected = 0
+    except ValidationError:
+        events, rejected = _validate_each(body, is_array)
+
+    if len(events) > max_events:
+        rejected += len(events) - max_events
+        events = events[:max_events]
+    return events, rejected
+
+
+def to_tracked(event: AnalyticsEventIn, session_id: Optional[str]) -> Tuple[str, Dict[str, Any]]:
+    """(event_type, payload) for the analytics adapter."""
+    payload = event.model_dump(exclude={"type"})
+    # Rollup dimensions stay bounded to the supported locales
+    payload["locale"] = get_locale_resolver().resolve(payload.get("locale"))
+    if payload.get("session_id") is None:
+        payload["session_id"] = session_id
+    return EVENT_TYPES[event.type], payload
+
+
+def _lines(body: bytes) -> List[bytes]:
+    return [line for line in body.splitlines() if line.strip()]
+
+
+def _validate_each(body: bytes, is_array: bool) -> Tuple[List[AnalyticsEventIn], int]:
+    """Slow path: validate events one by one, skipping bad ones."""
+    rejected = 0
+    if is_array:
+        try:
+            items = json.loads(body)
+        except ValueError:
+            raise BadRequestException("Malformed event batch")
+    else:
+        items = []
+        for line in _lines(body):
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                rejected += 1
+
+    events = []
+    for item in items:
+        try:
+            events.append(_event_adapter.validate_python(item))
+        except ValidationError:
+            rejected += 1
+    return events, rejected
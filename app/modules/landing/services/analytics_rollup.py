@@ -0,0 +1,234 @@
+"""Streaming pre-aggregation of landing analytics events into rollup counters.
+
+Subscribed to ``landing.*``: each event adds one to the counter for
+(bucket, event type, locale, cms_version, etag, placement, action). Keys map
+to slots in a compact ``array('q')`` of counts; the per-event cost is one
+dict lookup and an add. The number of distinct keys, and so of slots
+between flushes, is bounded by the dimension caps below.
+
+Client-supplied dimensions are bounded before they become keys: placements
+outside ``analytics_rollup_placements`` count as ``other``, and etags the
+process has not served count as ``other`` (cms_version 0). Served etags are
+registered by the page routes, with their CMS version, which replaces the
+client's.
+
+Impressions and exit-intent exposures carrying a session ID also go into a
+HyperLogLog sketch per (reach bucket, event type, locale, etag), so unique
+reach costs fixed memory instead of a stored set of session IDs.
+
+A background task swaps the buffers out every
+``analytics_rollup_flush_interval_seconds``. Counters are upserted, one row
+per key, into ``landing_analytics_rollup``. Sketches are unioned into
+``landing_reach_sketches``. State is per process; rows written by several
+workers add up (counters) or merge (sketches).
+"""
+import asyncio
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.core.events import Event, EventDispatcher, get_event_dispatcher
+from app.core.telemetry import get_metrics_registry, logger
+from app.core.utils import HyperLogLog
+from app.modules.landing.repos import AnalyticsRollupRepository
+from app.modules.landing.repos.rollup_repo import ReachKey, RollupKey
+
+LANDING_EVENTS = "landing.*"
+REACH_EVENTS = frozenset({"landing.impression", "landing.exit_intent_shown"})
+# Dimension value for client-supplied placements and etags that are not known
+OTHER = "other"
+
+# (event_type, locale, cms_version, etag, placement, action)
+Dimensions = Tuple[str, str, int, str, str, str]
+# (bucket epoch seconds, event_type, locale, etag)
+SketchKey = Tuple[int, str, str, str]
+
+_rows_written = get_metrics_registry().counter(
+    "landing_rollup_rows_written_total",
+    "Rollup rows upserted by the analytics aggregator",
+)
+
+
+class AnalyticsRollup:
+    """In-process counters for landing events, flushed as rollup rows."""
+
+    def __init__(
+        self,
+        session_factory: Callable = SessionLocal,
+        bucket_seconds: Optional[int] = None,
+        reach_bucket_seconds: Optional[int] = None,
+        reach_precision: Optional[int] = None,
+        placements: Optional[Iterable[str]] = None,
+        max_known_etags: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.bucket_seconds = bucket_seconds or settings.analytics_rollup_bucket_seconds
+        self.reach_bucket_seconds = reach_bucket_seconds or settings.analytics_reach_bucket_seconds
+        self.reach_precision = reach_precision or settings.analytics_reach_precision
+        self.placements = frozenset(
+            settings.analytics_rollup_placements if placements is None else placements
+        )
+        self.max_known_etags = max_known_etags or settings.analytics_rollup_known_etags
+        self._known_etags: "OrderedDict[str, int]" = OrderedDict()
+        self._slots: Dict[Tuple[int, Dimensions], int] = {}
+        self._counts = array("q")
+        self._sketches: Dict[SketchKey, HyperLogLog] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._slots) + len(self._sketches)
+
+    def register_etag(self, etag: str, cms_version: int) -> None:
+        """Accept events for a served page etag (the latest ``max_known_etags`` are kept)."""
+        if etag in self._known_etags:
+            return
+        with self._lock:
+            self._known_etags[etag] = cms_version
+            if len(self._known_etags) > self.max_known_etags:
+                self._known_etags.popitem(last=False)
+
+    def handle(self, event: Event) -> None:
+        """Count one event (dispatcher handler)."""
+        payload = event.payload
+        etag = payload.get("etag") or ""
+        cms_version = 0
+        if etag:
+            cms_version = self._known_etags.get(etag)
+            if cms_version is None:
+                etag, cms_version = OTHER, 0
+        placement = payload.get("placement") or ""
+        if placement and placement not in self.placements:
+            placement = OTHER
+        dimensions = (
+            event.event_type,
+            payload.get("locale") or "",
+            cms_version,
+            etag,
+            placement,
+            payload.get("action") or "",
+        )
+        now = int(time.time())
+        self.add((now - now % self.bucket_seconds, dimensions))
+
+        session_id = payload.get("session_id")
+        if session_id and event.event_type in REACH_EVENTS:
+            bucket = now - now % self.reach_bucket_seconds
+            self.add_session((bucket, event.event_type, dimensions[1], dimensions[3]), session_id)
+
+    def add_session(self, key: SketchKey, session_id: str) -> None:
+        """Add a session to the reach sketch for (bucket, event_type, locale, etag)."""
+        with self._lock:
+            sketch = self._sketches.get(key)
+            if sketch is None:
+                sketch = self._sketches[key] = HyperLogLog(self.reach_precision)
+            sketch.add(session_id)
+
+    def add(self, key: Tuple[int, Dimensions], count: int = 1) -> None:
+        """Add to the counter for (bucket epoch seconds, dimensions)."""
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is not None:
+                self._counts[slot] += count
+                return
+            self._slots[key] = len(self._counts)
+            self._counts.append(count)
+
+    def flush(self) -> int:
+        """Write pending counters and sketches (blocking). Returns rows written."""
+        with self._lock:
+            slots, counts, sketches = self._slots, self._counts, self._sketches
+            self._slots, self._counts, self._sketches = {}, array("q"), {}
+        if not slots and not sketches:
+            return 0
+
+        rows: List[Tuple[RollupKey, int]] = [
+            ((datetime.utcfromtimestamp(bucket), *dimensions), counts[slot])
+            for (bucket, dimensions), slot in slots.items()
+        ]
+        reach: List[Tuple[ReachKey, bytes]] = [
+            ((datetime.utcfromtimestamp(key[0]), *key[1:]), sketch.to_bytes())
+            for key, sketch in sketches.items()
+        ]
+        written = 0
+        db = self.session_factory()
+        try:
+            repo = AnalyticsRollupRepository(db)
+            written += repo.add_counts(rows)
+            slots = {}
+            written += repo.merge_sketches(reach)
+            sketches = {}
+        except Exception:
+            # Keep what was not written for the next flush
+            self._restore(slots, counts, sketches)
+            raise
+        finally:
+            db.close()
+
+        _rows_written.inc(written)
+        logger.debug("Analytics rollup flushed %d rows", written)
+        return written
+
+    def _restore(
+        self,
+        slots: Dict[Tuple[int, Dimensions], int],
+        counts: array,
+        sketches: Dict[SketchKey, HyperLogLog],
+    ) -> None:
+        for key, slot in slots.items():
+            self.add(key, counts[slot])
+        with self._lock:
+            for key, sketch in sketches.items():
+                current = self._sketches.get(key)
+                self._sketches[key] = sketch.merge(current) if current is not None else sketch
+
+    async def run_forever(self, interval_seconds: int) -> None:
+        """Flush on an interval, off the event loop thread."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception as e:
+                logger.error("Analytics rollup flush failed: %s", e, exc_info=e)
+
+
+@lru_cache
+def get_analytics_rollup() -> AnalyticsRollup:
+    """Get singleton analytics rollup aggregator."""
+    return AnalyticsRollup()
+
+
+def start_analytics_rollup(
+    dispatcher: Optional[EventDispatcher] = None,
+) -> Optional[asyncio.Task]:
+    """Subscribe the aggregator and start its flush task if enabled. Call from the app lifespan."""
+    settings = get_settings()
+    if not settings.analytics_rollup_enabled:
+        return None
+    rollup = get_analytics_rollup()
+    (dispatcher or get_event_dispatcher()).register(LANDING_EVENTS, rollup.handle)
+    get_metrics_registry().register_callback(
+        "landing_rollup_pending_keys",
+        "Rollup counters and reach sketches waiting to be flushed",
+        lambda: {(): len(rollup)},
+    )
+    return asyncio.create_task(
+        rollup.run_forever(settings.analytics_rollup_flush_interval_seconds)
+    )
+
+
+def stop_analytics_rollup(task: Optional[asyncio.Task]) -> None:
+    """Stop the flush task and write what is pending. Call before closing the DB."""
+    if task is None:
+        return
+    task.cancel()
+    try:
+        get_analytics_rollup().flush()
+    except Exception as e:
+        logger.error("Final analytics rollup flush failed: %s", e, exc_info=e)
@@ -1,19 +1,56 @@
 """Landing page assembly service."""
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.core.security import generate_etag
-from app.core.telemetry import logger
+from app.core.telemetry import get_logger, logger
+from app.core.utils import LocaleResolver
 from app.interfaces.cms_stub import CMSStub
 from app.interfaces.discovery_stub import DiscoveryStub
-from app.interfaces.gating_stub import GatingStub
+from app.interfaces.gating_client import GatingClient, get_gating_client
 from app.modules.landing.domain import (
+    LANDING_SECTIONS,
     ExitIntentCopyVM,
     LandingPageVM,
+    LandingSectionsVM,
     TeaserSectionVM,
 )
-from app.modules.landing.repos import AssemblyCacheRepository
+from app.modules.landing.repos import (
+    AssemblyCacheRepository,
+    FragmentCache,
+    ResponseVariantCache,
+    get_fragment_cache,
+    get_variant_cache,
+    section_etags,
+    variant_key,
+)
+from app.modules.landing.repos.fragment_cache import section_tokens
+
+from .cache_invalidation import RevisionRegistry, get_revision_registry
+from .instrumentation import (
+    CACHE_HIT,
+    CACHE_MISS,
+    STAGE_ASSEMBLY,
+    STAGE_CACHE_GET,
+    STAGE_CACHE_SET,
+    STAGE_ETAG_PROBE,
+)
+from .locales import get_locale_resolver
+
+# Per-request hit/miss lines; rate limited via the log_rate_limits setting
+cache_logger = get_logger("landing.cache")
+
+# Page field holding each section, where the names differ
+SECTION_FIELDS = {"disclaimers": "disclaimers_html"}
+
+
+def sections_etag(etags: Dict[str, str]) -> str:
+    """ETag of a section subset response."""
+    return generate_etag(*(f"{section}={etag}" for section, etag in sorted(etags.items())))
 
 
 class LandingAssemblyService:
@@ -24,116 +61,374 @@ class LandingAssemblyService:
         db: Session,
         cms: Optional[CMSStub] = None,
         discovery: Optional[DiscoveryStub] = None,
-        gating: Optional[GatingStub] = None,
+        gating: Optional[GatingClient] = None,
+        variant_cache: Optional[ResponseVariantCache] = None,
+        revisions: Optional[RevisionRegistry] = None,
+        fragments: Optional[FragmentCache] = None,
+        session_independent: Optional[bool] = None,
+        locales: Optional[LocaleResolver] = None,
     ):
         self.db = db
+        self.settings = get_settings()
         self.cache_repo = AssemblyCacheRepository(db)
         self.cms = cms or CMSStub()
         self.discovery = discovery or DiscoveryStub()
-        self.gating = gating or GatingStub()
+        self.gating = gating or get_gating_client()
+        self.variant_cache = variant_cache or get_variant_cache()
+        self.revisions = revisions or get_revision_registry()
+        self.fragments = fragments if fragments is not None else get_fragment_cache()
+        # None follows cdn_mode; snapshot publishing forces shared bodies
+        self.session_independent = session_independent
+        # Every cache below is keyed on resolved (supported, canonical) locales
+        self.locales = locales or get_locale_resolver()
+
+    def get_revision_tokens(self, locale: str = "en-US") -> Tuple[str, str]:
+        """
+        Get the (cms_etag, discovery_rev) pair the page is keyed on.
+
+        In event-driven mode the tokens pushed by upstream events are used and
+        CMS/Discovery are only probed when the registry has nothing current.
+        """
+        locale = self.locales.resolve(locale)
+        started = time.perf_counter_ns()
+        if self.settings.cache_event_driven:
+            tokens = self.revisions.get(locale)
+            if tokens:
+                STAGE_ETAG_PROBE.observe((time.perf_counter_ns() - started) / 1e9)
+                return tokens
+            generation = self.revisions.generation
+
+        cms_etag = self.cms.get_cms_etag(locale)
+        discovery_rev = self.discovery.get_discovery_revision(limit=3)
+
+        if self.settings.cache_event_driven:
+            self.revisions.seed(locale, (cms_etag, discovery_rev), generation)
+        STAGE_ETAG_PROBE.observe((time.perf_counter_ns() - started) / 1e9)
+        return cms_etag, discovery_rev
+
+    def get_revision_tokens_many(self, locales: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+        """Revision tokens for several locales, probing Discovery once for all of them."""
+        locales = list(dict.fromkeys(self.locales.resolve(locale) for locale in locales))
+        tokens: Dict[str, Tuple[str, str]] = {}
+        missing = locales
+        if self.settings.cache_event_driven:
+            generation = self.revisions.generation
+            for locale in locales:
+                known = self.revisions.get(locale)
+                if known:
+                    tokens[locale] = known
+            missing = [locale for locale in locales if locale not in tokens]
+
+        if missing:
+            # The Discovery revision covers all locales
+            discovery_rev = self.discovery.get_discovery_revision(limit=3)
+            for locale in missing:
+                tokens[locale] = (self.cms.get_cms_etag(locale), discovery_rev)
+                if self.settings.cache_event_driven:
+                    self.revisions.seed(locale, tokens[locale], generation)
+        return {locale: tokens[locale] for locale in locales}
+
+    def compute_etag(self, locale: str = "en-US") -> Tuple[str, Tuple[str, str]]:
+        """
+        Compute the page etag from revision tokens only, without assembly.
+
+        Returns the etag and the tokens so callers can pass them on to
+        get_landing_page instead of probing the sources twice.
+        """
+        tokens = self.get_revision_tokens(locale)
+        return generate_etag(*tokens), tokens
 
     def get_landing_page(
-        self, locale: str = "en-US", session_id: Optional[str] = None
+        self,
+        locale: str = "en-US",
+        session_id: Optional[str] = None,
+        tokens: Optional[Tuple[str, str]] = None,
     ) -> LandingPageVM:
         """
         Get assembled landing page with caching.
 
         Assembly flow:
-        1. Get CMS etag and Discovery revision
+        1. Get CMS etag and Discovery revision (unless already probed)
         2. Check cache for existing assembly
         3. If cache miss or expired, assemble from sources
-        4. Cache the result
+        4. Cache the result and its precompressed response variants
         5. Return view model
         """
+        locale = self.locales.resolve(locale)
         try:
             # Get ETags from sources
-            cms_etag = self.cms.get_cms_etag(locale)
-            discovery_rev = self.discovery.get_discovery_revision(limit=3)
+            cms_etag, discovery_rev = tokens or self.get_revision_tokens(locale)
 
-            # Try cache first
-            cached = self.cache_repo.get(locale, cms_etag, discovery_rev)
+            # Try cache first; an unavailable cache is a miss, not an outage
+            started = time.perf_counter_ns()
+            cached = self._read_cache(locale, cms_etag, discovery_rev)
+            STAGE_CACHE_GET.observe((time.perf_counter_ns() - started) / 1e9)
             if cached:
-                logger.debug(
-                    f"Cache hit for landing page: {locale}, {cms_etag}, {discovery_rev}"
+                CACHE_HIT.inc()
+                cache_logger.debug(
+                    "Cache hit for landing page: %s, %s, %s", locale, cms_etag, discovery_rev
                 )
                 # Update exit_intent.can_show_now from Gating (dynamic)
                 if cached.exit_intent:
-                    cached.exit_intent.can_show_now = self.gating.can_show_exit_intent(
+                    cached.exit_intent.can_show_now = self._page_can_show_exit_intent(
                         session_id
                     )
                 return cached
 
             # Cache miss - assemble from sources
-            logger.info(
-                f"Cache miss for landing page: {locale}, {cms_etag}, {discovery_rev}"
+            CACHE_MISS.inc()
+            cache_logger.info(
+                "Cache miss for landing page: %s, %s, %s", locale, cms_etag, discovery_rev
             )
+            started = time.perf_counter_ns()
             landing_page = self._assemble_from_sources(
                 locale, cms_etag, discovery_rev, session_id
             )
-
-            # Cache the result
-            self.cache_repo.set(locale, cms_etag, discovery_rev, landing_page)
-
-            return landing_page
+            STAGE_ASSEMBLY.observe((time.perf_counter_ns() - started) / 1e9)
 
         except Exception as e:
-            logger.error(f"Error assembling landing page: {e}", exc_info=e)
+            logger.error("Error assembling landing page: %s", e, exc_info=e)
             # Return fallback minimal page
             return self._get_fallback_page(locale)
 
-    def _assemble_from_sources(
+        # Cache the result, compressing the response body once here rather
+        # than on every request. A failed write still serves the page.
+        started = time.perf_counter_ns()
+        try:
+            self.cache_repo.set(
+                locale, cms_etag, discovery_rev, landing_page, ttl_seconds=self._cache_ttl()
+            )
+        except Exception as e:
+            logger.error("Error caching landing page for %s: %s", locale, e, exc_info=e)
+        self.variant_cache.put(variant_key(landing_page), landing_page)
+        STAGE_CACHE_SET.observe((time.perf_counter_ns() - started) / 1e9)
+
+        return landing_page
+
+    def _read_cache(
+        self, locale: str, cms_etag: str, discovery_rev: str
+    ) -> Optional[LandingPageVM]:
+        """Cached page, or None on a miss or when the cache backend fails."""
+        try:
+            return self.cache_repo.get(locale, cms_etag, discovery_rev)
+        except Exception as e:
+            logger.warning("Cache read failed for %s: %s", locale, e)
+            return None
+
+    def get_landing_pages(
         self,
+        locales: Iterable[str],
+        session_id: Optional[str] = None,
+        tokens: Optional[Dict[str, Tuple[str, str]]] = None,
+    ) -> Dict[str, LandingPageVM]:
+        """
+        Get assembled landing pages for several locales in one pass.
+
+        Revision tokens come from a single Discovery probe, cache misses are
+        assembled concurrently and written back in one cache transaction.
+        A locale that fails to assemble gets the fallback page. Keys are the
+        resolved locales.
+        """
+        locales = list(dict.fromkeys(self.locales.resolve(locale) for locale in locales))
+        try:
+            all_tokens = tokens or self.get_revision_tokens_many(locales)
+        except Exception as e:
+            logger.error("Error probing revision tokens: %s", e, exc_info=e)
+            return {locale: self._get_fallback_page(locale) for locale in locales}
+
+        pages: Dict[str, LandingPageVM] = {}
+        missing = []
+        started = time.perf_counter_ns()
+        for locale in locales:
+            cached = self._read_cache(locale, *all_tokens[locale])
+            if cached:
+                CACHE_HIT.inc()
+                if cached.exit_intent:
+                    cached.exit_intent.can_show_now = self._page_can_show_exit_intent(
+                        session_id
+                    )
+                pages[locale] = cached
+            else:
+                missing.append(locale)
+        STAGE_CACHE_GET.observe((time.perf_counter_ns() - started) / 1e9)
+        if not missing:
+            return pages
+
+        CACHE_MISS.inc(len(missing))
+        cache_logger.info("Cache miss for landing pages: %s", ", ".join(missing))
+        started = time.perf_counter_ns()
+        built = self._assemble_many(missing, all_tokens, session_id)
+        STAGE_ASSEMBLY.observe((time.perf_counter_ns() - started) / 1e9)
+
+        started = time.perf_counter_ns()
+        try:
+            self.cache_repo.set_many(
+                [(locale, *all_tokens[locale], page) for locale, page in built.items()],
+                ttl_seconds=self._cache_ttl(),
+            )
+        except Exception as e:
+            logger.error("Error caching landing pages: %s", e, exc_info=e)
+        for page in built.values():
+            self.variant_cache.put(variant_key(page), page)
+        STAGE_CACHE_SET.observe((time.perf_counter_ns() - started) / 1e9)
+
+        pages.update(built)
+        return {
+            locale: pages.get(locale) or self._get_fallback_page(locale) for locale in locales
+        }
+
+    def _assemble_many(
+        self,
+        locales: List[str],
+        tokens: Dict[str, Tuple[str, str]],
+        session_id: Optional[str] = None,
+    ) -> Dict[str, LandingPageVM]:
+        """Assemble locales from sources concurrently. Failed locales are left out."""
+
+        def assemble(locale: str) -> Optional[LandingPageVM]:
+            try:
+                return self._assemble_from_sources(locale, *tokens[locale], session_id)
+            except Exception as e:
+                logger.error("Error assembling landing page for %s: %s", locale, e, exc_info=e)
+                return None
+
+        # Assembly reads CMS, Discovery and fragments only, never self.db
+        workers = min(len(locales), self.settings.assembly_batch_workers)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(assemble, locales))
+        else:
+            results = [assemble(locale) for locale in locales]
+        return {locale: page for locale, page in zip(locales, results) if page is not None}
+
+    def _cache_ttl(self) -> int:
+        """Cache TTL; long when events keep entries fresh, as a safety net only."""
+        if self.settings.cache_event_driven:
+            return self.settings.cache_event_driven_ttl_seconds
+        return self.settings.cache_ttl_seconds
+
+    def get_sections(
+        self,
+        sections: Collection[str],
+        locale: str = "en-US",
+        session_id: Optional[str] = None,
+        tokens: Optional[Tuple[str, str]] = None,
+    ) -> LandingSectionsVM:
+        """Build only the requested sections, from fragments."""
+        locale = self.locales.resolve(locale)
+        try:
+            cms_etag, discovery_rev = tokens or self.get_revision_tokens(locale)
+            etags = section_etags(locale, cms_etag, discovery_rev)
+            selected = {name: etag for name, etag in etags.items() if name in sections}
+            fields = {
+                SECTION_FIELDS.get(name, name): self._section(
+                    name, locale, cms_etag, discovery_rev, session_id
+                )
+                for name in selected
+            }
+        except Exception as e:
+            logger.error("Error assembling landing sections: %s", e, exc_info=e)
+            return self._get_fallback_sections(sections, locale)
+        return LandingSectionsVM(
+            locale=locale,
+            version=self._version(locale, cms_etag),
+            etag=sections_etag(selected),
+            section_etags=selected,
+            **fields,
+        )
+
+    def _fragment(
+        self, name: str, locale: str, tokens: Tuple[str, ...], build: Callable[[], Any]
+    ) -> Any:
+        """Cached fragment keyed on the tokens it depends on."""
+        return self.fragments.get_or_build((name, locale, *tokens), build)
+
+    def _section(
+        self,
+        section: str,
         locale: str,
         cms_etag: str,
         discovery_rev: str,
         session_id: Optional[str] = None,
-    ) -> LandingPageVM:
-        """Assemble landing page from all sources."""
-        # Get all components
-        hero = self.cms.get_hero(locale)
-        testimonials = self.cms.get_testimonials(locale)
-        disclaimers_html = self.cms.get_disclaimers_html(locale)
-        teaser_config = self.cms.get_teaser_config(locale)
-        exit_intent_copy = self.cms.get_exit_intent_copy(locale)
+    ) -> Any:
+        """One page section, from the fragment cache or its source."""
+        tokens = section_tokens(section, cms_etag, discovery_rev)
+        if section == "hero":
+            return self._fragment(section, locale, tokens, lambda: self.cms.get_hero(locale))
+        if section == "testimonials":
+            return self._fragment(
+                section, locale, tokens, lambda: self.cms.get_testimonials(locale)
+            )
+        if section == "disclaimers":
+            return self._fragment(
+                section, locale, tokens, lambda: self.cms.get_disclaimers_html(locale)
+            )
+        if section == "teaser":
+            return self._fragment(section, locale, tokens, lambda: self._build_teaser(locale))
+        if section == "exit_intent":
+            copy = self._fragment(
+                section, locale, tokens, lambda: self.cms.get_exit_intent_copy(locale)
+            )
+            if not copy:
+                return None
+            # Shared fragment: the per-session gating decision goes on a copy
+            return copy.model_copy(
+                update={"can_show_now": self._page_can_show_exit_intent(session_id)}
+            )
+        raise ValueError(f"Unknown landing section: {section}")
 
-        # Get teaser campaigns from Discovery
-        campaigns = self.discovery.get_top_campaigns(limit=3)
+    def _page_can_show_exit_intent(self, session_id: Optional[str]) -> bool:
+        """Gating bit embedded in the page: always False for shared bodies (CDN, snapshots)."""
+        shared = self.session_independent
+        if shared is None:
+            shared = self.settings.cdn_mode
+        if shared:
+            return False
+        return self.gating.can_show_exit_intent(session_id)
 
-        # Build teaser section with mask_after config
-        teaser = TeaserSectionVM(
+    def _build_teaser(self, locale: str) -> TeaserSectionVM:
+        """Teaser section: Discovery campaigns with the CMS teaser config."""
+        teaser_config = self.cms.get_teaser_config(locale)
+        campaigns = self.discovery.get_top_campaigns(limit=3, locale=locale)
+        return TeaserSectionVM(
             title="Featured Opportunities",
             items=campaigns,
             mask_after=teaser_config.get("mask_after", 2),
         )
 
-        # Get exit intent gating decision
-        can_show_exit = self.gating.can_show_exit_intent(session_id)
-        if exit_intent_copy:
-            exit_intent_copy.can_show_now = can_show_exit
-        else:
-            exit_intent_copy = None
+    def _version(self, locale: str, cms_etag: str) -> int:
+        """CMS content version (cached like a CMS section)."""
+
+        def build() -> int:
+            return self.cms.get_published_landing_content(locale).get("version", 1)
+
+        return self._fragment("version", locale, (cms_etag,), build)
 
-        # Generate composite ETag
-        etag = generate_etag(cms_etag, discovery_rev)
+    def _assemble_from_sources(
+        self,
+        locale: str,
+        cms_etag: str,
+        discovery_rev: str,
+        session_id: Optional[str] = None,
+    ) -> LandingPageVM:
+        """Compose the landing page from section fragments (built from sources on a miss)."""
 
-        # Get CMS version
-        cms_content = self.cms.get_published_landing_content(locale)
-        version = cms_content.get("version", 1)
+        def section(name: str) -> Any:
+            return self._section(name, locale, cms_etag, discovery_rev, session_id)
 
-        # Assemble final view model
-        landing_page = LandingPageVM(
+        return LandingPageVM(
             locale=locale,
-            version=version,
-            etag=etag,
-            hero=hero,
-            teaser=teaser,
-            testimonials=testimonials,
-            disclaimers_html=disclaimers_html,
-            exit_intent=exit_intent_copy,
+            version=self._version(locale, cms_etag),
+            # Composite ETag
+            etag=generate_etag(cms_etag, discovery_rev),
+            hero=section("hero"),
+            teaser=section("teaser"),
+            testimonials=section("testimonials"),
+            disclaimers_html=section("disclaimers"),
+            exit_intent=section("exit_intent"),
+            section_etags=section_etags(locale, cms_etag, discovery_rev),
         )
 
-        return landing_page
-
     def _get_fallback_page(self, locale: str = "en-US") -> LandingPageVM:
         """Get minimal fallback page when assembly fails."""
         from app.modules.landing.domain import CTA, HeroVM, TeaserSectionVM
@@ -159,15 +454,34 @@ class LandingAssemblyService:
             exit_intent=None,
         )
 
+    def _get_fallback_sections(
+        self, sections: Collection[str], locale: str = "en-US"
+    ) -> LandingSectionsVM:
+        """Requested sections of the fallback page."""
+        page = self._get_fallback_page(locale)
+        selected = [name for name in LANDING_SECTIONS if name in sections]
+        fields = {
+            SECTION_FIELDS.get(name, name): getattr(page, SECTION_FIELDS.get(name, name))
+            for name in selected
+        }
+        return LandingSectionsVM(
+            locale=locale,
+            version=page.version,
+            etag=page.etag,
+            section_etags={name: page.etag for name in selected},
+            **fields,
+        )
+
     def get_exit_intent(
         self, locale: str = "en-US", session_id: Optional[str] = None
     ) -> Optional[ExitIntentCopyVM]:
         """Get exit intent copy with gating decision."""
+        locale = self.locales.resolve(locale)
         try:
             exit_intent = self.cms.get_exit_intent_copy(locale)
             if exit_intent:
                 exit_intent.can_show_now = self.gating.can_show_exit_intent(session_id)
             return exit_intent
         except Exception as e:
-            logger.error(f"Error getting exit intent: {e}", exc_info=e)
+            logger.error("Error getting exit intent: %s", e, exc_info=e)
             return None
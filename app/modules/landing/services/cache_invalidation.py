@@ -0,0 +1,243 @@
+"""Event-driven freshness for the landing assembly cache.
+
+CMS and Discovery announce changes through ``app.core.events``
+(``cms.published``, ``discovery.ranking_changed``). The landing module keeps
+the latest revision tokens pushed by those events so page requests no longer
+probe both upstreams on every view, drops cache entries for superseded
+tokens and, optionally, rebuilds the affected locales right away.
+
+The dispatcher is in-process, so each worker only sees events emitted in its
+own process. Registry entries therefore expire after
+``cache_event_reprobe_seconds`` (about the page's ``max-age``) and are
+re-probed, which bounds staleness in workers that missed an event.
+
+Deletes and rebuilds run on a background thread, not in ``emit()``: the
+publisher's thread (often a request) only queues the work. Refreshes queued
+while one runs are merged into the next.
+"""
+import queue
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.core.events import Event, EventDispatcher, get_event_dispatcher
+from app.core.telemetry import logger
+from app.interfaces.cms_stub import CMS_PUBLISHED
+from app.interfaces.discovery_stub import DISCOVERY_RANKING_CHANGED
+
+Tokens = Tuple[str, str]  # (cms_etag, discovery_rev)
+CacheKey = Tuple[str, str, str]  # (locale, cms_etag, discovery_rev)
+Refresh = Tuple[List[CacheKey], List[str]]  # (stale keys, locales to rebuild)
+
+
+class RevisionRegistry:
+    """Latest known revision tokens per locale, kept current by events."""
+
+    def __init__(self, ttl_seconds: int = 60):
+        self.ttl_seconds = ttl_seconds
+        self._cms_etags: Dict[str, Tuple[str, float]] = {}
+        self._discovery_rev: Optional[Tuple[str, float]] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every event; guards seeding against races."""
+        return self._generation
+
+    def get(self, locale: str) -> Optional[Tokens]:
+        """Get tokens for a locale, or None if unknown or due for a re-probe."""
+        cms = self._cms_etags.get(locale)
+        discovery = self._discovery_rev
+        if cms is None or discovery is None:
+            return None
+
+        cutoff = time.monotonic() - self.ttl_seconds
+        if cms[1] < cutoff or discovery[1] < cutoff:
+            return None
+        return cms[0], discovery[0]
+
+    def seed(self, locale: str, tokens: Tokens, generation: int) -> None:
+        """Record probed tokens unless an event arrived since the probe started."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            now = time.monotonic()
+            self._cms_etags[locale] = (tokens[0], now)
+            self._discovery_rev = (tokens[1], now)
+
+    def locales(self) -> List[str]:
+        """Locales that have been served by this process."""
+        return list(self._cms_etags)
+
+    def cms_published(self, locale: Optional[str], cms_etag: Optional[str]) -> List[CacheKey]:
+        """Apply a CMS publish (all locales if locale is None). Returns stale keys."""
+        with self._lock:
+            self._generation += 1
+            affected = [locale] if locale else list(self._cms_etags)
+            discovery = self._discovery_rev
+            stale = []
+            for loc in affected:
+                previous = self._cms_etags.pop(loc, None)
+                if previous and discovery:
+                    stale.append((loc, previous[0], discovery[0]))
+                if cms_etag:
+                    self._cms_etags[loc] = (cms_etag, time.monotonic())
+            return stale
+
+    def discovery_changed(self, discovery_rev: Optional[str]) -> List[CacheKey]:
+        """Apply a Discovery ranking change. Returns stale keys."""
+        with self._lock:
+            self._generation += 1
+            previous = self._discovery_rev
+            self._discovery_rev = (discovery_rev, time.monotonic()) if discovery_rev else None
+            if not previous:
+                return []
+            return [(loc, cms[0], previous[0]) for loc, cms in self._cms_etags.items()]
+
+
+@lru_cache
+def get_revision_registry() -> RevisionRegistry:
+    """Get singleton revision registry."""
+    return RevisionRegistry(ttl_seconds=get_settings().cache_event_reprobe_seconds)
+
+
+class CacheInvalidationHandler:
+    """Reacts to upstream change events for the landing cache."""
+
+    def __init__(
+        self,
+        registry: Optional[RevisionRegistry] = None,
+        session_factory: Callable = SessionLocal,
+        rebuild: Optional[bool] = None,
+    ):
+        settings = get_settings()
+        self.registry = registry or get_revision_registry()
+        self.session_factory = session_factory
+        self.rebuild = settings.cache_rebuild_on_event if rebuild is None else rebuild
+        # None is the stop sentinel
+        self._queue: "queue.Queue[Optional[Refresh]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+    def on_cms_published(self, event: Event) -> None:
+        """Handle cms.published: drop superseded entries for the locale(s)."""
+        locale = event.payload.get("locale")
+        stale_keys = self.registry.cms_published(locale, event.payload.get("cms_etag"))
+        locales = [locale] if locale else [key[0] for key in stale_keys]
+        self._schedule(stale_keys, locales)
+
+    def on_discovery_ranking_changed(self, event: Event) -> None:
+        """Handle discovery.ranking_changed: drop superseded entries everywhere."""
+        stale_keys = self.registry.discovery_changed(event.payload.get("discovery_rev"))
+        self._schedule(stale_keys, self.registry.locales())
+
+    def wait(self) -> None:
+        """Block until every queued refresh has run."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Finish queued refreshes, then stop the worker thread."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+
+    def _schedule(self, stale_keys: List[CacheKey], locales: List[str]) -> None:
+        """Queue a refresh for the worker thread (registry tokens are already current)."""
+        if not stale_keys and not (self.rebuild and locales):
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="landing-cache-refresh", daemon=True
+                )
+                self._worker.start()
+        self._queue.put((stale_keys, locales))
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            stale_keys, locales = list(item[0]), list(item[1])
+            merged = 1
+            stop = False
+            # Coalesce a burst of events into one delete + rebuild pass
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                merged += 1
+                if item is None:
+                    stop = True
+                    break
+                stale_keys.extend(item[0])
+                locales.extend(item[1])
+            try:
+                self._refresh(list(dict.fromkeys(stale_keys)), list(dict.fromkeys(locales)))
+            finally:
+                for _ in range(merged):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _refresh(self, stale_keys: List[CacheKey], locales: List[str]) -> None:
+        """Delete superseded cache entries and optionally rebuild locales."""
+        # Imported here: the assembly service depends on this module
+        from .assembly_service import LandingAssemblyService
+
+        db = self.session_factory()
+        try:
+            service = LandingAssemblyService(db)
+            for key in stale_keys:
+                service.cache_repo.delete(*key)
+            if self.rebuild and locales:
+                service.get_landing_pages(locales)
+            logger.info(
+                "Landing cache refreshed: %d invalidated, %d rebuilt",
+                len(stale_keys),
+                len(locales) if self.rebuild else 0,
+            )
+        except Exception as e:
+            logger.error("Error refreshing landing cache: %s", e, exc_info=e)
+        finally:
+            db.close()
+
+        # Republish so page requests go back to the static files right away
+        if self.rebuild and locales and get_settings().snapshot_enabled:
+            from .snapshot_service import publish_snapshots
+
+            try:
+                publish_snapshots(locales)
+            except Exception as e:
+                logger.error("Error republishing landing snapshots: %s", e, exc_info=e)
+
+
+def register_landing_event_handlers(
+    dispatcher: Optional[EventDispatcher] = None,
+    handler: Optional[CacheInvalidationHandler] = None,
+) -> CacheInvalidationHandler:
+    """Subscribe the landing module to upstream change events."""
+    dispatcher = dispatcher or get_event_dispatcher()
+    handler = handler or _get_default_handler()
+    dispatcher.register(CMS_PUBLISHED, handler.on_cms_published)
+    dispatcher.register(DISCOVERY_RANKING_CHANGED, handler.on_discovery_ranking_changed)
+    return handler
+
+
+def stop_landing_event_handlers() -> None:
+    """Let the default handler finish queued refreshes and stop its worker."""
+    if _get_default_handler.cache_info().currsize:
+        _get_default_handler().close()
+
+
+@lru_cache
+def _get_default_handler() -> CacheInvalidationHandler:
+    return CacheInvalidationHandler()
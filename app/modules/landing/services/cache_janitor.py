@@ -0,0 +1,129 @@
+"""Background janitor for the landing assembly cache table.
+
+Every (locale, cms_etag, discovery_rev) combination adds a row, so the
+table grows with each upstream revision. The janitor trims it in small
+rowid batches (each its own short transaction) instead of one long DELETE
+holding the SQLite write lock:
+
+1. Flush buffered cache-hit times into ``last_accessed_at``
+2. Delete expired rows, oldest first, via ``idx_landing_cache_exp``
+3. Evict least-recently-used rows while over the row/byte caps
+"""
+import asyncio
+import time
+from typing import Callable, Optional
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.core.telemetry import get_metrics_registry, logger
+from app.modules.landing.domain import CacheJanitorReport
+from app.modules.landing.repos import SQLiteCacheBackend, get_access_tracker
+
+_reclaimed_rows = get_metrics_registry().counter(
+    "landing_cache_janitor_reclaimed_rows_total",
+    "Cache rows removed by the janitor",
+    labelnames=("reason",),
+)
+_reclaimed_bytes = get_metrics_registry().counter(
+    "landing_cache_janitor_reclaimed_bytes_total",
+    "Cache payload bytes removed by the janitor",
+    labelnames=("reason",),
+)
+
+
+class CacheJanitor:
+    """Incremental, bounded cleanup of landing_assembly_cache."""
+
+    def __init__(
+        self,
+        session_factory: Callable = SessionLocal,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        pause_seconds: float = 0.01,
+    ):
+        settings = get_settings()
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.cache_janitor_batch_size
+        self.max_batches = max_batches or settings.cache_janitor_max_batches
+        self.max_rows = max_rows or settings.cache_max_rows
+        self.max_bytes = max_bytes or settings.cache_max_bytes
+        self.pause_seconds = pause_seconds
+
+    def run_once(self) -> CacheJanitorReport:
+        """Run one cleanup pass (blocking). Returns what was reclaimed."""
+        started = time.perf_counter()
+        report = CacheJanitorReport()
+
+        db = self.session_factory()
+        try:
+            backend = SQLiteCacheBackend(db)
+            report.touched_keys = backend.touch_many(get_access_tracker().drain())
+
+            batches = 0
+            while batches < self.max_batches:
+                rows, size = backend.delete_expired_batch(self.batch_size)
+                batches += 1
+                report.expired_rows += rows
+                report.expired_bytes += size
+                if rows < self.batch_size:
+                    break
+                # Let request writers in between batches
+                time.sleep(self.pause_seconds)
+
+            total_rows, total_bytes = backend.stats()
+            while batches < self.max_batches and (
+                total_rows > self.max_rows or total_bytes > self.max_bytes
+            ):
+                # Over the row cap only: evict no more rows than needed
+                limit = self.batch_size
+                if total_bytes <= self.max_bytes:
+                    limit = min(limit, total_rows - self.max_rows)
+                rows, size = backend.delete_lru_batch(limit)
+                batches += 1
+                if not rows:
+                    break
+                report.evicted_rows += rows
+                report.evicted_bytes += size
+                total_rows -= rows
+                total_bytes -= size
+                time.sleep(self.pause_seconds)
+
+            report.remaining_rows = total_rows
+            report.remaining_bytes = total_bytes
+        finally:
+            db.close()
+
+        report.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+        _reclaimed_rows.labels("expired").inc(report.expired_rows)
+        _reclaimed_rows.labels("evicted").inc(report.evicted_rows)
+        _reclaimed_bytes.labels("expired").inc(report.expired_bytes)
+        _reclaimed_bytes.labels("evicted").inc(report.evicted_bytes)
+
+        logger.info(
+            "Cache janitor reclaimed %d rows (%d bytes) in %sms",
+            report.expired_rows + report.evicted_rows,
+            report.expired_bytes + report.evicted_bytes,
+            report.duration_ms,
+            extra={"janitor": report.model_dump()},
+        )
+        return report
+
+    async def run_forever(self, interval_seconds: int) -> None:
+        """Run passes on an interval, off the event loop thread."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception as e:
+                logger.error("Cache janitor run failed: %s", e, exc_info=e)
+
+
+def start_cache_janitor() -> Optional[asyncio.Task]:
+    """Start the janitor task if enabled. Call from the app lifespan."""
+    settings = get_settings()
+    if not settings.cache_janitor_enabled:
+        return None
+    janitor = CacheJanitor()
+    return asyncio.create_task(janitor.run_forever(settings.cache_janitor_interval_seconds))
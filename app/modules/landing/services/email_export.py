@@ -0,0 +1,112 @@
+"""Streaming export of the email buffer as CSV or NDJSON.
+
+Rows are read in keyset-paginated batches and encoded batch by batch into
+byte chunks, optionally gzipped on the fly. No pydantic models are built
+and nothing beyond one batch is held, so memory stays flat whatever the
+table size. Each stream opens its own DB session: a streamed response
+outlives the request's dependencies.
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.core.telemetry import get_metrics_registry, logger
+from app.modules.landing.domain import EmailSource, EmailStatus
+from app.modules.landing.repos import EmailBufferRepository
+from app.modules.landing.repos.email_repo import EMAIL_COLUMNS
+
+EXPORT_FORMATS = ("csv", "ndjson")
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+# Spreadsheet apps run cells starting with these as formulas
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+_rows_exported = get_metrics_registry().counter(
+    "landing_email_export_rows_total",
+    "Email buffer rows written by exports",
+)
+
+
+def _csv_cell(value):
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def encode_csv(batches: Iterable[List[Tuple]]) -> Iterator[bytes]:
+    """CSV chunks: a header row, then one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EMAIL_COLUMNS)
+    yield buffer.getvalue().encode("utf-8")
+    for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([[_csv_cell(value) for value in row] for row in rows])
+        yield buffer.getvalue().encode("utf-8")
+
+
+def encode_ndjson(batches: Iterable[List[Tuple]]) -> Iterator[bytes]:
+    """NDJSON chunks: one JSON object per row, one chunk per batch."""
+    for rows in batches:
+        yield "".join(
+            json.dumps(dict(zip(EMAIL_COLUMNS, row)), default=str) + "\n" for row in rows
+        ).encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip a chunk stream incrementally (a single gzip member)."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+class EmailExportService:
+    """Streams email buffer exports."""
+
+    def __init__(self, session_factory: Callable = SessionLocal):
+        self.session_factory = session_factory
+        self.batch_size = get_settings().email_export_batch_size
+
+    def stream(
+        self,
+        format: str = "csv",
+        compress: bool = False,
+        status: Optional[EmailStatus] = None,
+        source: Optional[EmailSource] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[bytes]:
+        """Export chunks for the filtered rows. Lazy: nothing is read until iterated."""
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+        encode = encode_csv if format == "csv" else encode_ndjson
+        chunks = encode(self._batches(status, source, since, until))
+        return gzip_chunks(chunks) if compress else chunks
+
+    def _batches(
+        self,
+        status: Optional[EmailStatus],
+        source: Optional[EmailSource],
+        since: Optional[datetime],
+        until: Optional[datetime],
+    ) -> Iterator[List[Tuple]]:
+        exported = 0
+        db = self.session_factory()
+        try:
+            repo = EmailBufferRepository(db)
+            for rows in repo.iter_rows(status, source, since, until, self.batch_size):
+                exported += len(rows)
+                _rows_exported.inc(len(rows))
+                yield rows
+        finally:
+            db.close()
+            logger.info("Email export ended after %d rows", exported)
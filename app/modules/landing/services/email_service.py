@@ -39,7 +39,7 @@ class EmailCaptureService:
         try:
             # Check for recent duplicate (24h suppression)
             if self.email_repo.exists_recent(request.email, hours=24):
-                logger.info(f"Duplicate email capture attempt: {request.email}")
+                logger.info("Duplicate email capture attempt: %s", request.email)
                 return JoinEmailResponse(
                     ok=True,
                     message="You're already on our list! Check your inbox soon.",
@@ -60,7 +60,7 @@ class EmailCaptureService:
 
             # Store in buffer
             entry_id = self.email_repo.create(entry)
-            logger.info(f"Email captured: id={entry_id}, source={request.source}")
+            logger.info("Email captured: id=%s, source=%s", entry_id, request.source)
 
             # Emit analytics event (with hashed email for privacy)
             email_hashed = hash_email(request.email)
@@ -80,7 +80,7 @@ class EmailCaptureService:
             )
 
         except Exception as e:
-            logger.error(f"Error capturing email: {e}", exc_info=e)
+            logger.error("Error capturing email: %s", e, exc_info=e)
             return JoinEmailResponse(
                 ok=False,
                 message="Something went wrong. Please try again.",
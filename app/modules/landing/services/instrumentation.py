@@ -0,0 +1,59 @@
+"""Landing module metrics: per-stage timings, cache hit ratio, buffer depth.
+
+Stage children are resolved once at import so the request path only pays
+for ``perf_counter_ns`` and an ``observe`` call.
+"""
+from typing import Callable, Dict, Tuple
+
+from app.core.db import SessionLocal
+from app.core.telemetry import get_metrics_registry
+from app.modules.landing.repos import EmailBufferRepository
+
+_registry = get_metrics_registry()
+
+_stage_duration = _registry.histogram(
+    "landing_stage_duration_seconds",
+    "Time spent in each landing page stage",
+    labelnames=("stage",),
+)
+STAGE_ETAG_PROBE = _stage_duration.labels("etag_probe")
+STAGE_CACHE_GET = _stage_duration.labels("cache_get")
+STAGE_ASSEMBLY = _stage_duration.labels("assembly")
+STAGE_CACHE_SET = _stage_duration.labels("cache_set")
+STAGE_ANALYTICS_EMIT = _stage_duration.labels("analytics_emit")
+
+_cache_lookups = _registry.counter(
+    "landing_cache_lookups_total",
+    "Assembly cache lookups by result",
+    labelnames=("result",),
+)
+CACHE_HIT = _cache_lookups.labels("hit")
+CACHE_MISS = _cache_lookups.labels("miss")
+
+
+def _cache_hit_ratio() -> Dict[Tuple[str, ...], float]:
+    """Hit ratio over all lookups since process start."""
+    total = CACHE_HIT.value + CACHE_MISS.value
+    return {(): CACHE_HIT.value / total if total else 0.0}
+
+
+def register_landing_metrics(session_factory: Callable = SessionLocal) -> None:
+    """Register scrape-time landing gauges. Call once at startup."""
+
+    def email_buffer_depth() -> Dict[Tuple[str, ...], float]:
+        db = session_factory()
+        try:
+            return {(): EmailBufferRepository(db).count_by_status("new")}
+        finally:
+            db.close()
+
+    _registry.register_callback(
+        "landing_cache_hit_ratio",
+        "Assembly cache hits / lookups since process start",
+        _cache_hit_ratio,
+    )
+    _registry.register_callback(
+        "landing_email_buffer_depth",
+        "Captured emails waiting to be synced",
+        email_buffer_depth,
+    )
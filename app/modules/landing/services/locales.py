@@ -0,0 +1,16 @@
+"""Resolution of request locales to the configured landing locales."""
+from functools import lru_cache
+
+from app.core.config import get_settings
+from app.core.utils import LocaleResolver
+
+
+@lru_cache
+def get_locale_resolver() -> LocaleResolver:
+    """Get singleton locale resolver (supported_locales, default_locale)."""
+    settings = get_settings()
+    return LocaleResolver(
+        settings.supported_locales,
+        settings.default_locale,
+        max_entries=settings.locale_memo_size,
+    )
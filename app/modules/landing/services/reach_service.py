@@ -0,0 +1,61 @@
+"""Unique-session reach queries over stored HyperLogLog sketches."""
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.utils import HyperLogLog
+from app.modules.landing.domain import ReachEventType, ReachReport
+from app.modules.landing.repos import AnalyticsRollupRepository
+
+# group_by value -> index into ReachKey (bucket_start, event_type, locale, etag)
+GROUP_BY_FIELDS = {"bucket": 0, "locale": 2, "etag": 3}
+
+
+class ReachService:
+    """Service for merging reach sketches across buckets, locales and etags."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.repo = AnalyticsRollupRepository(db)
+
+    def get_reach(
+        self,
+        event_type: ReachEventType,
+        since: datetime,
+        until: datetime,
+        locale: Optional[str] = None,
+        etag: Optional[str] = None,
+        group_by: Optional[str] = None,
+    ) -> ReachReport:
+        """Estimate unique sessions in [since, until), optionally per group."""
+        rows = self.repo.get_sketches(event_type, since, until, locale, etag)
+
+        total: Optional[HyperLogLog] = None
+        grouped: Dict[str, HyperLogLog] = {}
+        for key, data in rows:
+            sketch = HyperLogLog.from_bytes(data)
+            if group_by:
+                group = str(key[GROUP_BY_FIELDS[group_by]])
+                current = grouped.get(group)
+                grouped[group] = sketch if current is None else current.merge(sketch)
+                # Group sketches are reused for the total, so merge a copy
+                sketch = HyperLogLog.from_bytes(data)
+            total = sketch if total is None else total.merge(sketch)
+
+        if total is None:
+            total = HyperLogLog(get_settings().analytics_reach_precision)
+        return ReachReport(
+            event_type=event_type,
+            since=since,
+            until=until,
+            locale=locale,
+            etag=etag,
+            unique_sessions=total.count(),
+            relative_error=round(total.relative_error(), 4),
+            sketches=len(rows),
+            groups={group: sketch.count() for group, sketch in grouped.items()}
+            if group_by
+            else None,
+        )
@@ -0,0 +1,243 @@
+"""Static snapshots of the landing page, served from disk.
+
+Publishing assembles the session-independent page of each locale once and
+writes it, with precompressed variants, as immutable files named by etag::
+
+    <snapshot_dir>/<locale>/<etag>.json        identity body
+    <snapshot_dir>/<locale>/<etag>.json.gz     gzip (and .json.br with brotli)
+    <snapshot_dir>/<locale>/<etag>.meta.json   CMS version, for impressions
+
+Each file is written to a temp name and renamed into place, identity last,
+so a snapshot is visible only once complete. The page route serves the
+snapshot whose etag matches the current revision tokens as a file response:
+no cache read, model construction or serialization per request. When tokens
+move on, requests fall back to live assembly until the next publish, so a
+stale snapshot is never served, only left unused.
+"""
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from app.core.config import get_settings
+from app.core.db import SessionLocal
+from app.core.http.compression import IDENTITY, compress_variants
+from app.core.security import generate_etag
+from app.core.telemetry import get_metrics_registry, logger
+
+from .assembly_service import LandingAssemblyService
+
+SUFFIXES = {IDENTITY: ".json", "gzip": ".json.gz", "br": ".json.br"}
+META_SUFFIX = ".meta.json"
+# Locale and etag end up in file paths: accept plain tags and hex etags only
+_LOCALE_PATTERN = re.compile(r"^[A-Za-z]{2,8}(-[A-Za-z0-9]{1,8})*$")
+_ETAG_PATTERN = re.compile(r"^[0-9a-f]{1,64}$")
+
+_snapshots_published = get_metrics_registry().counter(
+    "landing_snapshots_published_total",
+    "Landing page snapshots written to disk",
+)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """A published snapshot: file path and stat per content coding."""
+
+    locale: str
+    etag: str
+    version: int
+    files: Dict[str, Tuple[str, os.stat_result]]
+
+
+class SnapshotStore:
+    """Snapshot files under one directory, with an in-process index of lookups."""
+
+    def __init__(self, directory: str, keep: int = 3, max_index_entries: int = 1024):
+        self.directory = Path(directory)
+        self.keep = keep
+        self.max_index_entries = max_index_entries
+        self._index: Dict[Tuple[str, str], Snapshot] = {}
+        self._lock = threading.Lock()
+
+    def find(self, locale: str, etag: str) -> Optional[Snapshot]:
+        """Get the snapshot for (locale, etag), or None if not published."""
+        key = (locale, etag)
+        snapshot = self._index.get(key)
+        if snapshot is not None:
+            return snapshot
+        if not (_LOCALE_PATTERN.match(locale) and _ETAG_PATTERN.match(etag)):
+            return None
+
+        snapshot = self._load(locale, etag)
+        if snapshot is not None:
+            with self._lock:
+                if len(self._index) >= self.max_index_entries:
+                    self._index.clear()
+                self._index[key] = snapshot
+        return snapshot
+
+    def _load(self, locale: str, etag: str) -> Optional[Snapshot]:
+        base = self.directory / locale / etag
+        try:
+            # Identity is renamed into place last: its presence means complete
+            identity = os.stat(f"{base}{SUFFIXES[IDENTITY]}")
+            with open(f"{base}{META_SUFFIX}") as f:
+                version = json.load(f)["version"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+        files = {IDENTITY: (f"{base}{SUFFIXES[IDENTITY]}", identity)}
+        for encoding, suffix in SUFFIXES.items():
+            if encoding == IDENTITY:
+                continue
+            try:
+                files[encoding] = (f"{base}{suffix}", os.stat(f"{base}{suffix}"))
+            except OSError:
+                continue
+        return Snapshot(locale=locale, etag=etag, version=version, files=files)
+
+    def publish(self, locale: str, etag: str, version: int, body: bytes) -> Snapshot:
+        """Write a snapshot (a no-op if this etag is already published) and prune old ones."""
+        if not (_LOCALE_PATTERN.match(locale) and _ETAG_PATTERN.match(etag)):
+            raise ValueError(f"Cannot publish snapshot for {locale!r}/{etag!r}")
+        directory = self.directory / locale
+        directory.mkdir(parents=True, exist_ok=True)
+        base = directory / etag
+
+        identity = f"{base}{SUFFIXES[IDENTITY]}"
+        if os.path.exists(identity):
+            # Same etag, same content: only mark it as the newest for pruning
+            os.utime(identity)
+        else:
+            variants = compress_variants(body, minimum_size=0)
+            self._write(f"{base}{META_SUFFIX}", json.dumps({"version": version}).encode())
+            for encoding, data in variants.items():
+                if encoding != IDENTITY:
+                    self._write(f"{base}{SUFFIXES[encoding]}", data)
+            self._write(identity, variants[IDENTITY])
+            _snapshots_published.inc()
+
+        self.prune(locale)
+        snapshot = self._load(locale, etag)
+        if snapshot is None:
+            raise OSError(f"Snapshot {base} vanished after publishing")
+        return snapshot
+
+    @staticmethod
+    def _write(path: str, data: bytes) -> None:
+        """Write atomically: temp file in the same directory, then rename."""
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    def prune(self, locale: str) -> int:
+        """Delete all but the ``keep`` newest snapshots of a locale. Returns how many."""
+        directory = self.directory / locale
+        identity = SUFFIXES[IDENTITY]
+        published = sorted(
+            (path for path in directory.glob(f"*{identity}")
+             if not path.name.endswith(META_SUFFIX)),
+            key=lambda path: path.stat().st_mtime_ns,
+            reverse=True,
+        )
+        removed = 0
+        for path in published[self.keep:]:
+            etag = path.name[: -len(identity)]
+            # Identity first, so concurrent lookups stop seeing it as complete
+            for suffix in (identity, META_SUFFIX, SUFFIXES["gzip"], SUFFIXES["br"]):
+                try:
+                    os.unlink(directory / f"{etag}{suffix}")
+                except FileNotFoundError:
+                    pass
+            with self._lock:
+                self._index.pop((locale, etag), None)
+            removed += 1
+        return removed
+
+
+def default_snapshot_dir() -> str:
+    """Snapshot directory when snapshot_dir is not set."""
+    return str(get_settings().base_dir / "var" / "landing-snapshots")
+
+
+@lru_cache
+def get_snapshot_store() -> SnapshotStore:
+    """Get singleton snapshot store."""
+    settings = get_settings()
+    return SnapshotStore(
+        settings.snapshot_dir or default_snapshot_dir(), keep=settings.snapshot_keep
+    )
+
+
+def publish_snapshot(
+    locale: str,
+    store: Optional[SnapshotStore] = None,
+    session_factory: Callable = SessionLocal,
+) -> Optional[Snapshot]:
+    """Assemble a locale's session-independent page and publish it. None for fallback pages."""
+    snapshots = publish_snapshots(
+        [locale], workers=1, store=store, session_factory=session_factory
+    )
+    # Keyed by the resolved locale, which may be spelled differently
+    return next(iter(snapshots.values()), None)
+
+
+def publish_snapshots(
+    locales: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    store: Optional[SnapshotStore] = None,
+    session_factory: Callable = SessionLocal,
+) -> Dict[str, Optional[Snapshot]]:
+    """
+    Publish several locales: one batch assembly, then files written in parallel.
+
+    Results are keyed by resolved locale. Locales that fall back or fail to
+    write map to None.
+    """
+    settings = get_settings()
+    requested = locales or settings.snapshot_locales or settings.supported_locales
+    store = store or get_snapshot_store()
+
+    db = session_factory()
+    try:
+        service = LandingAssemblyService(db, session_independent=True)
+        tokens = service.get_revision_tokens_many(requested)
+        locales = list(tokens)
+        pages = service.get_landing_pages(locales, None, tokens=tokens)
+    finally:
+        db.close()
+
+    def publish(locale: str) -> Optional[Snapshot]:
+        page = pages[locale]
+        if page.etag != generate_etag(*tokens[locale]):
+            logger.warning("Not publishing snapshot for %s: assembly fell back", locale)
+            return None
+        try:
+            snapshot = store.publish(
+                locale, page.etag, page.version, page.model_dump_json().encode("utf-8")
+            )
+        except Exception as e:
+            # One failing locale must not keep the others from publishing
+            logger.error("Publishing snapshot for %s failed: %s", locale, e, exc_info=e)
+            return None
+        logger.info("Published landing snapshot %s/%s", locale, page.etag)
+        return snapshot
+
+    # Compression (zlib, brotli) and file writes release the GIL
+    with ThreadPoolExecutor(max_workers=workers or settings.snapshot_workers) as pool:
+        return dict(zip(locales, pool.map(publish, locales)))
@@ -2,6 +2,40 @@
 import sys
 from pathlib import Path
 
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
 # Add app to Python path
 app_dir = Path(__file__).resolve().parent.parent.parent.parent
 sys.path.insert(0, str(app_dir))
+
+from app.modules.landing.migrations import run_migrations  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_fragment_cache():
+    """Section fragments are process-wide: keep them from leaking between tests."""
+    from app.modules.landing.repos import get_fragment_cache
+
+    get_fragment_cache().clear()
+
+
+@pytest.fixture
+def session_factory():
+    """Session factory bound to a shared in-memory database with the landing schema."""
+    engine = create_engine("sqlite://")
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    run_migrations(db)
+    db.close()
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    """In-memory SQLite session with the landing schema."""
+    session = session_factory()
+    yield session
+    session.close()
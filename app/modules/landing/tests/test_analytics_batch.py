@@ -0,0 +1,66 @@
+"""Tests for batched analytics ingestion."""
+import json
+
+import pytest
+
+from app.core.events import EventDispatcher
+from app.core.http.error_handlers import BadRequestException
+from app.interfaces.analytics_stub import AnalyticsStub
+from app.modules.landing.services.analytics_batch import parse_event_batch, to_tracked
+
+CLICK = {"type": "cta_click", "placement": "hero.primary", "label": "Join", "action": "open_signup"}
+SHOWN = {"type": "exit_intent_shown", "locale": "es-US"}
+IMPRESSION = {"type": "impression", "section": "teaser", "session_id": "sess_1"}
+
+
+def test_parses_json_array_and_ndjson():
+    """Test both framings yield the same typed events."""
+    array = json.dumps([CLICK, SHOWN, IMPRESSION]).encode()
+    ndjson = b"\n".join(json.dumps(item).encode() for item in (CLICK, SHOWN, IMPRESSION)) + b"\n"
+
+    for body in (array, ndjson):
+        events, rejected = parse_event_batch(body, max_events=10)
+        assert [event.type for event in events] == ["cta_click", "exit_intent_shown", "impression"]
+        assert rejected == 0
+
+
+def test_invalid_events_are_dropped_not_fatal():
+    """Test one bad event does not reject the rest of the batch."""
+    bad_action = {**CLICK, "action": "launch_rockets"}
+    unknown = {"type": "scroll"}
+    lines = [json.dumps(CLICK), "{not json", json.dumps(bad_action), json.dumps(unknown)]
+    body = "\n".join(lines + [json.dumps(SHOWN)]).encode()
+
+    events, rejected = parse_event_batch(body, max_events=10)
+
+    assert [event.type for event in events] == ["cta_click", "exit_intent_shown"]
+    assert rejected == 3
+
+
+def test_batch_limits():
+    """Test extra events are rejected and a malformed array is a bad request."""
+    events, rejected = parse_event_batch(json.dumps([SHOWN] * 5).encode(), max_events=3)
+    assert (len(events), rejected) == (3, 2)
+
+    assert parse_event_batch(b"  ", max_events=3) == ([], 0)
+    with pytest.raises(BadRequestException):
+        parse_event_batch(b"[{", max_events=3)
+
+
+def test_track_events_emits_one_batch():
+    """Test the batch reaches handlers with the request session filled in."""
+    dispatcher = EventDispatcher()
+    received = []
+    dispatcher.register("landing.cta_click", received.append)
+    dispatcher.register("landing.impression", received.append)
+    analytics = AnalyticsStub()
+    analytics.dispatcher = dispatcher
+    events, _ = parse_event_batch(json.dumps([CLICK, SHOWN, IMPRESSION]).encode(), 10)
+
+    assert analytics.track_events(to_tracked(event, "sess_header") for event in events) == 3
+
+    assert [(e.event_type, e.payload["session_id"]) for e in received] == [
+        ("landing.cta_click", "sess_header"),
+        ("landing.impression", "sess_1"),
+    ]
+    assert received[0].payload["placement"] == "hero.primary"
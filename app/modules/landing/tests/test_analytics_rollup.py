@@ -0,0 +1,167 @@
+"""Tests for streaming analytics rollups."""
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.core.events import Event, EventDispatcher
+from app.modules.landing.repos import AnalyticsRollupRepository
+from app.modules.landing.services import AnalyticsRollup, ReachService
+from app.modules.landing.services.analytics_rollup import LANDING_EVENTS
+
+
+def _click(placement):
+    return Event(
+        event_type="landing.cta_click",
+        payload={"placement": placement, "action": "open_signup", "locale": "en-US"},
+    )
+
+
+def test_client_dimensions_are_bounded(session_factory):
+    """Test unknown placements and unserved etags collapse into "other"."""
+    rollup = AnalyticsRollup(session_factory=session_factory, bucket_seconds=60)
+    rollup.register_etag("served1", 7)
+
+    def impression(etag, cms_version):
+        return Event(
+            event_type="landing.impression",
+            payload={"locale": "en-US", "etag": etag, "cms_version": cms_version},
+        )
+
+    with patch("app.modules.landing.services.analytics_rollup.time.time", return_value=120.5):
+        for i in range(50):
+            rollup.handle(_click(f"attacker-{i}"))
+            rollup.handle(impression(f"forged-{i}", i))
+        rollup.handle(impression("served1", 999))
+        rollup.handle(_click("hero.primary"))
+
+    rollup.flush()
+    db = session_factory()
+    rows = AnalyticsRollupRepository(db).get_counts(datetime(1970, 1, 1))
+    db.close()
+    counts = {key[1:]: count for key, count in rows}
+    assert counts == {
+        ("landing.cta_click", "en-US", 0, "", "other", "open_signup"): 50,
+        ("landing.cta_click", "en-US", 0, "", "hero.primary", "open_signup"): 1,
+        ("landing.impression", "en-US", 0, "other", "", ""): 50,
+        ("landing.impression", "en-US", 7, "served1", "", ""): 1,
+    }
+
+
+def test_wildcard_subscription_counts_per_dimension(session_factory):
+    """Test landing.* events collapse into one row per bucket and dimensions."""
+    rollup = AnalyticsRollup(session_factory=session_factory, bucket_seconds=60)
+    dispatcher = EventDispatcher()
+    dispatcher.register(LANDING_EVENTS, rollup.handle)
+
+    with patch("app.modules.landing.services.analytics_rollup.time.time", return_value=120.5):
+        dispatcher.emit_many([_click("hero.primary")] * 3 + [_click("exit_intent")])
+        dispatcher.emit(Event(event_type="landing.impression", payload={"locale": "en-US"}))
+        dispatcher.emit(Event(event_type="cms.published", payload={"locale": "en-US"}))
+
+    assert len(rollup) == 3
+    assert rollup.flush() == 3
+    assert len(rollup) == 0
+
+    db = session_factory()
+    rows = AnalyticsRollupRepository(db).get_counts(datetime(1970, 1, 1))
+    db.close()
+    counts = {key[1:]: count for key, count in rows}
+    assert counts == {
+        ("landing.cta_click", "en-US", 0, "", "exit_intent", "open_signup"): 1,
+        ("landing.cta_click", "en-US", 0, "", "hero.primary", "open_signup"): 3,
+        ("landing.impression", "en-US", 0, "", "", ""): 1,
+    }
+
+
+def test_flushes_add_to_existing_rows(session_factory):
+    """Test repeated flushes (or several workers) sum into the same row."""
+    rollup = AnalyticsRollup(session_factory=session_factory, bucket_seconds=60)
+    key = (60, ("landing.cta_click", "en-US", 0, "", "hero.primary", "open_signup"))
+
+    rollup.add(key, 2)
+    rollup.flush()
+    rollup.add(key, 5)
+    rollup.flush()
+
+    db = session_factory()
+    rows = AnalyticsRollupRepository(db).get_counts(datetime(1970, 1, 1), "landing.cta_click")
+    db.close()
+    assert [count for _, count in rows] == [7]
+
+
+def test_failed_flush_keeps_counts(session_factory):
+    """Test counts survive a failed write and go out with the next flush."""
+    rollup = AnalyticsRollup(session_factory=session_factory, bucket_seconds=60)
+    key = (60, ("landing.impression", "en-US", 3, "abc", "", ""))
+    rollup.add(key, 4)
+
+    with patch.object(AnalyticsRollupRepository, "add_counts", side_effect=RuntimeError("locked")):
+        with pytest.raises(RuntimeError):
+            rollup.flush()
+    rollup.add(key)
+
+    assert len(rollup) == 1
+    assert rollup.flush() == 1
+    db = session_factory()
+    rows = AnalyticsRollupRepository(db).get_counts(datetime(1970, 1, 1))
+    db.close()
+    assert [count for _, count in rows] == [5]
+
+
+def test_reach_sketches_merge_across_workers(session_factory):
+    """Test per-worker sketches union in the table and report unique sessions."""
+    workers = [
+        AnalyticsRollup(session_factory=session_factory, reach_bucket_seconds=3600)
+        for _ in range(2)
+    ]
+    with patch("app.modules.landing.services.analytics_rollup.time.time", return_value=7200.0):
+        for worker, sessions in zip(workers, (range(0, 300), range(200, 500))):
+            for i in sessions:
+                worker.handle(
+                    Event(
+                        event_type="landing.impression",
+                        payload={"locale": "es-US" if i % 2 else "en-US", "session_id": f"s{i}"},
+                    )
+                )
+            # Exposures without a session are counted but not in reach
+            worker.handle(Event(event_type="landing.exit_intent_shown", payload={}))
+            worker.flush()
+
+    db = session_factory()
+    report = ReachService(db).get_reach(
+        "landing.impression", datetime(1970, 1, 1), datetime(1970, 1, 2), group_by="locale"
+    )
+    db.close()
+
+    assert report.sketches == 2
+    assert report.unique_sessions == pytest.approx(500, rel=0.05)
+    assert report.groups == {
+        "en-US": pytest.approx(250, rel=0.05),
+        "es-US": pytest.approx(250, rel=0.05),
+    }
+
+
+def test_reach_merges_sketches_after_precision_change(session_factory):
+    """Test flushes and reach queries survive a changed analytics_reach_precision."""
+    with patch("app.modules.landing.services.analytics_rollup.time.time", return_value=7200.0):
+        for precision, sessions in ((12, range(0, 300)), (10, range(200, 500))):
+            worker = AnalyticsRollup(
+                session_factory=session_factory,
+                reach_bucket_seconds=3600,
+                reach_precision=precision,
+            )
+            for i in sessions:
+                worker.handle(
+                    Event(event_type="landing.impression", payload={"session_id": f"s{i}"})
+                )
+            worker.flush()
+            assert len(worker) == 0
+
+    db = session_factory()
+    report = ReachService(db).get_reach(
+        "landing.impression", datetime(1970, 1, 1), datetime(1970, 1, 2)
+    )
+    db.close()
+
+    assert report.unique_sessions == pytest.approx(500, rel=0.1)
@@ -2,8 +2,10 @@
 import pytest
 from unittest.mock import Mock, MagicMock
 
+from app.core.utils import LocaleResolver
 from app.modules.landing.services import LandingAssemblyService
 from app.modules.landing.domain import StartupCardVM, HeroVM, CTA
+from app.modules.landing.repos import FragmentCache
 
 
 @pytest.fixture
@@ -136,3 +138,155 @@ def test_fallback_page_on_error(mock_db):
     assert landing_page is not None
     assert landing_page.etag == "fallback"
     assert landing_page.version == 0
+
+
+def test_cache_outage_degrades_to_live_assembly(
+    mock_db, mock_cms, mock_discovery, mock_gating
+):
+    """Test failing cache reads and writes still serve the assembled page."""
+    mock_db.execute.side_effect = Exception("database is locked")
+    service = LandingAssemblyService(
+        db=mock_db,
+        cms=mock_cms,
+        discovery=mock_discovery,
+        gating=mock_gating,
+    )
+
+    landing_page = service.get_landing_page(locale="en-US")
+
+    assert landing_page.etag != "fallback"
+    assert landing_page.hero.headline == "Test Headline"
+    assert mock_db.rollback.called
+
+
+def test_compute_etag_matches_assembled_page(
+    mock_db, mock_cms, mock_discovery, mock_gating
+):
+    """Test that the token-only etag equals the assembled page etag."""
+    service = LandingAssemblyService(
+        db=mock_db,
+        cms=mock_cms,
+        discovery=mock_discovery,
+        gating=mock_gating,
+    )
+
+    etag, tokens = service.compute_etag(locale="en-US")
+    landing_page = service.get_landing_page(locale="en-US", tokens=tokens)
+
+    assert tokens == ("cms_v1", "disc_v1")
+    assert landing_page.etag == etag
+    # Tokens were reused rather than probed again
+    mock_cms.get_cms_etag.assert_called_once()
+    mock_discovery.get_discovery_revision.assert_called_once()
+
+
+def test_discovery_change_rebuilds_only_teaser(
+    mock_db, mock_cms, mock_discovery, mock_gating
+):
+    """Test content sections are reused from fragments across Discovery revisions."""
+    service = LandingAssemblyService(
+        db=mock_db,
+        cms=mock_cms,
+        discovery=mock_discovery,
+        gating=mock_gating,
+        fragments=FragmentCache(),
+    )
+
+    first = service.get_landing_page(locale="en-US", tokens=("cms_v1", "disc_v1"))
+    second = service.get_landing_page(locale="en-US", tokens=("cms_v1", "disc_v2"))
+
+    mock_cms.get_hero.assert_called_once()
+    mock_cms.get_testimonials.assert_called_once()
+    assert mock_discovery.get_top_campaigns.call_count == 2
+    changed = {
+        name for name, etag in second.section_etags.items() if first.section_etags[name] != etag
+    }
+    assert changed == {"teaser"}
+
+
+def test_get_sections_returns_only_requested(
+    mock_db, mock_cms, mock_discovery, mock_gating
+):
+    """Test a section subset carries its own etags and nothing else."""
+    service = LandingAssemblyService(
+        db=mock_db,
+        cms=mock_cms,
+        discovery=mock_discovery,
+        gating=mock_gating,
+        fragments=FragmentCache(),
+    )
+
+    subset = service.get_sections({"teaser"}, locale="en-US")
+    page = service.get_landing_page(locale="en-US")
+
+    assert set(subset.section_etags) == {"teaser"}
+    assert subset.section_etags["teaser"] == page.section_etags["teaser"]
+    assert subset.teaser == page.teaser
+    assert subset.model_dump(exclude_unset=True).keys() == {
+        "locale", "version", "etag", "section_etags", "teaser"
+    }
+    mock_cms.get_hero.assert_called_once()  # by the full page only
+
+
+def test_get_sections_falls_back_when_sources_fail(mock_db):
+    """Test a failing revision probe serves fallback sections instead of raising."""
+    mock_cms = Mock()
+    mock_cms.get_cms_etag.side_effect = Exception("CMS down")
+    service = LandingAssemblyService(db=mock_db, cms=mock_cms, fragments=FragmentCache())
+
+    subset = service.get_sections({"hero", "disclaimers"}, locale="en-US")
+
+    assert subset.etag == "fallback"
+    assert subset.section_etags == {"hero": "fallback", "disclaimers": "fallback"}
+    assert subset.hero.headline == "Welcome to LendCommunity"
+    assert subset.model_dump(exclude_unset=True).keys() == {
+        "locale", "version", "etag", "section_etags", "hero", "disclaimers_html"
+    }
+
+
+def test_cdn_mode_page_is_session_independent(
+    mock_db, mock_cms, mock_discovery, mock_gating
+):
+    """Test CDN mode leaves the gating bit out of the shared page body."""
+    from app.modules.landing.domain import ExitIntentCopyVM
+
+    mock_cms.get_exit_intent_copy.return_value = ExitIntentCopyVM(
+        headline="Wait!", cta_label="Join", cta_action="open_signup"
+    )
+    service = LandingAssemblyService(
+        db=mock_db,
+        cms=mock_cms,
+        discovery=mock_discovery,
+        gating=mock_gating,
+        fragments=FragmentCache(),
+    )
+    service.settings = service.settings.model_copy(update={"cdn_mode": True})
+
+    landing_page = service.get_landing_page(locale="en-US", session_id="s1")
+
+    assert landing_page.exit_intent.can_show_now is False
+    mock_gating.can_show_exit_intent.assert_not_called()
+    # /exit-intent still answers per session
+    assert service.get_exit_intent(locale="en-US", session_id="s1").can_show_now is True
+
+
+def test_get_landing_pages_probes_discovery_once(
+    mock_db, mock_cms, mock_discovery, mock_gating
+):
+    """Test a batch shares one Discovery probe and one cache transaction."""
+    service = LandingAssemblyService(
+        db=mock_db,
+        cms=mock_cms,
+        discovery=mock_discovery,
+        gating=mock_gating,
+        fragments=FragmentCache(),
+        locales=LocaleResolver(["en-US", "vi-VN"], "en-US"),
+    )
+
+    pages = service.get_landing_pages(["en-US", "vi-VN", "en_us"])
+
+    assert list(pages) == ["en-US", "vi-VN"]
+    assert [page.locale for page in pages.values()] == ["en-US", "vi-VN"]
+    mock_discovery.get_discovery_revision.assert_called_once()
+    assert mock_db.commit.call_count == 1
+    assert pages["vi-VN"].etag == service.compute_etag("vi-VN")[0]
@@ -0,0 +1,123 @@
+"""Tests for assembly cache storage backends."""
+import time
+
+import pytest
+from sqlalchemy import text
+
+from app.core.security import generate_etag
+from app.modules.landing.domain import CTA, HeroVM, LandingPageVM, TeaserSectionVM
+from app.modules.landing.repos import AssemblyCacheRepository, section_etags
+from app.modules.landing.repos.cache_backends import (
+    RedisCacheBackend,
+    SharedMemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+
+KEY = ("en-US", "cms_v1", "disc_v1")
+
+
+class FakeRedis:
+    """In-process stand-in for a Redis-protocol client."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, name):
+        value, expires_at = self.store.get(name, (None, 0))
+        if value is None or expires_at <= time.time():
+            return None
+        return value
+
+    def set(self, name, value, ex=None):
+        self.store[name] = (value, time.time() + (ex or 3600))
+
+    def delete(self, name):
+        self.store.pop(name, None)
+
+
+@pytest.fixture(params=["sqlite", "redis", "shm"])
+def backend(request, db, tmp_path):
+    """Each cache backend."""
+    if request.param == "sqlite":
+        return SQLiteCacheBackend(db)
+    if request.param == "redis":
+        return RedisCacheBackend(FakeRedis())
+    return SharedMemoryCacheBackend(str(tmp_path / "cache.shm"), slots=8, slot_size=4096)
+
+
+def test_backend_set_get_delete(backend):
+    """Test basic backend operations."""
+    assert backend.get(KEY) is None
+
+    backend.set(KEY, b"\x01payload", ttl_seconds=60)
+    assert bytes(backend.get(KEY)) == b"\x01payload"
+    assert backend.get(("en-US", "cms_v1", "disc_v2")) is None
+
+    backend.delete(KEY)
+    assert backend.get(KEY) is None
+
+
+def test_shm_entries_visible_across_instances(tmp_path):
+    """Test two mappings of the same file (as in two workers) share entries."""
+    path = str(tmp_path / "cache.shm")
+    writer = SharedMemoryCacheBackend(path, slots=8, slot_size=4096)
+    reader = SharedMemoryCacheBackend(path, slots=8, slot_size=4096)
+
+    writer.set(KEY, b"shared", ttl_seconds=60)
+
+    assert reader.get(KEY) == b"shared"
+
+
+def test_shm_expired_and_oversized_entries(tmp_path):
+    """Test expiry and slot-size limits of the shm backend."""
+    backend = SharedMemoryCacheBackend(str(tmp_path / "cache.shm"), slots=8, slot_size=64)
+
+    backend.set(KEY, b"x" * 100, ttl_seconds=60)
+    assert backend.get(KEY) is None
+
+    backend.set(KEY, b"small", ttl_seconds=-1)
+    assert backend.get(KEY) is None
+
+
+def test_repository_with_shared_backend(db):
+    """Test repository round trip through a Redis-protocol backend."""
+    page = LandingPageVM(
+        locale="en-US",
+        version=1,
+        etag="abc123",
+        hero=HeroVM(headline="Hi", primary_cta=CTA(label="Join", action="open_signup")),
+        teaser=TeaserSectionVM(items=[]),
+        testimonials=[],
+    )
+    shared = RedisCacheBackend(FakeRedis())
+
+    AssemblyCacheRepository(db, backend=shared).set(*KEY, page)
+
+    # A second worker sees the entry without touching SQLite
+    assert AssemblyCacheRepository(db, backend=shared).get(*KEY) == page
+    assert SQLiteCacheBackend(db).get(KEY) is None
+
+
+def test_sqlite_payloads_stored_once_per_content(db):
+    """Test keys with identical content share one blob, freed with its last reference."""
+    repo = AssemblyCacheRepository(db, backend=SQLiteCacheBackend(db))
+    keys = [("en-US", "cms_v1", f"disc_v{i}") for i in range(3)]
+    for key in keys:
+        page = LandingPageVM(
+            locale=key[0],
+            version=1,
+            etag=generate_etag(key[1], key[2]),
+            hero=HeroVM(headline="Hi", primary_cta=CTA(label="Join", action="open_signup")),
+            teaser=TeaserSectionVM(items=[]),
+            testimonials=[],
+            section_etags=section_etags(*key),
+        )
+        repo.set(*key, page)
+        assert repo.get(*key) == page
+
+    blobs = db.execute(text("SELECT refcount FROM landing_cache_blobs")).fetchall()
+    assert blobs == [(3,)]
+
+    for key in keys:
+        repo.delete(*key)
+    assert db.execute(text("SELECT COUNT(*) FROM landing_cache_blobs")).scalar() == 0
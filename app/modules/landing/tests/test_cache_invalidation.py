@@ -0,0 +1,138 @@
+"""Tests for event-driven landing cache invalidation."""
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from app.core.events import Event, EventDispatcher
+from app.interfaces.cms_stub import CMS_PUBLISHED
+from app.interfaces.discovery_stub import DISCOVERY_RANKING_CHANGED
+from app.modules.landing.services import (
+    CacheInvalidationHandler,
+    LandingAssemblyService,
+    RevisionRegistry,
+    register_landing_event_handlers,
+)
+
+
+@pytest.fixture
+def registry():
+    """Fresh revision registry."""
+    return RevisionRegistry(ttl_seconds=60)
+
+
+@pytest.fixture
+def event_driven_settings():
+    """Settings with event-driven cache freshness enabled."""
+    settings = MagicMock()
+    settings.cache_event_driven = True
+    settings.cache_event_driven_ttl_seconds = 3600
+    settings.cache_event_reprobe_seconds = 60
+    with patch(
+        "app.modules.landing.services.assembly_service.get_settings",
+        return_value=settings,
+    ):
+        yield settings
+
+
+def test_registry_seed_and_get(registry):
+    """Test seeded tokens are returned until an event changes them."""
+    registry.seed("en-US", ("cms_v1", "disc_v1"), registry.generation)
+
+    assert registry.get("en-US") == ("cms_v1", "disc_v1")
+    assert registry.get("es-US") is None
+
+
+def test_registry_ignores_seed_racing_an_event(registry):
+    """Test a probe that started before an event does not overwrite it."""
+    generation = registry.generation
+    registry.discovery_changed("disc_v2")
+
+    registry.seed("en-US", ("cms_v1", "disc_v1"), generation)
+
+    assert registry.get("en-US") is None
+
+
+def test_events_return_stale_keys(registry):
+    """Test CMS and Discovery events report superseded cache keys."""
+    registry.seed("en-US", ("cms_v1", "disc_v1"), registry.generation)
+    registry.seed("es-US", ("cms_v1", "disc_v1"), registry.generation)
+
+    assert registry.discovery_changed("disc_v2") == [
+        ("en-US", "cms_v1", "disc_v1"),
+        ("es-US", "cms_v1", "disc_v1"),
+    ]
+    assert registry.cms_published("en-US", "cms_v2") == [("en-US", "cms_v1", "disc_v2")]
+    assert registry.get("en-US") == ("cms_v2", "disc_v2")
+
+
+def test_handler_deletes_stale_entries(registry):
+    """Test handler deletes superseded entries when events arrive."""
+    registry.seed("en-US", ("cms_v1", "disc_v1"), registry.generation)
+    handler = CacheInvalidationHandler(
+        registry=registry, session_factory=MagicMock, rebuild=False
+    )
+    dispatcher = EventDispatcher()
+    register_landing_event_handlers(dispatcher, handler)
+
+    with patch(
+        "app.modules.landing.services.assembly_service.AssemblyCacheRepository"
+    ) as repo_cls:
+        dispatcher.emit(
+            Event(event_type=DISCOVERY_RANKING_CHANGED, payload={"discovery_rev": "disc_v2"})
+        )
+        handler.wait()
+        repo_cls.return_value.delete.assert_called_once_with("en-US", "cms_v1", "disc_v1")
+
+        repo_cls.return_value.delete.reset_mock()
+        dispatcher.emit(
+            Event(event_type=CMS_PUBLISHED, payload={"locale": "en-US", "cms_etag": "cms_v2"})
+        )
+        handler.wait()
+        repo_cls.return_value.delete.assert_called_once_with("en-US", "cms_v1", "disc_v2")
+    handler.close()
+
+
+def test_rebuild_runs_off_the_emitting_thread(registry):
+    """Test emit() only queues the rebuild; the worker thread runs it."""
+    registry.seed("en-US", ("cms_v1", "disc_v1"), registry.generation)
+    handler = CacheInvalidationHandler(registry=registry, session_factory=MagicMock, rebuild=True)
+    release = threading.Event()
+    rebuilt_on = []
+
+    def rebuild(locales):
+        release.wait(5)
+        rebuilt_on.append(threading.current_thread())
+
+    with patch.object(LandingAssemblyService, "get_landing_pages", side_effect=rebuild), patch(
+        "app.modules.landing.services.assembly_service.AssemblyCacheRepository"
+    ):
+        handler.on_discovery_ranking_changed(
+            Event(event_type=DISCOVERY_RANKING_CHANGED, payload={"discovery_rev": "disc_v2"})
+        )
+        # The emitting call has returned while the rebuild is still blocked
+        assert rebuilt_on == []
+        release.set()
+        handler.wait()
+    handler.close()
+
+    assert rebuilt_on and rebuilt_on[0] is not threading.current_thread()
+
+
+def test_event_driven_service_skips_probes(registry, event_driven_settings):
+    """Test that pushed tokens replace per-request upstream probes."""
+    cms = Mock()
+    cms.get_cms_etag.return_value = "cms_v1"
+    discovery = Mock()
+    discovery.get_discovery_revision.return_value = "disc_v1"
+    service = LandingAssemblyService(
+        db=MagicMock(), cms=cms, discovery=discovery, revisions=registry
+    )
+
+    assert service.get_revision_tokens("en-US") == ("cms_v1", "disc_v1")
+    assert service.get_revision_tokens("en-US") == ("cms_v1", "disc_v1")
+    cms.get_cms_etag.assert_called_once()
+
+    registry.cms_published("en-US", "cms_v2")
+    assert service.get_revision_tokens("en-US") == ("cms_v2", "disc_v1")
+    cms.get_cms_etag.assert_called_once()
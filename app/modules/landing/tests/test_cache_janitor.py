@@ -0,0 +1,86 @@
+"""Tests for the assembly cache janitor."""
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from app.modules.landing.repos import SQLiteCacheBackend
+from app.modules.landing.repos.cache_backends import AccessTracker
+from app.modules.landing.services import CacheJanitor
+
+
+def _insert(db, n, expired, prefix, accessed_at=None):
+    """Insert n cache rows."""
+    now = datetime.utcnow()
+    expires_at = now - timedelta(minutes=1) if expired else now + timedelta(hours=1)
+    for i in range(n):
+        db.execute(
+            text(
+                """
+                INSERT INTO landing_assembly_cache
+                (locale, cms_etag, discovery_rev, payload_json, expires_at, last_accessed_at)
+                VALUES ('en-US', 'cms', :rev, :payload, :expires_at, :accessed_at)
+                """
+            ),
+            {
+                "rev": f"{prefix}{i}",
+                "payload": b"x" * 100,
+                "expires_at": expires_at,
+                "accessed_at": accessed_at or now,
+            },
+        )
+    db.commit()
+
+
+def test_janitor_deletes_expired_in_batches(session_factory):
+    """Test expired rows are removed batch by batch and reported."""
+    db = session_factory()
+    _insert(db, 25, expired=True, prefix="old")
+    _insert(db, 5, expired=False, prefix="live")
+
+    report = CacheJanitor(session_factory, batch_size=10, pause_seconds=0).run_once()
+
+    assert report.expired_rows == 25
+    assert report.expired_bytes == 2500
+    assert report.remaining_rows == 5
+    assert SQLiteCacheBackend(db).stats() == (5, 500)
+
+
+def test_large_batches_delete_in_chunks(session_factory):
+    """Test a batch larger than SQLite's old 999-variable limit still deletes."""
+    db = session_factory()
+    _insert(db, 1200, expired=True, prefix="old")
+
+    report = CacheJanitor(session_factory, batch_size=1200, pause_seconds=0).run_once()
+
+    assert report.expired_rows == 1200
+    assert SQLiteCacheBackend(db).stats() == (0, 0)
+    db.close()
+
+
+def test_janitor_evicts_least_recently_used(session_factory):
+    """Test rows over the cap are evicted oldest-access first."""
+    db = session_factory()
+    _insert(db, 3, expired=False, prefix="cold", accessed_at=datetime(2020, 1, 1))
+    _insert(db, 3, expired=False, prefix="hot")
+
+    report = CacheJanitor(
+        session_factory, batch_size=10, max_rows=3, pause_seconds=0
+    ).run_once()
+
+    assert report.evicted_rows == 3
+    revs = {row[0] for row in db.execute(text("SELECT discovery_rev FROM landing_assembly_cache"))}
+    assert revs == {"hot0", "hot1", "hot2"}
+
+
+def test_access_times_flushed_from_tracker(session_factory):
+    """Test buffered cache hits are written back as last_accessed_at."""
+    db = session_factory()
+    _insert(db, 1, expired=False, prefix="r", accessed_at=datetime(2020, 1, 1))
+    tracker = AccessTracker()
+    backend = SQLiteCacheBackend(db, access_tracker=tracker)
+
+    assert backend.get(("en-US", "cms", "r0")) is not None
+    assert backend.touch_many(tracker.drain()) == 1
+
+    accessed = db.execute(text("SELECT last_accessed_at FROM landing_assembly_cache")).scalar()
+    assert not str(accessed).startswith("2020")
@@ -0,0 +1,78 @@
+"""Tests for the streaming email buffer export."""
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.modules.landing.cli import utc_datetime
+from app.modules.landing.domain import EmailBufferEntry
+from app.modules.landing.migrations import run_migrations
+from app.modules.landing.repos import EmailBufferRepository
+from app.modules.landing.services import EmailExportService
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """File-backed SQLite sessions with landing schema and 25 captured emails."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'landing.db'}")
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    run_migrations(db)
+    repo = EmailBufferRepository(db)
+    for i in range(25):
+        repo.create(
+            EmailBufferEntry(
+                email=f"user{i}@example.com",
+                locale="en-US",
+                source="hero" if i % 5 else "footer",
+                utm_source="=HYPERLINK(1)" if i == 0 else None,
+            )
+        )
+    db.close()
+    yield factory
+    engine.dispose()
+
+
+def test_keyset_batches_cover_every_row_once(session_factory):
+    """Test batches walk the table in id order without gaps or repeats."""
+    db = session_factory()
+    batches = list(EmailBufferRepository(db).iter_rows(batch_size=10))
+    db.close()
+
+    assert [len(rows) for rows in batches] == [10, 10, 5]
+    assert [row[0] for rows in batches for row in rows] == list(range(1, 26))
+
+
+def test_csv_export_filters_and_neutralizes_formulas(session_factory):
+    """Test the CSV header, source filter and spreadsheet formula escaping."""
+    service = EmailExportService(session_factory)
+    service.batch_size = 4
+
+    body = b"".join(service.stream("csv", source="footer")).decode()
+    rows = list(csv.DictReader(io.StringIO(body)))
+
+    assert [row["email"] for row in rows] == [f"user{i}@example.com" for i in (0, 5, 10, 15, 20)]
+    assert rows[0]["utm_source"] == "'=HYPERLINK(1)"
+
+
+def test_gzipped_ndjson_export(session_factory):
+    """Test the gzip stream decodes to one JSON object per row."""
+    service = EmailExportService(session_factory)
+    service.batch_size = 7
+
+    body = gzip.decompress(b"".join(service.stream("ndjson", compress=True, status="new")))
+    rows = [json.loads(line) for line in body.splitlines()]
+
+    assert len(rows) == 25
+    assert rows[-1]["email"] == "user24@example.com"
+
+
+def test_cli_bounds_are_naive_utc():
+    """Test --since/--until offsets are converted like the HTTP route's."""
+    assert utc_datetime("2024-01-01T00:00+02:00") == datetime(2023, 12, 31, 22, 0)
+    assert utc_datetime("2024-01-01") == datetime(2024, 1, 1)
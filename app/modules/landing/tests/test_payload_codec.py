@@ -0,0 +1,143 @@
+"""Tests for assembly cache payload codec."""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.modules.landing.domain import CTA, HeroVM, LandingPageVM, TeaserSectionVM
+from app.modules.landing.repos import AssemblyCacheRepository
+from app.modules.landing.repos.payload_codec import (
+    COMPRESSION_NONE,
+    COMPRESSION_ZLIB,
+    FORMAT_VERSION,
+    PayloadCodec,
+    PayloadCodecError,
+)
+
+
+@pytest.fixture
+def sample_payload():
+    """Sample JSON-compatible payload."""
+    return {
+        "locale": "en-US",
+        "items": [{"id": f"camp_{i}", "percent_funded": i * 1.5} for i in range(50)],
+    }
+
+
+@pytest.fixture
+def landing_page():
+    """Minimal landing page view model."""
+    return LandingPageVM(
+        locale="en-US",
+        version=1,
+        etag="abc123",
+        hero=HeroVM(
+            headline="Test Headline",
+            primary_cta=CTA(label="Join", action="open_signup"),
+        ),
+        teaser=TeaserSectionVM(items=[], mask_after=2),
+        testimonials=[],
+    )
+
+
+def test_json_zlib_round_trip(sample_payload):
+    """Test JSON + zlib payload round trip and header layout."""
+    codec = PayloadCodec(serializer="json", compression="zlib")
+
+    encoded = codec.encode(sample_payload)
+
+    assert encoded[0] == FORMAT_VERSION
+    assert encoded[2] == COMPRESSION_ZLIB
+    assert len(encoded) < len(json.dumps(sample_payload))
+    assert codec.decode(encoded) == sample_payload
+
+
+def test_small_payload_is_not_compressed():
+    """Test that tiny payloads skip compression."""
+    codec = PayloadCodec(serializer="json", compression="zlib")
+
+    encoded = codec.encode({"a": 1})
+
+    assert encoded[2] == COMPRESSION_NONE
+    assert codec.decode(encoded) == {"a": 1}
+
+
+def test_msgpack_round_trip(sample_payload):
+    """Test msgpack payload round trip."""
+    pytest.importorskip("msgpack")
+    codec = PayloadCodec(serializer="msgpack", compression="none")
+
+    assert codec.decode(codec.encode(sample_payload)) == sample_payload
+
+
+def test_legacy_json_rows_are_readable(sample_payload):
+    """Test that rows written before the codec still decode."""
+    codec = PayloadCodec()
+    legacy = json.dumps(sample_payload)
+
+    assert codec.decode(legacy) == sample_payload
+    assert codec.decode(legacy.encode()) == sample_payload
+
+
+def test_unknown_format_version_raises():
+    """Test that unknown format versions are rejected."""
+    codec = PayloadCodec()
+
+    with pytest.raises(PayloadCodecError):
+        codec.decode(bytes((99, 0, 0)) + b"{}")
+
+
+def test_corrupt_compressed_body_raises_codec_error(sample_payload):
+    """Test truncated or corrupted compressed bodies surface as PayloadCodecError."""
+    codec = PayloadCodec(serializer="json", compression="zlib")
+    encoded = codec.encode(sample_payload)
+
+    with pytest.raises(PayloadCodecError):
+        codec.decode(encoded[: len(encoded) // 2])
+    with pytest.raises(PayloadCodecError):
+        codec.decode(encoded[:3] + b"\x00" * (len(encoded) - 3))
+
+
+def test_cache_repo_treats_corrupt_row_as_miss(db, landing_page):
+    """Test a corrupted stored payload reads as a cache miss."""
+    codec = PayloadCodec(serializer="json", compression="zlib")
+    repo = AssemblyCacheRepository(db, codec=codec)
+    page = landing_page.model_copy(update={"disclaimers_html": "Terms apply. " * 50})
+    repo.set("en-US", "cms_v1", "disc_v1", page)
+    db.execute(text("UPDATE landing_cache_blobs SET payload = substr(payload, 1, 20)"))
+    db.commit()
+
+    assert repo.get("en-US", "cms_v1", "disc_v1") is None
+
+
+def test_cache_repo_round_trip(db, landing_page):
+    """Test cache repository stores encoded payloads and reads them back."""
+    repo = AssemblyCacheRepository(db, codec=PayloadCodec(compression="zlib"))
+
+    repo.set("en-US", "cms_v1", "disc_v1", landing_page)
+    cached = repo.get("en-US", "cms_v1", "disc_v1")
+
+    assert cached == landing_page
+
+
+def test_cache_repo_reads_legacy_rows(db, landing_page):
+    """Test cache repository reads plain JSON rows from older releases."""
+    db.execute(
+        text(
+            """
+            INSERT INTO landing_assembly_cache
+            (locale, cms_etag, discovery_rev, payload_json, expires_at)
+            VALUES ('en-US', 'cms_v1', 'disc_v1', :payload, :expires_at)
+            """
+        ),
+        {
+            "payload": landing_page.model_dump_json(),
+            "expires_at": datetime.utcnow() + timedelta(minutes=1),
+        },
+    )
+    db.commit()
+
+    repo = AssemblyCacheRepository(db)
+
+    assert repo.get("en-US", "cms_v1", "disc_v1") == landing_page
@@ -0,0 +1,45 @@
+"""Tests for static landing page snapshots."""
+import gzip
+
+from app.modules.landing.services import SnapshotStore
+
+
+def test_publish_then_find(tmp_path):
+    """Test a published snapshot is found with its precompressed variants."""
+    store = SnapshotStore(str(tmp_path))
+    body = b'{"locale": "en-US", "etag": "abc123"}'
+
+    store.publish("en-US", "abc123", 7, body)
+    snapshot = SnapshotStore(str(tmp_path)).find("en-US", "abc123")
+
+    assert snapshot.version == 7
+    path, stat_result = snapshot.files["identity"]
+    assert open(path, "rb").read() == body
+    assert stat_result.st_size == len(body)
+    with open(snapshot.files["gzip"][0], "rb") as f:
+        assert gzip.decompress(f.read()) == body
+    assert store.find("en-US", "def456") is None
+
+
+def test_find_rejects_path_like_locales(tmp_path):
+    """Test request-supplied locales cannot point outside the snapshot directory."""
+    store = SnapshotStore(str(tmp_path / "snapshots"))
+    store.publish("en-US", "abc123", 1, b"{}")
+
+    assert store.find("../snapshots/en-US", "abc123") is None
+    assert store.find("en-US", "../en-US/abc123") is None
+
+
+def test_publish_prunes_older_snapshots(tmp_path):
+    """Test only the newest ``keep`` etags of a locale stay on disk."""
+    store = SnapshotStore(str(tmp_path), keep=2)
+
+    for etag in ("aaa", "bbb", "ccc"):
+        store.publish("en-US", etag, 1, b"{}")
+
+    assert store.find("en-US", "aaa") is None
+    assert store.find("en-US", "ccc") is not None
+    assert sorted(p.name for p in (tmp_path / "en-US").glob("*.meta.json")) == [
+        "bbb.meta.json",
+        "ccc.meta.json",
+    ]
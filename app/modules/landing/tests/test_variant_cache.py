@@ -0,0 +1,80 @@
+"""Tests for precompressed landing page response variants."""
+import gzip
+
+import pytest
+
+from app.core.http.compression import select_encoding
+from app.modules.landing.domain import (
+    CTA,
+    HeroVM,
+    LandingPageVM,
+    TeaserSectionVM,
+    TestimonialVM,
+)
+from app.modules.landing.repos import ResponseVariantCache, variant_key
+
+
+@pytest.fixture
+def landing_page():
+    """Landing page large enough to be compressed."""
+    return LandingPageVM(
+        locale="en-US",
+        version=1,
+        etag="abc123",
+        hero=HeroVM(
+            headline="Test Headline",
+            primary_cta=CTA(label="Join", action="open_signup"),
+        ),
+        teaser=TeaserSectionVM(items=[], mask_after=2),
+        testimonials=[
+            TestimonialVM(author_name=f"Author {i}", quote="Great community " * 5)
+            for i in range(10)
+        ],
+    )
+
+
+def test_variants_decode_to_identity(landing_page):
+    """Test gzip variant decompresses to the identity body."""
+    cache = ResponseVariantCache(minimum_size=100)
+
+    variants = cache.put(variant_key(landing_page), landing_page)
+
+    assert variants["identity"] == landing_page.model_dump_json().encode()
+    assert gzip.decompress(variants["gzip"]) == variants["identity"]
+
+
+def test_get_or_build_reuses_entry(landing_page):
+    """Test variants are only built once per key."""
+    cache = ResponseVariantCache(minimum_size=100)
+    key = variant_key(landing_page)
+
+    first = cache.get_or_build(key, landing_page)
+    second = cache.get_or_build(key, landing_page)
+
+    assert first is second
+
+
+def test_lru_eviction(landing_page):
+    """Test cache is bounded."""
+    cache = ResponseVariantCache(max_entries=2)
+
+    for i in range(3):
+        cache.put(("en-US", f"etag{i}", False), landing_page)
+
+    assert cache.get(("en-US", "etag0", False)) is None
+    assert cache.get(("en-US", "etag2", False)) is not None
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (None, "identity"),
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0.5, br", "br"),
+        ("gzip;q=0", "identity"),
+        ("*", "br"),
+    ],
+)
+def test_select_encoding(header, expected):
+    """Test Accept-Encoding negotiation."""
+    assert select_encoding(header, {"identity", "gzip", "br"}) == expected
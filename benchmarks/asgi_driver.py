@@ -0,0 +1,135 @@
+"""Minimal in-process ASGI driver for benchmarks.
+
+Calls the ASGI app directly (no sockets, no HTTP client dependency), so
+results reflect framework + application cost only.
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Headers = Sequence[Tuple[str, str]]
+
+
+class ASGIResponse:
+    """Collected response."""
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self):
+        self.status = 0
+        self.headers: Dict[str, str] = {}
+        self.body = b""
+
+
+async def call(
+    app: Any,
+    method: str,
+    path: str,
+    headers: Headers = (),
+    body: bytes = b"",
+    query_string: bytes = b"",
+    client: Tuple[str, int] = ("127.0.0.1", 50000),
+) -> ASGIResponse:
+    """Send one HTTP request through an ASGI app."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+        "client": client,
+        "server": ("bench", 80),
+    }
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Block until cancelled, like a client that keeps the connection open
+        await asyncio.Event().wait()
+
+    response = ASGIResponse()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response.status = message["status"]
+            response.headers = {
+                k.decode("latin-1"): v.decode("latin-1") for k, v in message.get("headers", [])
+            }
+        elif message["type"] == "http.response.body":
+            response.body += message.get("body", b"")
+
+    await app(scope, receive, send)
+    return response
+
+
+class Lifespan:
+    """Async context manager running an app's lifespan startup/shutdown."""
+
+    def __init__(self, app: Any):
+        self.app = app
+        self._to_app: asyncio.Queue = asyncio.Queue()
+        self._from_app: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self):
+        self._task = asyncio.create_task(
+            self.app({"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}},
+                     self._to_app.get, self._from_app.put)
+        )
+        await self._to_app.put({"type": "lifespan.startup"})
+        message = await self._from_app.get()
+        if message["type"] != "lifespan.startup.complete":
+            raise RuntimeError(f"Lifespan startup failed: {message}")
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._to_app.put({"type": "lifespan.shutdown"})
+        await self._from_app.get()
+        await self._task
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of pre-sorted values."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def run_load(
+    make_request: Callable[[int], Any],
+    requests: int,
+    concurrency: int = 1,
+) -> Dict[str, float]:
+    """Issue requests with bounded concurrency. Returns req/s and latency percentiles."""
+    latencies: List[float] = []
+    counter = iter(range(requests))
+
+    async def worker():
+        for i in counter:
+            start = time.perf_counter()
+            await make_request(i)
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 4),
+        "req_per_s": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
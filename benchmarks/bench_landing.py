@@ -0,0 +1,293 @@
+"""Benchmark: end-to-end load and latency of the landing module.
+
+Drives the real application (middleware, routers, services, migrations)
+in-process against a throwaway SQLite file, with rate limiting disabled.
+
+Scenarios:
+
+- ``page_hit``: GET /landing/v1/page with a warm assembly cache.
+- ``page_miss_storm``: concurrent page requests right after the cache and
+  response variants are dropped (one round per ``--storm-rounds``).
+- ``page_304``: revalidation with a matching ``If-None-Match``.
+- ``join_burst``: POST /landing/v1/join with fresh addresses, reported per
+  window so latency growth with the email buffer size shows up.
+- ``cta_flood``: POST /landing/v1/cta-click.
+
+Results (req/s, p50/p95/p99 per scenario) are printed and written as JSON
+together with the commit and environment, so runs can be compared::
+
+    python -m benchmarks.bench_landing [--requests 5000] [--concurrency 8]
+        [--output bench_landing.json] [--compare previous.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from .asgi_driver import Lifespan, call, run_load
+
+PAGE = "/landing/v1/page"
+JSON_HEADERS = [("Content-Type", "application/json")]
+# Compared between runs; a drop beyond --tolerance is flagged
+COMPARED_METRICS = ("req_per_s", "p50_ms", "p95_ms", "p99_ms")
+
+
+def configure_environment(database_path: str) -> None:
+    """Point the app at a temp database before any app module reads settings."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{database_path}"
+    # join_burst and cta_flood post from one client, far above the write limits
+    os.environ["RATE_LIMIT_ENABLED"] = "false"
+    # Background flushes would compete with the measured requests
+    os.environ.setdefault("ANALYTICS_ROLLUP_ENABLED", "false")
+    os.environ.setdefault("CACHE_JANITOR_ENABLED", "false")
+
+
+def check(response: Any, expected: int) -> None:
+    """Fail loudly instead of benchmarking error responses."""
+    if response.status != expected:
+        raise RuntimeError(
+            f"Expected {expected}, got {response.status}: {response.body[:200]!r}"
+        )
+
+
+def drop_page_cache() -> None:
+    """Empty the assembly cache table and the in-process response variants."""
+    from sqlalchemy import text
+
+    from app.core.db import SessionLocal
+    from app.modules.landing.repos import get_variant_cache
+
+    db = SessionLocal()
+    try:
+        db.execute(text("DELETE FROM landing_assembly_cache"))
+        db.commit()
+    finally:
+        db.close()
+    get_variant_cache().clear()
+
+
+async def page_hit(app: Any, requests: int, concurrency: int) -> Dict:
+    async def request(i):
+        response = await call(
+            app, "GET", PAGE, headers=[("X-Session-ID", f"session-{i % 1000}")]
+        )
+        check(response, 200)
+
+    await run_load(request, min(requests, 500), concurrency)
+    return await run_load(request, requests, concurrency)
+
+
+async def page_miss_storm(app: Any, rounds: int, concurrency: int) -> Dict:
+    async def request(i):
+        check(await call(app, "GET", PAGE), 200)
+
+    results = []
+    for _ in range(rounds):
+        drop_page_cache()
+        results.append(await run_load(request, concurrency, concurrency))
+    return merge_results(results)
+
+
+async def page_304(app: Any, requests: int, concurrency: int) -> Dict:
+    first = await call(app, "GET", PAGE)
+    check(first, 200)
+    headers = [("If-None-Match", first.headers["etag"])]
+
+    async def request(i):
+        check(await call(app, "GET", PAGE, headers=headers), 304)
+
+    await run_load(request, min(requests, 500), concurrency)
+    return await run_load(request, requests, concurrency)
+
+
+async def join_burst(app: Any, requests: int, concurrency: int, windows: int) -> Dict:
+    run_id = int(time.time() * 1000)
+
+    async def request(i):
+        body = json.dumps({"email": f"bench-{run_id}-{i}@example.com", "locale": "en-US"})
+        response = await call(
+            app, "POST", "/landing/v1/join", headers=JSON_HEADERS, body=body.encode()
+        )
+        check(response, 200)
+
+    # Fresh addresses every window: the buffer grows across windows
+    size = max(1, requests // windows)
+    parts = []
+    for window in range(windows):
+        offset = window * size
+        result = await run_load(lambda i: request(offset + i), size, concurrency)
+        result["buffer_rows_before"] = offset
+        parts.append(result)
+    summary = merge_results(parts)
+    summary["windows"] = parts
+    return summary
+
+
+async def cta_flood(app: Any, requests: int, concurrency: int) -> Dict:
+    body = json.dumps(
+        {"placement": "hero", "label": "Get started", "action": "open_signup", "locale": "en-US"}
+    ).encode()
+
+    async def request(i):
+        response = await call(
+            app,
+            "POST",
+            "/landing/v1/cta-click",
+            headers=[*JSON_HEADERS, ("X-Session-ID", f"session-{i % 1000}")],
+            body=body,
+        )
+        check(response, 200)
+
+    await run_load(request, min(requests, 500), concurrency)
+    return await run_load(request, requests, concurrency)
+
+
+def merge_results(results: List[Dict]) -> Dict:
+    """Combine runs: totals for counts and time, worst case for percentiles."""
+    requests = sum(r["requests"] for r in results)
+    seconds = sum(r["seconds"] for r in results)
+    return {
+        "requests": requests,
+        "concurrency": results[0]["concurrency"],
+        "seconds": round(seconds, 4),
+        "req_per_s": round(requests / seconds, 1) if seconds else 0.0,
+        "p50_ms": max(r["p50_ms"] for r in results),
+        "p95_ms": max(r["p95_ms"] for r in results),
+        "p99_ms": max(r["p99_ms"] for r in results),
+    }
+
+
+async def run_scenarios(args: argparse.Namespace) -> Dict[str, Dict]:
+    """Run the selected scenarios against one app instance."""
+    from app.core.telemetry import logger
+    from app.main import create_application
+
+    app = create_application()
+    # Measure request handling, not log formatting
+    logger.setLevel(logging.WARNING)
+
+    scenarios = {
+        "page_hit": lambda: page_hit(app, args.requests, args.concurrency),
+        "page_miss_storm": lambda: page_miss_storm(app, args.storm_rounds, args.concurrency),
+        "page_304": lambda: page_304(app, args.requests, args.concurrency),
+        "join_burst": lambda: join_burst(app, args.joins, args.concurrency, args.join_windows),
+        "cta_flood": lambda: cta_flood(app, args.requests, args.concurrency),
+    }
+    results = {}
+    async with Lifespan(app):
+        for name in args.scenarios or scenarios:
+            results[name] = await scenarios[name]()
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict[str, Dict], previous: Dict[str, Dict], tolerance: float) -> int:
+    """Print relative changes against an earlier run. Returns the number of regressions."""
+    regressions = 0
+    for name, result in current.items():
+        before = previous.get(name)
+        if not before:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            # Throughput should not drop; latency should not rise
+            worse = -change if metric == "req_per_s" else change
+            flag = "  REGRESSION" if worse > tolerance else ""
+            regressions += bool(flag)
+            print(f"  {name:16s} {metric:9s} {old:>10.3f} -> {new:>10.3f} ({change:+.1%}){flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--storm-rounds", type=int, default=50)
+    parser.add_argument("--joins", type=int, default=5000)
+    parser.add_argument("--join-windows", type=int, default=5)
+    parser.add_argument(
+        "--scenarios",
+        nargs="*",
+        choices=["page_hit", "page_miss_storm", "page_304", "join_burst", "cta_flood"],
+    )
+    parser.add_argument("--output", default="bench_landing.json")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench-landing-") as tmp:
+        configure_environment(os.path.join(tmp, "landing.db"))
+        from app.core.config import get_settings
+
+        settings = get_settings()
+        started = datetime.now(timezone.utc)
+        results = asyncio.run(run_scenarios(args))
+
+    for name, result in results.items():
+        print(
+            f"{name:16s} {result['req_per_s']:>10.1f} req/s  p50={result['p50_ms']:.3f}ms "
+            f"p95={result['p95_ms']:.3f}ms p99={result['p99_ms']:.3f}ms"
+        )
+        for window in result.get("windows", ()):
+            print(
+                f"  buffer {window['buffer_rows_before']:>7d} rows: "
+                f"{window['req_per_s']:>10.1f} req/s  p99={window['p99_ms']:.3f}ms"
+            )
+
+    report = {
+        "benchmark": "landing",
+        "commit": git_commit(),
+        "started_at": started.isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "storm_rounds": args.storm_rounds,
+            "joins": args.joins,
+            "join_windows": args.join_windows,
+            "cache_backend": settings.cache_backend,
+            "cache_payload_serializer": settings.cache_payload_serializer,
+            "cache_payload_compression": settings.cache_payload_compression,
+            "cache_event_driven": settings.cache_event_driven,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        print(f"compared with {previous.get('commit') or args.compare}:")
+        if compare(results, previous["results"], args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark: BaseHTTPMiddleware vs pure-ASGI request ID/timing middleware.
+
+Drives a minimal FastAPI endpoint in-process with each middleware stack and
+reports req/s. The "before" stack reproduces the previous
+``BaseHTTPMiddleware`` implementations.
+
+    python -m benchmarks.bench_middleware [--requests 20000] [--concurrency 1]
+"""
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from typing import Callable
+
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.http.middleware import RequestIDMiddleware, TimingMiddleware
+from app.core.telemetry import logger
+
+from .asgi_driver import call, run_load
+
+
+class LegacyRequestIDMiddleware(BaseHTTPMiddleware):
+    """Previous implementation, for comparison."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+
+class LegacyTimingMiddleware(BaseHTTPMiddleware):
+    """Previous implementation, for comparison."""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        response.headers["X-Process-Time"] = str(process_time)
+        logger.info(
+            f"{request.method} {request.url.path}",
+            extra={
+                "request_id": getattr(request.state, "request_id", None),
+                "status_code": response.status_code,
+                "duration_ms": round(process_time * 1000, 2),
+            },
+        )
+        return response
+
+
+def build_app(request_id_cls, timing_cls) -> FastAPI:
+    """Minimal app with one endpoint behind the given middleware."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    app.add_middleware(request_id_cls)
+    app.add_middleware(timing_cls)
+    return app
+
+
+async def bench(app: FastAPI, requests: int, concurrency: int) -> dict:
+    """Warm up, then measure."""
+    await run_load(lambda i: call(app, "GET", "/ping"), 500, concurrency)
+    return await run_load(lambda i: call(app, "GET", "/ping"), requests, concurrency)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+
+    # Measure middleware cost, not stdout
+    logger.setLevel(logging.WARNING)
+
+    stacks = {
+        "none": build_app(lambda app: app, lambda app: app),
+        "before (BaseHTTPMiddleware)": build_app(
+            LegacyRequestIDMiddleware, LegacyTimingMiddleware
+        ),
+        "after (pure ASGI)": build_app(RequestIDMiddleware, TimingMiddleware),
+    }
+
+    for name, app in stacks.items():
+        result = asyncio.run(bench(app, args.requests, args.concurrency))
+        print(
+            f"{name:30s} {result['req_per_s']:>10.1f} req/s  "
+            f"p50={result['p50_ms']:.3f}ms p99={result['p99_ms']:.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
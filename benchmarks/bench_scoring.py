@@ -0,0 +1,132 @@
+"""Benchmark: teaser scoring over the whole campaign catalog.
+
+Each iteration applies one campaign update that invalidates every cached
+score and then selects the top K for a locale:
+
+- ``per-object loop``: score every ``StartupCardVM`` in Python, then sort.
+- ``CampaignScorer (python)``: columnar fallback, loop + heap selection.
+- ``CampaignScorer (numpy)``: vectorized pass + ``argpartition`` (skipped
+  when NumPy is not installed).
+
+``CampaignCatalog (pledge)`` is the serving path for the common write: a
+pledge that leaves the largest amount raised alone, applied to the
+maintained per-locale heads, then a teaser read.
+
+    python -m benchmarks.bench_scoring [--sizes 10000 1000000] [--iterations 5] [--k 3]
+"""
+import argparse
+import math
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.interfaces.campaign_catalog import CampaignCatalog
+from app.interfaces.campaign_scoring import DEFAULT_WEIGHTS, CampaignScorer, np
+from app.modules.landing.domain import StartupCardVM
+
+LOCALES = ["en-US", "en-GB", "es-US", "de-DE", "fr-FR"]
+
+
+def build(size: int, rng: random.Random):
+    """Cards plus their (launched_at, locale) attributes."""
+    now = datetime.now(timezone.utc)
+    cards, attributes = [], {}
+    for i in range(size):
+        goal = rng.randrange(10000_00, 500000_00)
+        raised = rng.randrange(0, goal)
+        card = StartupCardVM(
+            id=f"camp_{i}",
+            name=f"Campaign {i}",
+            raised_cents=raised,
+            goal_cents=goal,
+            percent_funded=round(raised * 100 / goal, 2),
+        )
+        cards.append(card)
+        attributes[card.id] = (now - timedelta(days=rng.uniform(0, 120)), rng.choice(LOCALES))
+    return cards, attributes
+
+
+def per_object_top(cards, attributes, k: int, locale: str, now: float):
+    """Baseline: one Python loop over the card objects."""
+    w = DEFAULT_WEIGHTS
+    half_life = 14 * 86400
+    top_raised = max(math.log1p(card.raised_cents) for card in cards) or 1.0
+    language = locale.split("-")[0]
+    scored = []
+    for card in cards:
+        launched_at, card_locale = attributes[card.id]
+        affinity = 1.0 if card_locale == locale else 0.5 if card_locale.startswith(language) else 0
+        age = max(now - launched_at.timestamp(), 0.0)
+        score = (
+            w["funded"] * card.percent_funded / 100
+            + w["raised"] * math.log1p(card.raised_cents) / top_raised
+            + w["recency"] * 0.5 ** (age / half_life)
+            + w["locale"] * affinity
+        )
+        scored.append((-score, card.id))
+    scored.sort()
+    return scored[:k]
+
+
+def bench(fn, iterations: int) -> float:
+    """Mean ms per call."""
+    started = time.perf_counter()
+    for i in range(iterations):
+        fn(i)
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--k", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    now = time.time()
+    for size in args.sizes:
+        cards, attributes = build(size, rng)
+        print(f"{size:>9,} campaigns")
+
+        baseline = bench(
+            lambda i: per_object_top(cards, attributes, args.k, "en-GB", now), args.iterations
+        )
+        print(f"  {'per-object loop':24s} {baseline:10.2f} ms")
+
+        modes = [("python", False)] + ([("numpy", True)] if np is not None else [])
+        for name, vectorized in modes:
+            scorer = CampaignScorer(vectorized=vectorized)
+            for card in cards:
+                launched_at, locale = attributes[card.id]
+                scorer.set(card.id, card.percent_funded, card.raised_cents, launched_at, locale)
+            locale_class = scorer.locale_class("en-GB")
+
+            def rescore(i):
+                card = cards[i % size]
+                launched_at, locale = attributes[card.id]
+                scorer.set(card.id, card.percent_funded, card.raised_cents, launched_at, locale)
+                scorer.top(args.k, locale_class, now)
+
+            elapsed = bench(rescore, args.iterations)
+            label = f"CampaignScorer ({name})"
+            print(f"  {label:24s} {elapsed:10.2f} ms  ({baseline / elapsed:,.1f}x)")
+        if np is None:
+            print(f"  {'CampaignScorer (numpy)':24s} skipped, numpy is not installed")
+
+        catalog = CampaignCatalog(capacity=50)
+        for card in cards:
+            catalog.upsert(card, *attributes[card.id])
+        catalog.teasers(args.k, "en-GB", now)
+
+        def pledge(i):
+            catalog.apply_funding_delta(cards[(i * 7919) % size].id, 1)
+            catalog.teasers(args.k, "en-GB", now)
+
+        elapsed = bench(pledge, args.iterations)
+        label = "CampaignCatalog (pledge)"
+        print(f"  {label:24s} {elapsed:10.2f} ms  ({baseline / elapsed:,.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
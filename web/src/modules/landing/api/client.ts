@@ -1,20 +1,38 @@
 import type {
   LandingPageVM,
+  LandingSection,
+  LandingSectionsVM,
+  LandingSessionVM,
   ExitIntentCopyVM,
   JoinEmailRequest,
   JoinEmailResponse,
   CTAClickRequest,
+  AnalyticsEvent,
 } from './types';
 
 const API_BASE = '/landing/v1';
 
+// Analytics events are queued and sent together to /events
+const EVENT_FLUSH_INTERVAL_MS = 5000;
+const EVENT_FLUSH_SIZE = 20;
+
 class LandingAPI {
   private sessionId: string;
   private cachedETag: string | null = null;
+  private eventQueue: AnalyticsEvent[] = [];
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
 
   constructor() {
     // Generate or retrieve session ID
     this.sessionId = this.getOrCreateSessionId();
+
+    // Deliver whatever is queued when the page is hidden or unloaded
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'hidden') {
+        this.flushEvents();
+      }
+    });
+    window.addEventListener('pagehide', () => this.flushEvents());
   }
 
   private getOrCreateSessionId(): string {
@@ -72,6 +90,34 @@ class LandingAPI {
     return response.json();
   }
 
+  async getLandingSections(
+    sections: LandingSection[],
+    locale: string = 'en-US'
+  ): Promise<LandingSectionsVM> {
+    const params = new URLSearchParams({ locale, sections: sections.join(',') });
+    const response = await fetch(`${API_BASE}/page?${params}`, {
+      headers: { 'X-Session-ID': this.sessionId },
+    });
+
+    if (!response.ok) {
+      throw new Error(`Failed to fetch landing sections: ${response.statusText}`);
+    }
+
+    return response.json();
+  }
+
+  async getSessionState(): Promise<LandingSessionVM> {
+    const response = await fetch(`${API_BASE}/session`, {
+      headers: { 'X-Session-ID': this.sessionId },
+    });
+
+    if (!response.ok) {
+      return { can_show_exit_intent: false };
+    }
+
+    return response.json();
+  }
+
   async getExitIntent(locale: string = 'en-US'): Promise<ExitIntentCopyVM | null> {
     const response = await fetch(`${API_BASE}/exit-intent?locale=${locale}`, {
       headers: {
@@ -117,12 +163,12 @@ class LandingAPI {
     return response.json();
   }
 
-  async trackCTAClick(
+  trackCTAClick(
     placement: string,
     label: string,
     action: string,
     locale: string = 'en-US'
-  ): Promise<void> {
+  ): void {
     const request: CTAClickRequest = {
       placement,
       label,
@@ -130,20 +176,48 @@ class LandingAPI {
       locale,
       session_id: this.sessionId,
     };
+    this.trackEvent({ type: 'cta_click', ...request });
+  }
 
-    try {
-      await fetch(`${API_BASE}/cta-click`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify(request),
-      });
-    } catch (error) {
-      // Fire-and-forget, don't throw
-      console.error('Failed to track CTA click:', error);
+  trackEvent(event: AnalyticsEvent): void {
+    this.eventQueue.push(event);
+    if (this.eventQueue.length >= EVENT_FLUSH_SIZE) {
+      this.flushEvents();
+    } else if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => this.flushEvents(), EVENT_FLUSH_INTERVAL_MS);
     }
   }
+
+  flushEvents(): void {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    if (this.eventQueue.length === 0) {
+      return;
+    }
+
+    const body = JSON.stringify(this.eventQueue);
+    this.eventQueue = [];
+
+    // sendBeacon survives page unload; it posts text/plain, which /events accepts
+    if (navigator.sendBeacon && navigator.sendBeacon(`${API_BASE}/events`, body)) {
+      return;
+    }
+
+    // Fire-and-forget fallback when beacons are unavailable or refused
+    fetch(`${API_BASE}/events`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'X-Session-ID': this.sessionId,
+      },
+      body,
+      keepalive: true,
+    }).catch((error) => {
+      console.error('Failed to send analytics events:', error);
+    });
+  }
 }
 
 export const landingAPI = new LandingAPI();
@@ -51,6 +51,8 @@ export interface ExitIntentCopyVM {
   can_show_now: boolean;
 }
 
+export type LandingSection = 'hero' | 'teaser' | 'testimonials' | 'disclaimers' | 'exit_intent';
+
 export interface LandingPageVM {
   locale: string;
   version: number;
@@ -60,6 +62,16 @@ export interface LandingPageVM {
   testimonials: TestimonialVM[];
   disclaimers_html?: string;
   exit_intent?: ExitIntentCopyVM;
+  section_etags: Partial<Record<LandingSection, string>>;
+}
+
+// Response of /page?sections=...: only the requested sections are present
+export type LandingSectionsVM = Pick<LandingPageVM, 'locale' | 'version' | 'etag' | 'section_etags'> &
+  Partial<Omit<LandingPageVM, 'locale' | 'version' | 'etag' | 'section_etags'>>;
+
+// Per-session state served next to a shared-cacheable page (CDN mode)
+export interface LandingSessionVM {
+  can_show_exit_intent: boolean;
 }
 
 export interface JoinEmailRequest {
@@ -84,3 +96,16 @@ export interface CTAClickRequest {
   locale?: string;
   session_id?: string;
 }
+
+// Events accepted by POST /landing/v1/events (JSON array or NDJSON)
+export type AnalyticsEvent =
+  | ({ type: 'cta_click' } & CTAClickRequest)
+  | {
+      type: 'impression';
+      locale?: string;
+      section?: string;
+      cms_version?: number;
+      etag?: string;
+      session_id?: string;
+    }
+  | { type: 'exit_intent_shown'; locale?: string; session_id?: string };